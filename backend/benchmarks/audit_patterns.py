@@ -0,0 +1,253 @@
+"""
+정규식 레지스트리(parser.PATTERNS) ReDoS 감사 + guarded 파싱 확인
+
+1. 등록된 모든 패턴에 대해, 패턴이 쓰는 문자(리터럴/문자 클래스/\\d·\\s 등)로 만든 적대적 입력
+   (한 문자 반복, 두 문자 교대, 알파벳 순환 — 끝에 매치를 깨는 문자를 붙여 역추적을 끝까지 유도)을
+   --sizes 길이별로 만들어 search/match 최악 시간을 잰다. 패턴 앞부분을 통과해야 드러나는 역추적도 잡도록
+   한 문자 반복 입력에는 실제 줄 머리(화자 헤더, 날짜, 키 등 REAL_LINE_PREFIXES)를 붙인 것도 잰다.
+   기본 길이는 guarded 파싱의 줄 길이 한도(PARSE_MAX_LINE_CHARS)까지. 길이별 시간의 log-log 기울기로
+   증가 차수를 추정해 (1 ≈ 선형, 2 ≈ 이차) 초선형 패턴을 표시한다. 실제 입력이 닿는 초선형 패턴
+   (UNREACHABLE_SUPERLINEAR에 이유와 함께 적힌 것 외)이 있거나 최악 시간이 --limit-ms를 넘으면 종료 코드 1.
+2. 큰 데스크탑 내보내기(--lines줄)를 parse_schedules_guarded로 파싱해, 넉넉한 예산에서는 스트리밍 파서와
+   결과가 같고 --budget초 예산에서는 예산 근처에서 멈춰 그때까지의 결과(partial)를 돌려주는지 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/audit_patterns.py [--sizes 500,1000,2000] [--top 15] [--limit-ms 1000] [--budget 0.2]
+"""
+import argparse
+import math
+import os
+import re
+import sys
+import time
+from itertools import combinations
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import MANAGER, generate_desktop_export  # noqa: E402
+
+# 범주(\d, \s, \w ...)의 대표 문자
+CATEGORY_CHARS = {
+    'CATEGORY_DIGIT': '1', 'CATEGORY_NOT_DIGIT': 'a',
+    'CATEGORY_SPACE': ' ', 'CATEGORY_NOT_SPACE': 'a',
+    'CATEGORY_WORD': 'a', 'CATEGORY_NOT_WORD': ' ',
+}
+# 어떤 패턴에서도 매치를 끝맺지 못하는 문자 (역추적을 끝까지 유도)
+BREAKER = '\x00'
+# 채팅에서 흔한 문자: 패턴에서 뽑은 문자와 함께 조합
+COMMON_CHARS = ' 가a1[:'
+# 증가 차수는 이보다 긴 측정값으로만 추정하고, 최대 길이에서 GROWTH_MIN_SECONDS 미만이면 판단하지 않는다 (잡음)
+GROWTH_FIT_MIN_SECONDS = 0.0001
+GROWTH_MIN_SECONDS = 0.001
+# 선형보다 뚜렷이 빠른 증가 (측정 잡음 여유 포함)
+SUPERLINEAR_GROWTH = 1.5
+# 이차보다 뚜렷이 빠른 증가(세제곱, 지수) = 줄 길이 한도로 충분히 묶이지 않는 패턴
+EXPLOSIVE_GROWTH = 2.75
+# 실제 채팅 줄의 머리: 이 뒤에 적대적 본문이 오면 패턴이 앞부분을 통과한 뒤 역추적한다
+REAL_LINE_PREFIXES = (
+    f"[{MANAGER}] [오후 3:00] ",           # 데스크탑 화자 헤더
+    "2025년 1월 5일 오후 3:00, ",           # 모바일 화자 헤더 (이름 앞까지)
+    "1월 5일 14시 ",                        # 간결한 형식
+    "예식일: ",                              # 구조화 형식 키
+    "※ 발주처 ",                             # ※ 형식
+    "2025.01.05 ",                           # 날짜 줄
+)
+# 초선형이지만 실제 입력이 닿지 않는 패턴 → 이유. 여기 없는 초선형 패턴은 감사 실패
+UNREACHABLE_SUPERLINEAR = {
+    'flex_venue_hall': 'parse_flexible_format 전용 (어떤 파싱 진입점에서도 호출되지 않음)',
+    'flex_venue_suffix': 'parse_flexible_format 전용 (어떤 파싱 진입점에서도 호출되지 않음)',
+    'flex_venue_brand': 'parse_flexible_format 전용 (어떤 파싱 진입점에서도 호출되지 않음)',
+    'flex_photographer': 'parse_flexible_format 전용 (어떤 파싱 진입점에서도 호출되지 않음)',
+    'parentheses': "remove_parenthesized()로만 실행되어 마지막 ')' 앞까지만 돌림 (선형)",
+}
+# 지수적 역추적은 수십 글자에서 이미 드러나므로 긴 입력 전에 먼저 잰다
+PROBE_SIZES = (8, 12, 16)
+LINE_LIMIT = schedule_parser.PARSE_MAX_LINE_CHARS
+
+
+def pattern_alphabet(pattern: re.Pattern) -> str:
+    """패턴이 매치할 수 있는 문자 대표들 (리터럴, 클래스 범위 양 끝, 범주 대표, '.'은 한글/공백)"""
+    chars = []
+
+    def walk(items):
+        for op, arg in items:
+            name = str(op)
+            if name == 'LITERAL':
+                chars.append(chr(arg))
+            elif name == 'ANY':
+                chars.extend('가 ')
+            elif name == 'IN':
+                for sub_op, sub_arg in arg:
+                    sub = str(sub_op)
+                    if sub == 'LITERAL':
+                        chars.append(chr(sub_arg))
+                    elif sub == 'RANGE':
+                        chars.extend((chr(sub_arg[0]), chr(sub_arg[1])))
+                    elif sub == 'CATEGORY':
+                        chars.append(CATEGORY_CHARS.get(str(sub_arg), 'a'))
+            elif name == 'CATEGORY':
+                chars.append(CATEGORY_CHARS.get(str(arg), 'a'))
+            elif name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'):
+                walk(arg[2])
+            elif name in ('SUBPATTERN', 'ATOMIC_GROUP'):
+                walk(arg[-1])
+            elif name == 'BRANCH':
+                for branch in arg[1]:
+                    walk(branch)
+            elif name in ('ASSERT', 'ASSERT_NOT'):
+                walk(arg[1])
+
+    walk(sre_parse.parse(pattern.pattern, pattern.flags))
+    return ''.join(dict.fromkeys(chars))
+
+
+def adversarial_inputs(alphabet: str, size: int):
+    """(설명, 문자열) — 모두 길이 size 근처이고 BREAKER로 끝난다"""
+    pool = ''.join(dict.fromkeys(alphabet + COMMON_CHARS))
+    for ch in pool:
+        yield f"{ch!r}*n", ch * size + BREAKER
+    for a, b in combinations(pool[:12], 2):
+        yield f"({a + b!r})*n", (a + b) * (size // 2) + BREAKER
+    if len(pool) > 2:
+        yield "alphabet cycle", (pool * (size // len(pool) + 1))[:size] + BREAKER
+    for prefix in REAL_LINE_PREFIXES:
+        for ch in pool:
+            yield f"{prefix.strip()!r} + {ch!r}*n", prefix + ch * size + BREAKER
+
+
+def time_call(fn, text, repeat):
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def growth_order(sizes, series):
+    """log(시간) ~ log(길이) 최소제곱 기울기 (1 ≈ 선형, 2 ≈ 이차); 판단할 수 없으면 None"""
+    points = [(math.log(size), math.log(seconds)) for size, seconds in zip(sizes, series)
+              if seconds >= GROWTH_FIT_MIN_SECONDS]
+    if len(points) < 2 or series[-1] < GROWTH_MIN_SECONDS:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points)
+            / sum((x - mean_x) ** 2 for x, _ in points))
+
+
+def measure(pattern: re.Pattern, alphabet: str, sizes, repeat):
+    """(방식, 입력 설명) → 길이별 시간"""
+    timings = {}
+    for size in sizes:
+        for label, text in adversarial_inputs(alphabet, size):
+            for method in ('search', 'match'):
+                timings.setdefault((method, label), []).append(time_call(getattr(pattern, method), text, repeat))
+    return timings
+
+
+def audit_pattern(pattern: re.Pattern, sizes, repeat):
+    """
+    최악 (시간, 방식, 입력 설명, 증가 차수, 그때 길이).
+    먼저 PROBE_SIZES의 짧은 입력으로 재서 이차보다 빠르게 늘면(지수적 역추적) 긴 입력은 재지 않는다.
+    """
+    alphabet = pattern_alphabet(pattern)
+    for measured_sizes in (PROBE_SIZES, sizes):
+        timings = measure(pattern, alphabet, measured_sizes, repeat)
+        growths = {key: growth_order(measured_sizes, series) for key, series in timings.items()}
+        fastest_growing = max(growths, key=lambda key: growths[key] or 0)
+        if (growths[fastest_growing] or 0) > EXPLOSIVE_GROWTH:
+            worst = fastest_growing
+            break
+        worst = max(timings, key=lambda key: timings[key][-1])
+    method, label = worst
+    return timings[worst][-1], method, label, growths[worst], measured_sizes[-1]
+
+
+def audit_registry(args):
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+    names = args.pattern or sorted(schedule_parser.PATTERNS)
+    start = time.perf_counter()
+    rows = []
+    for name in names:
+        worst, method, label, growth, size = audit_pattern(schedule_parser.PATTERNS[name], sizes, args.repeat)
+        rows.append((worst, name, method, label, growth, size))
+    rows.sort(reverse=True)
+
+    print(f"{len(rows)} patterns, inputs up to {sizes[-1]:,} chars ({time.perf_counter() - start:.1f}s)\n")
+    print(f"{'pattern':28s} {'worst':>10s}  {'chars':>6s}  {'growth':>6s}  method  input")
+    for worst, name, method, label, growth, size in rows[:args.top]:
+        flag = '  superlinear' if growth is not None and growth > SUPERLINEAR_GROWTH else ''
+        if flag and name in UNREACHABLE_SUPERLINEAR:
+            flag += f' (unreachable: {UNREACHABLE_SUPERLINEAR[name]})'
+        growth_text = f"{growth:6.2f}" if growth is not None else '     -'
+        print(f"{name:28s} {worst * 1000:8.2f}ms  {size:6d}  {growth_text}  {method:6s}  {label}{flag}")
+
+    superlinear = [row[1] for row in rows if row[4] is not None and row[4] > SUPERLINEAR_GROWTH]
+    reachable = [name for name in superlinear if name not in UNREACHABLE_SUPERLINEAR]
+    explosive = [row[1] for row in rows if row[4] is not None and row[4] > EXPLOSIVE_GROWTH]
+    over = [row[1] for row in rows if row[0] * 1000 > args.limit_ms]
+    print(f"\nsuperlinear: {len(superlinear)} ({', '.join(superlinear) or '-'})")
+    if reachable:
+        print(f"superlinear and reachable from parse entry points: {', '.join(reachable)}")
+    if explosive:
+        print(f"worse than quadratic (not bounded by the line limit): {', '.join(explosive)}")
+    if over:
+        print(f"over {args.limit_ms:.0f} ms at {sizes[-1]:,} chars: {', '.join(over)}")
+    ok = not reachable and not over
+    if ok:
+        print(f"all reachable patterns linear and under {args.limit_ms:.0f} ms at {sizes[-1]:,} chars")
+    return ok
+
+
+def check_guard(args):
+    """guarded 파싱: 넉넉한 예산이면 스트리밍 파서와 같고, 작은 예산이면 partial로 일찍 멈춘다"""
+    text = generate_desktop_export(args.lines, seed=1)
+    # 줄 길이 한도를 넘는 줄 하나 (매니저 블록 안)
+    text += f"\n[{MANAGER}] [오후 3:00] 확인 부탁드립니다\n" + '가 ' * LINE_LIMIT
+
+    start = time.perf_counter()
+    streamed = schedule_parser.collect_streamed_schedules(schedule_parser.parse_schedules_iter(text))
+    full_s = time.perf_counter() - start
+    full = schedule_parser.parse_schedules_guarded(text, budget_seconds=full_s * 10 + 10)
+    partial = schedule_parser.parse_schedules_guarded(text, budget_seconds=args.budget)
+
+    keys = lambda schedules: {f"{d['date']}-{d['time']}-{d['couple']}" for d in schedules}
+    assert not full.partial and keys(full.data) == keys(streamed), "guarded parse differs from streaming parse"
+    assert full.truncated_lines == 1, f"expected 1 truncated line, got {full.truncated_lines}"
+    print(f"\nguarded parse: {args.lines:,} lines, {len(full.data)} schedules in {full.seconds:.2f}s "
+          f"(streaming {full_s:.2f}s), {full.truncated_lines} line over {LINE_LIMIT} chars truncated")
+    if full.seconds <= args.budget:
+        print(f"budget {args.budget:.2f}s: whole input parsed within budget, use more --lines to see a partial result")
+        return True
+    assert partial.partial and keys(partial.data) <= keys(full.data), "partial result is not a subset of the full result"
+    print(f"budget {args.budget:.2f}s: stopped after {partial.seconds:.2f}s at line {partial.lines:,}/{full.lines:,}, "
+          f"{len(partial.data)} schedules (partial)")
+    return partial.seconds < args.budget * 2 + 0.1
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--sizes', default=f"{LINE_LIMIT // 4},{LINE_LIMIT // 2},{LINE_LIMIT}",
+                    help='적대적 입력 길이 (쉼표 구분)')
+    ap.add_argument('--repeat', type=int, default=2)
+    ap.add_argument('--top', type=int, default=15)
+    ap.add_argument('--limit-ms', type=float, default=1000.0, help='가장 큰 길이에서 허용하는 최악 시간')
+    ap.add_argument('--pattern', action='append', help='이 이름의 패턴만 감사 (여러 번 지정 가능)')
+    ap.add_argument('--lines', type=int, default=100000, help='guarded 파싱 확인용 내보내기 줄 수')
+    ap.add_argument('--budget', type=float, default=0.2, help='guarded 파싱 확인용 시간 예산(초)')
+    args = ap.parse_args()
+
+    ok = audit_registry(args)
+    ok = check_guard(args) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
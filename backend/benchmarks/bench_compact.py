@@ -0,0 +1,62 @@
+"""
+parse_manager_block_classic_only 간결한 형식(패턴 1-3) 패스 회귀 검사
+
+예전에는 코어 스케줄마다 블록 전체를 다시 훑어 간결한 형식 스케줄을 중복으로 추가했다
+(스케줄 N개 × 줄 L개 = O(N·L)). 블록 크기를 2배씩 키우며 다음을 확인한다.
+    - 결과 수 == 코어 스케줄 수 + 간결한 형식 줄 수 (중복 없음)
+    - 크기를 2배로 늘릴 때 시간이 대략 2배 (O(lines)); MAX_DOUBLING_RATIO배를 넘으면 실패 (이차면 약 4배)
+    - 줄당 시간이 가장 작은 블록의 MAX_PER_LINE_GROWTH배를 넘지 않음 (8배 크기에서 이차면 약 8배)
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_compact.py [--schedules 300]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_manager_block  # noqa: E402
+
+MAX_DOUBLING_RATIO = 2.8
+MAX_PER_LINE_GROWTH = 2.5
+
+
+def time_block(schedules, repeat=3):
+    compact_lines = schedules // 3
+    block = generate_manager_block(schedules, compact_lines)
+    best = float('inf')
+    for _ in range(repeat):
+        schedule_parser.classify_line.cache_clear()
+        start = time.perf_counter()
+        result = schedule_parser.parse_manager_block_classic_only(block)
+        best = min(best, time.perf_counter() - start)
+
+    expected = schedules + compact_lines
+    assert len(result) == expected, f"expected {expected} schedules, got {len(result)} (duplicates?)"
+    return len(block.splitlines()), best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--schedules', type=int, default=300)
+    args = ap.parse_args()
+
+    previous = base_per_line = None
+    for factor in (1, 2, 4, 8):
+        lines, seconds = time_block(args.schedules * factor)
+        ratio = seconds / previous if previous else 1.0
+        per_line = seconds / lines
+        base_per_line = base_per_line or per_line
+        print(f"{args.schedules * factor:6,} schedules / {lines:7,} lines: {seconds * 1000:8.1f} ms  (x{ratio:.2f}, "
+              f"{per_line * 1e6:.2f} us/line)")
+        assert ratio < MAX_DOUBLING_RATIO, "compact pass is no longer linear in block size"
+        assert per_line < base_per_line * MAX_PER_LINE_GROWTH, "per-line cost grows with block size"
+        previous = seconds
+    print("ok: linear, no duplicates")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+LLM 변환 캐시 벤치마크 (네트워크 없음)
+
+서로 다른 메시지 --messages개를 매니저끼리 --forwards번씩 전달한 상황(공백/빈 줄만 다름)을 만들고,
+가짜 LLM 백엔드(services.fake_llm, 호출당 --latency초)로 parse_schedules_llm_async를 순서대로 실행한다.
+캐시 비활성 / 임시 SQLite 캐시 두 경우의 LLM 호출 수, 적중률, 전체 시간과 결과 동일성을 비교한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_llm_cache.py [--messages 20] [--forwards 3] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import _schedule_lines  # noqa: E402
+from services import llm_parser  # noqa: E402
+from services.fake_llm import FakeLLMBackend  # noqa: E402
+from services.llm_cache import LLMResponseCache  # noqa: E402
+
+
+def forwarded_messages(messages, forwards, seed=42):
+    """각 메시지를 forwards번 복제하며 줄 앞뒤 공백/빈 줄을 무작위로 섞고 순서를 섞는다"""
+    rng = random.Random(seed)
+    out = []
+    for message in messages:
+        for _ in range(forwards):
+            lines = [(' ' * rng.randint(0, 2)) + line + (' ' * rng.randint(0, 2)) for line in message.split('\n')]
+            if rng.random() < 0.5:
+                lines.insert(rng.randint(0, len(lines)), '')
+            out.append('\n'.join(lines))
+    rng.shuffle(out)
+    return out
+
+
+async def run(workload):
+    return [await schedule_parser.parse_schedules_llm_async(message) for message in workload]
+
+
+def measure(workload, cache, latency):
+    backend = FakeLLMBackend(latency)
+    llm_parser.set_llm_backend(backend)
+    llm_parser.llm_cache = cache
+    start = time.perf_counter()
+    results = asyncio.run(run(workload))
+    return results, backend.calls, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--messages', type=int, default=20)
+    ap.add_argument('--forwards', type=int, default=3)
+    ap.add_argument('--latency', type=float, default=0.2)
+    args = ap.parse_args()
+
+    rng = random.Random(7)
+    messages = ["\n".join(_schedule_lines(rng)) for _ in range(args.messages)]
+    workload = forwarded_messages(messages, args.forwards)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uncached, uncached_calls, uncached_s = measure(workload, LLMResponseCache(max_bytes=0), args.latency)
+        cache = LLMResponseCache(os.path.join(tmp, 'llm_cache.db'))
+        cached, cached_calls, cached_s = measure(workload, cache, args.latency)
+        stats = cache.stats()
+        cache.close()
+
+    assert uncached == cached, "cached LLM results differ from uncached results"
+    print(f"workload: {len(workload)} messages ({args.messages} distinct x {args.forwards} forwards), "
+          f"LLM latency {args.latency:.2f}s")
+    print(f"no cache     : {uncached_calls:4d} LLM calls  {uncached_s:6.2f}s")
+    print(f"sqlite cache : {cached_calls:4d} LLM calls  {cached_s:6.2f}s  "
+          f"(hit rate {stats['hit_rate']:.0%}, {stats['entries']} entries, {stats['bytes']:,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+LLM 조각 분할 + 동시 변환 벤치마크
+
+OpenAI 호출 대신 고정 지연(--latency) 후 결정적으로 답하는 가짜 LLM 백엔드(services.fake_llm)를 끼워
+스케줄 N개짜리 메시지를 parse_schedules_llm_async로 파싱한다.
+조각이 입력/스케줄 한도를 지키는지, 결과가 Classic 파서와 같은지 확인하고,
+전체 지연이 호출 1회 지연에 얼마나 가까운지 출력한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_llm_chunks.py [--schedules 20] [--latency 0.5]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import _schedule_lines  # noqa: E402
+from services import llm_parser  # noqa: E402
+from services.fake_llm import FakeLLMBackend  # noqa: E402
+from services.llm_cache import LLMResponseCache  # noqa: E402
+
+
+def schedule_keys(schedules):
+    return sorted(schedule_parser.schedule_dict_key(d) for d in schedules)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--schedules', type=int, default=20)
+    ap.add_argument('--latency', type=float, default=0.5)
+    args = ap.parse_args()
+
+    rng = random.Random(42)
+    text = "\n".join("\n".join(_schedule_lines(rng)) for _ in range(args.schedules))
+    backend = FakeLLMBackend(args.latency)
+    llm_parser.set_llm_backend(backend)
+    llm_parser.llm_cache = LLMResponseCache(max_bytes=0)  # 매 실행이 실제 호출이 되도록 캐시 끔
+
+    chunks = schedule_parser.split_text_for_llm(text)
+    for chunk in chunks:
+        assert len(chunk) <= schedule_parser.LLM_CHUNK_MAX_CHARS, len(chunk)
+        assert len(schedule_parser.LLM_DATE_HINT_RE.findall(chunk)) <= schedule_parser.LLM_CHUNK_MAX_SCHEDULES
+
+    start = time.perf_counter()
+    result = asyncio.run(schedule_parser.parse_schedules_llm_async(text))
+    elapsed = time.perf_counter() - start
+
+    expected = schedule_parser.parse_schedules_classic_only(text)
+    assert schedule_keys(result) == schedule_keys(expected), "chunked LLM result differs from classic result"
+
+    print(f"input: {len(text):,} chars, {args.schedules} schedules -> {len(chunks)} chunks "
+          f"(max {max(map(len, chunks)):,} chars, concurrency {schedule_parser.LLM_MAX_CONCURRENT_CHUNKS})")
+    print(f"llm calls        : {backend.calls}")
+    print(f"schedules found  : {len(result)} (classic: {len(expected)})")
+    print(f"elapsed          : {elapsed:.2f}s  (single call {args.latency:.2f}s, "
+          f"sequential would be {backend.calls * args.latency:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
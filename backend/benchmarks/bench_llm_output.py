@@ -0,0 +1,80 @@
+"""
+LLM 출력 처리 비용 벤치마크: JSON 직접 매핑 vs 키-값 텍스트 재파싱
+
+가짜 LLM(services.fake_llm)이 만든 같은 스케줄의 두 출력 형식을 미리 준비해 두고,
+LLM 응답 이후 단계만 비교한다.
+- JSON: validate_llm_schedules → schedule_from_llm_fields
+- 텍스트: parse_llm_text_output (형식 감지 + 구조화 형식 파서)
+두 결과의 스케줄 키가 같은지도 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_llm_output.py [--chunks 2000] [--repeat 3]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import _schedule_lines  # noqa: E402
+from services.fake_llm import fake_llm_json_output, fake_llm_output  # noqa: E402
+from services.llm_parser import validate_llm_schedules  # noqa: E402
+
+
+def map_json(outputs):
+    return [
+        [schedule_parser.schedule_from_llm_fields(item).to_dict() for item in validate_llm_schedules(json.loads(output))]
+        for output in outputs
+    ]
+
+
+def reparse_text(outputs):
+    return [schedule_parser.parse_llm_text_output(output) for output in outputs]
+
+
+def keys(results):
+    return [sorted(schedule_parser.schedule_dict_key(d) for d in chunk) for chunk in results]
+
+
+def best_of(repeat, fn, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        schedule_parser.classify_line.cache_clear()
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--chunks', type=int, default=2000)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+
+    rng = random.Random(42)
+    messages = [
+        "\n".join("\n".join(_schedule_lines(rng)) for _ in range(rng.randint(1, schedule_parser.LLM_CHUNK_MAX_SCHEDULES)))
+        for _ in range(args.chunks)
+    ]
+    json_outputs = [fake_llm_json_output(message) for message in messages]
+    text_outputs = [fake_llm_output(message) for message in messages]
+
+    from_json, json_s = best_of(args.repeat, map_json, json_outputs)
+    from_text, text_s = best_of(args.repeat, reparse_text, text_outputs)
+    assert keys(from_json) == keys(from_text), "JSON mapping and text re-parse found different schedules"
+
+    schedules = sum(map(len, from_json))
+    per_chunk = lambda seconds: seconds / args.chunks * 1e6
+    print(f"outputs: {args.chunks:,} chunks, {schedules:,} schedules")
+    print(f"text re-parse : {per_chunk(text_s):8.1f} µs/chunk  ({text_s:.3f}s)")
+    print(f"JSON mapping  : {per_chunk(json_s):8.1f} µs/chunk  ({json_s:.3f}s)")
+    print(f"speedup       : {text_s / json_s:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
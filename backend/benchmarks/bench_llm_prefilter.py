@@ -0,0 +1,54 @@
+"""
+LLM 전처리(prefilter_for_llm) 토큰 절감 벤치마크
+
+합성 데스크탑/모바일 내보내기를 prefilter_for_llm에 통과시켜
+LLM에 보낼 글자 수, 추정 프롬프트 토큰 수(estimate_tokens), 조각(LLM 호출) 수를 전후로 비교한다.
+걸러낸 텍스트에서도 Classic 파서가 같은 스케줄을 찾는지(정보 손실 없음) 함께 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_llm_prefilter.py [--lines 3000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export, generate_mobile_export  # noqa: E402
+
+
+def schedule_keys(schedules):
+    return sorted(schedule_parser.schedule_dict_key(d) for d in schedules)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=3000)
+    args = ap.parse_args()
+
+    for name, generate in (('desktop', generate_desktop_export), ('mobile', generate_mobile_export)):
+        text = generate(args.lines)
+        start = time.perf_counter()
+        filtered = schedule_parser.prefilter_for_llm(text)
+        elapsed = time.perf_counter() - start
+
+        # 블록('---' 구분)마다 Classic 파싱한 결과가 원문 파싱 결과와 같아야 한다
+        sections = filtered.text.split('\n---\n')
+        kept = schedule_parser.merge_schedule_dicts(schedule_parser.parse_schedules_classic_only(s) for s in sections)
+        assert schedule_keys(kept) == schedule_keys(schedule_parser.parse_schedules_classic_only(text)), \
+            f"{name}: prefiltered text lost schedules"
+
+        chunks_before = len(schedule_parser.split_text_for_llm(text))
+        chunks_after = len(schedule_parser.split_text_for_llm(filtered.text))
+        saved = 1 - filtered.kept_tokens / filtered.original_tokens
+        print(f"{name:8s}: {filtered.original_chars:,} → {filtered.kept_chars:,} chars, "
+              f"~{filtered.original_tokens:,} → ~{filtered.kept_tokens:,} tokens ({saved:.0%} saved), "
+              f"{chunks_before} → {chunks_after} LLM calls, "
+              f"dropped {filtered.dropped_blocks:,} blocks / {filtered.dropped_lines:,} lines "
+              f"in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+LLM 호출 복원력(services.llm_resilience) 벤치마크 (네트워크 없음)
+
+1. 꼬리 지연: 가짜 LLM 백엔드가 --slow-rate 비율의 요청을 --slow-latency초 늦게 답할 때
+   parse_with_llm_json --calls번의 p50/p95/p99 지연을 헤지 없음 / p95 헤지 두 경우로 비교한다.
+2. 공급자 장애: 모든 요청이 실패하는 백엔드로 하이브리드 파싱을 --parses번 반복해
+   circuit breaker가 열린 뒤 LLM을 기다리지 않고 Classic 결과(degraded)를 바로 돌려주는지 확인한다.
+3. 취소된 시험 호출: half-open 시험 호출을 취소해도 breaker가 다음 호출을 다시 시험하는지 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_llm_resilience.py [--calls 400] [--latency 0.02] [--slow-rate 0.03] [--slow-latency 0.5]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import MANAGER, _schedule_lines, _stamp  # noqa: E402
+from services import llm_parser, llm_resilience  # noqa: E402
+from services.fake_llm import FakeLLMBackend  # noqa: E402
+from services.llm_cache import LLMResponseCache  # noqa: E402
+from services.llm_resilience import CircuitBreaker, ResilientCaller  # noqa: E402
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def timed_calls(messages, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(message):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await llm_parser.parse_with_llm_json(message)
+            return time.perf_counter() - start, result
+
+    return await asyncio.gather(*(one(message) for message in messages))
+
+
+def install_caller(caller):
+    """llm_parser(호출)와 parser(breaker 확인)가 함께 쓰는 전역 ResilientCaller 교체"""
+    llm_parser.llm_caller = caller
+    llm_resilience.llm_caller = caller
+
+
+def measure_tail(messages, args, hedge_budget):
+    backend = FakeLLMBackend(args.latency, slow_rate=args.slow_rate, slow_latency=args.slow_latency, seed=1)
+    caller = ResilientCaller(deadline_seconds=args.slow_latency * 4, hedge_budget=hedge_budget)
+    llm_parser.set_llm_backend(backend)
+    install_caller(caller)
+    results = asyncio.run(timed_calls(messages, args.concurrency))
+    latencies = [seconds for seconds, _ in results]
+    return [result for _, result in results], latencies, backend.calls, caller
+
+
+def broken_export(blocks, seed=3):
+    """시간 줄이 빠진 매니저 블록(하이브리드가 LLM으로 보낼 블록)이 섞인 데스크탑 내보내기"""
+    rng = random.Random(seed)
+    out = []
+    for index in range(blocks):
+        sched = _schedule_lines(rng)
+        if index % 3 == 0:
+            del sched[2]
+        out.append(f"[{MANAGER}] [{_stamp(rng)}] {sched[0]}")
+        out.extend(sched[1:])
+    return "\n".join(out)
+
+
+async def hybrid_runs(text, parses):
+    runs = []
+    for _ in range(parses):
+        with schedule_parser.profile_parse() as profile:
+            start = time.perf_counter()
+            result = await schedule_parser.parse_schedules_hybrid_llm_async(text)
+            elapsed = time.perf_counter() - start
+        runs.append((elapsed, len(result), bool(profile.counters.get('llm_degraded'))))
+    return runs
+
+
+async def cancelled_trial(reset_seconds=0.05):
+    """half-open 시험 호출이 취소(SSE 끊김 등)된 뒤 breaker 상태와 다음 호출 결과"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=reset_seconds)
+    caller = ResilientCaller(deadline_seconds=5, hedge_budget=0.0, breaker=breaker)
+
+    async def fail():
+        raise RuntimeError("provider down")
+
+    async def ok():
+        return "ok"
+
+    try:
+        await caller.call(fail)
+    except RuntimeError:
+        pass
+    await asyncio.sleep(reset_seconds * 1.5)
+    trial = asyncio.ensure_future(caller.call(lambda: asyncio.sleep(10)))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    try:
+        await trial
+    except asyncio.CancelledError:
+        pass
+    still_open = breaker.is_open()
+    return still_open, await caller.call(ok), breaker.state
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--calls', type=int, default=400)
+    ap.add_argument('--concurrency', type=int, default=8)
+    ap.add_argument('--latency', type=float, default=0.02)
+    ap.add_argument('--slow-rate', type=float, default=0.03)
+    ap.add_argument('--slow-latency', type=float, default=0.5)
+    ap.add_argument('--parses', type=int, default=8)
+    args = ap.parse_args()
+
+    llm_parser.llm_cache = LLMResponseCache(max_bytes=0)
+    rng = random.Random(7)
+    messages = ["\n".join(_schedule_lines(rng)) for _ in range(args.calls)]
+
+    print(f"tail latency: {args.calls} calls, {args.latency * 1000:.0f} ms typical, "
+          f"{args.slow_rate:.0%} at {args.slow_latency * 1000:.0f} ms")
+    baseline = None
+    for label, budget in (('no hedging ', 0.0), ('p95 hedging', 0.1)):
+        results, latencies, calls, caller = measure_tail(messages, args, budget)
+        if baseline is None:
+            baseline = results
+        assert results == baseline, "hedged results differ from unhedged results"
+        stats = caller.stats()
+        print(f"{label}: p50 {percentile(latencies, 0.5) * 1000:6.1f} ms  "
+              f"p95 {percentile(latencies, 0.95) * 1000:6.1f} ms  p99 {percentile(latencies, 0.99) * 1000:6.1f} ms  "
+              f"({calls} backend calls, {stats['hedges']} hedges, {stats['hedge_wins']} won)")
+
+    # 공급자 장애: 모든 요청 실패 → breaker가 열리면 하이브리드는 Classic 결과를 바로 돌려준다
+    text = broken_export(30)
+    classic = schedule_parser.parse_schedules_classic_only(text)
+    backend = FakeLLMBackend(args.slow_latency, error_rate=1.0, seed=1)
+    breaker = CircuitBreaker(failure_threshold=5, reset_seconds=60)
+    llm_parser.set_llm_backend(backend)
+    install_caller(ResilientCaller(deadline_seconds=args.slow_latency * 4, breaker=breaker))
+
+    print(f"\nprovider outage: hybrid parse x{args.parses}, every LLM call fails after {args.slow_latency * 1000:.0f} ms")
+    for index, (elapsed, schedules, degraded) in enumerate(asyncio.run(hybrid_runs(text, args.parses)), 1):
+        assert schedules == len(classic), "hybrid lost Classic schedules during the outage"
+        print(f"parse {index}: {elapsed * 1000:7.1f} ms  {schedules} schedules  degraded={degraded}  breaker={breaker.state}")
+    print(f"backend calls: {backend.calls}, rejected by breaker: {breaker.stats()['rejected']}")
+
+    still_open, result, state = asyncio.run(cancelled_trial())
+    assert not still_open and result == "ok", "cancelled half-open trial left the breaker open"
+    print(f"\ncancelled half-open trial: breaker accepts the next trial (result {result!r}, now {state})")
+
+
+if __name__ == '__main__':
+    main()
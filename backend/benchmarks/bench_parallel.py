@@ -0,0 +1,47 @@
+"""
+매니저 블록 멀티프로세스 파싱 벤치마크
+
+같은 합성 내보내기를 parallel=False / parallel=True로 파싱하여 시간과 결과 동일성을 비교한다.
+첫 병렬 실행에는 프로세스 풀 생성 비용이 포함되므로 두 번째 실행 값을 함께 출력한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_parallel.py [--lines 300000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=300000)
+    args = ap.parse_args()
+
+    text = generate_desktop_export(args.lines)
+    serial, serial_s = timed(schedule_parser.parse_schedules, text, parallel=False)
+    schedule_parser.classify_line.cache_clear()
+    parallel_cold, cold_s = timed(schedule_parser.parse_schedules, text, parallel=True)
+    parallel_warm, warm_s = timed(schedule_parser.parse_schedules, text, parallel=True)
+    schedule_parser.shutdown_process_pool()
+
+    assert serial == parallel_cold == parallel_warm, "parallel result differs from serial result"
+    print(f"input: {args.lines:,} lines, {len(serial):,} schedules, workers={schedule_parser.PARALLEL_PARSE_WORKERS}")
+    print(f"serial           : {serial_s:.2f}s")
+    print(f"parallel (cold)  : {cold_s:.2f}s")
+    print(f"parallel (warm)  : {warm_s:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+일괄 파싱(parse_batch_async) 벤치마크 (네트워크 없음)
+
+1. Classic: 큰 내보내기 --large개를 항목별로 차례로 파싱 vs parse_batch_async (프로세스 풀)
+2. LLM: 전달받은 메시지 --messages개를 가짜 LLM(호출당 --latency초)으로 하나씩 파싱 vs parse_batch_async
+   (BATCH_MAX_CONCURRENT_LLM_ITEMS개씩 동시)
+두 경우 모두 항목별 결과와 항목 사이 중복 제거 결과가 하나씩 파싱한 것과 같은지 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_parse_batch.py [--large 4] [--lines 40000] [--messages 30] [--latency 0.2]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import _schedule_lines, generate_desktop_export  # noqa: E402
+from services import llm_parser  # noqa: E402
+from services.fake_llm import FakeLLMBackend  # noqa: E402
+from services.llm_cache import LLMResponseCache  # noqa: E402
+
+
+def keys(schedules):
+    return sorted(schedule_parser.schedule_dict_key(d) for d in schedules)
+
+
+async def one_by_one(items):
+    results = []
+    for text, engine in items:
+        if engine == 'classic':
+            results.append(schedule_parser.parse_schedules_classic_only(text, parallel=False))
+        else:
+            results.append(await schedule_parser.parse_schedules_llm_async(text))
+    return results
+
+
+def compare(label, items):
+    start = time.perf_counter()
+    serial = asyncio.run(one_by_one(items))
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = asyncio.run(schedule_parser.parse_batch_async(items))
+    batch_s = time.perf_counter() - start
+
+    merged, counted = schedule_parser.merge_batch_results(batch)
+    assert [result.data for result in batch] == serial, f"{label}: batch item results differ"
+    assert keys(merged) == keys(schedule_parser.merge_schedule_dicts(serial)), f"{label}: batch dedup differs"
+    duplicates = sum(result.duplicates for result in counted)
+    print(f"{label:8s}: {len(items)} items, {len(merged)} schedules ({duplicates} cross-item duplicates)  "
+          f"one-by-one {serial_s:6.2f}s  batch {batch_s:6.2f}s  ({serial_s / batch_s:.1f}x)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--large', type=int, default=4)
+    ap.add_argument('--lines', type=int, default=40000)
+    ap.add_argument('--messages', type=int, default=30)
+    ap.add_argument('--latency', type=float, default=0.2)
+    args = ap.parse_args()
+
+    large = [(generate_desktop_export(args.lines, seed=seed), 'classic') for seed in range(args.large)]
+    compare('classic', large)
+
+    # 같은 메시지를 여러 매니저가 전달한 상황: 일부 메시지가 겹친다
+    rng = random.Random(7)
+    distinct = ["\n".join(_schedule_lines(rng)) for _ in range(args.messages * 2 // 3)]
+    messages = distinct + [rng.choice(distinct) for _ in range(args.messages - len(distinct))]
+    llm_parser.llm_cache = LLMResponseCache(max_bytes=0)
+    llm_parser.set_llm_backend(FakeLLMBackend(args.latency))
+    compare('llm', [(message, 'llm') for message in messages])
+    schedule_parser.shutdown_process_pool()
+
+
+if __name__ == '__main__':
+    main()
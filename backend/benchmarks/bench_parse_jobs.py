@@ -0,0 +1,124 @@
+"""
+파싱 작업 큐(services.parse_jobs) 벤치마크: 대용량 가져오기 중 이벤트 루프 응답성
+
+같은 이벤트 루프에서 --interval초마다 깨어나는 가벼운 요청(핑)을 돌리면서
+--imports개의 대용량 데스크탑 내보내기(--lines줄)를 파싱한다.
+- inline: 예전 업로드 핸들러처럼 async 함수 안에서 바로 파싱 (루프를 막음)
+- job queue: parse_jobs에 제출하고 상태를 폴링
+핑 지연(예정 시각보다 늦게 깨어난 시간)의 p50/p99/최대와 결과 동일성, 취소 동작을 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_parse_jobs.py [--lines 100000] [--imports 3] [--workers 2]
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+from services.parse_cache import parse_cache  # noqa: E402
+from services.parse_jobs import ParseJobQueue  # noqa: E402
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def ping(interval, lags, stop):
+    """interval초마다 깨어나 예정보다 늦은 시간을 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - expected)
+
+
+async def with_pings(interval, work):
+    lags, stop = [], asyncio.Event()
+    pinger = asyncio.create_task(ping(interval, lags, stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    result = await work()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await pinger
+    return result, elapsed, lags
+
+
+async def inline_imports(payloads):
+    results = []
+    for payload in payloads:
+        results.append(schedule_parser.parse_schedules_classic_only(payload.decode('utf-8')))
+        await asyncio.sleep(0)
+    return results
+
+
+async def queued_imports(queue, payloads):
+    jobs = [await queue.submit(io.BytesIO(payload), "classic") for payload in payloads]
+    while not all(job.finished for job in jobs):
+        await asyncio.sleep(0.05)
+    return [job.result for job in jobs]
+
+
+async def cancel_check(queue, payload):
+    job = await queue.submit(io.BytesIO(payload), "classic")
+    while job.status == "queued":
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    queue.cancel(job.id)
+    while not job.finished:
+        await asyncio.sleep(0.01)
+    return job
+
+
+def report(label, elapsed, lags):
+    print(f"{label:10s}: {elapsed:6.2f}s total, ping lag p50 {percentile(lags, 0.5) * 1000:7.1f} ms  "
+          f"p99 {percentile(lags, 0.99) * 1000:7.1f} ms  max {max(lags) * 1000:7.1f} ms  ({len(lags)} pings)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=100000)
+    ap.add_argument('--imports', type=int, default=3)
+    ap.add_argument('--workers', type=int, default=2)
+    ap.add_argument('--interval', type=float, default=0.01)
+    args = ap.parse_args()
+
+    payloads = [generate_desktop_export(args.lines, seed=seed).encode('utf-8') for seed in range(args.imports)]
+    print(f"{args.imports} imports x {args.lines:,} lines ({sum(map(len, payloads)) / 1e6:.1f} MB), "
+          f"{args.workers} job workers")
+
+    inline, inline_s, inline_lags = asyncio.run(with_pings(args.interval, lambda: inline_imports(payloads)))
+    report('inline', inline_s, inline_lags)
+
+    async def run_queue():
+        with tempfile.TemporaryDirectory() as spool:
+            queue = ParseJobQueue(workers=args.workers, spool_dir=spool)
+            try:
+                parse_cache.clear()
+                result = await with_pings(args.interval, lambda: queued_imports(queue, payloads))
+                parse_cache.clear()
+                cancelled = await cancel_check(queue, payloads[0])
+                return result, cancelled, queue.stats(), os.listdir(spool)
+            finally:
+                await queue.shutdown()
+
+    (queued, queued_s, queued_lags), cancelled, stats, leftovers = asyncio.run(run_queue())
+    report('job queue', queued_s, queued_lags)
+
+    keys = lambda results: [sorted(schedule_parser.schedule_dict_key(d) for d in r) for r in results]
+    assert keys(inline) == keys(queued), "job queue results differ from inline parsing"
+    assert cancelled.status == "cancelled", f"cancel left job {cancelled.status}"
+    assert not leftovers, f"spool files left behind: {leftovers}"
+    print(f"cancel    : job stopped after {cancelled.progress.get('lines', 0):,} lines; "
+          f"queue stats {stats['completed_total']} done / {stats['cancelled_total']} cancelled")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+정규식 레지스트리 마이크로 벤치마크
+
+5만 줄짜리 합성 카카오톡 내보내기에서 라인 단위 헬퍼(parse_brand_album, parse_contact,
+is_valid_time, extract_date, find_manager_speaker 라인 점수)의 라인당 비용을
+레지스트리 도입 이전 구현(매 호출마다 패턴 문자열 조회/조합)과 비교한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_patterns.py [--lines 50000] [--repeat 3]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+
+
+# --- 레지스트리 도입 이전 구현 (비교 기준) ---
+
+def legacy_extract_date(line):
+    match = re.search(r'(\d{4}\.\d{2}\.\d{2})', line.strip())
+    return match.group(1) if match else ""
+
+
+def legacy_is_valid_time(line):
+    return bool(re.match(r'^\d{2}:\d{2}$', line.strip()))
+
+
+def legacy_parse_contact(line):
+    m = re.search(r'(010[- .]?\d{4}[- .]?\d{4})', line)
+    if not m:
+        return ""
+    digits = re.sub(r'[^0-9]', '', m.group(1))
+    if len(digits) == 11 and digits.startswith('010'):
+        return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
+    return m.group(1)
+
+
+def legacy_parse_brand_album(line):
+    brand_pattern = '|'.join([f'({pattern})' for pattern in schedule_parser.BRAND_PATTERNS])
+    brand_match = re.search(brand_pattern, line)
+    album_pattern = '|'.join([f'({pattern})' for pattern in schedule_parser.ALBUM_PATTERNS])
+    album_match = re.search(album_pattern, line, re.IGNORECASE)
+    brand = brand_match.group(0).replace('[', '').replace(']', '').strip() if brand_match else ""
+    if brand:
+        brand = re.sub(r'\s+', ' ', brand)
+    album = album_match.group(0).upper() if album_match else ""
+    if album:
+        album = re.sub(r'\s+', ' ', album)
+    if album and '기본' in album:
+        album = re.sub(r'기본\s*(\d{2,3}[Pp])', r'기본\1', album, flags=re.IGNORECASE)
+    if not album and "기본" in line:
+        album = schedule_parser.DEFAULT_ALBUM
+    if brand and not album:
+        remaining_text = line.replace(brand_match.group(0), '').strip()
+        if not remaining_text or re.match(r'^[\[\]\s]*$', remaining_text):
+            album = schedule_parser.DEFAULT_ALBUM
+    return brand, album
+
+
+def legacy_line_score(line):
+    line = line.strip()
+    if re.match(r'^\d{4}\.\d{2}\.\d{2}$', line):
+        return 3
+    elif re.match(r'^\d{2}:\d{2}$', line):
+        return 2
+    elif any(re.search(pattern, line) for pattern in schedule_parser.BRAND_PATTERNS):
+        return 2
+    elif any(keyword in line for keyword in ['홀', '층', '컨벤션', '웨딩', '더']):
+        return 1
+    return 0
+
+
+def registry_line_score(line):
+    line = line.strip()
+    if schedule_parser.DATE_LINE_RE.match(line):
+        return 3
+    elif schedule_parser.TIME_LINE_RE.match(line):
+        return 2
+    elif schedule_parser.BRAND_RE.search(line):
+        return 2
+    elif any(keyword in line for keyword in ['홀', '층', '컨벤션', '웨딩', '더']):
+        return 1
+    return 0
+
+
+LEGACY = [legacy_extract_date, legacy_is_valid_time, legacy_parse_contact, legacy_parse_brand_album, legacy_line_score]
+REGISTRY = [
+    schedule_parser.extract_date, schedule_parser.is_valid_time, schedule_parser.parse_contact,
+    schedule_parser.parse_brand_album, registry_line_score,
+]
+
+
+def run_helpers(helpers, lines):
+    for line in lines:
+        for helper in helpers:
+            helper(line)
+
+
+def cold_parse(text):
+    """분류 캐시를 비운 상태에서 전체 파싱 (반복 실행 간 캐시 효과 제거)"""
+    schedule_parser.classify_line.cache_clear()
+    return schedule_parser.parse_schedules(text)
+
+
+def best_of(repeat, fn, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=50000)
+    ap.add_argument('--repeat', type=int, default=3)
+    args = ap.parse_args()
+
+    text = generate_desktop_export(args.lines)
+    lines = text.splitlines()
+
+    # 두 구현의 결과가 같은지 먼저 확인
+    for legacy, current in zip(LEGACY, REGISTRY):
+        for line in lines[:2000]:
+            assert legacy(line) == current(line), (legacy.__name__, line)
+
+    legacy_s = best_of(args.repeat, run_helpers, LEGACY, lines)
+    registry_s = best_of(args.repeat, run_helpers, REGISTRY, lines)
+    parse_s = best_of(args.repeat, cold_parse, text)
+    cache = schedule_parser.classify_line.cache_info()
+
+    per_line = lambda seconds: seconds / len(lines) * 1e6
+    print(f"lines: {len(lines):,}")
+    print(f"line helpers (legacy)   : {per_line(legacy_s):7.2f} µs/line  ({legacy_s:.3f}s)")
+    print(f"line helpers (registry) : {per_line(registry_s):7.2f} µs/line  ({registry_s:.3f}s)")
+    print(f"speedup                 : {legacy_s / registry_s:7.2f}x")
+    print(f"parse_schedules (cold)  : {per_line(parse_s):7.2f} µs/line  ({parse_s:.3f}s)")
+    print(f"classify_line cache     : {cache.hits:,} hits / {cache.misses:,} misses")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+단가 계산 벤치마크
+
+합성 스케줄 10만 개의 단가를 표 도입 이전 calculate_price(매 호출 strptime + 브랜드 정규화 +
+앨범 정규식 + if/elif 분기)와 현재 calculate_price / calculate_prices(일괄)로 계산해 비교한다.
+잘못된 날짜, 알 수 없는 브랜드, 41~49P 앨범도 섞어 세 구현의 결과가 같은지 확인한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_pricing.py [--schedules 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+
+BRANDS = ['K [ 세븐스 ]', 'K세븐스', 'B 세븐스', 'A 세븐스프리미엄', '더그라피', '세컨플로우', '스냅스', '']
+ALBUMS = ['30P', '40P', '50P', '기본30P', '45p', '20P', '60P', 'P', '']
+
+
+# --- 표 도입 이전 구현 (비교 기준) ---
+
+def legacy_calculate_price(brand, album, date):
+    try:
+        schedule_date = datetime.strptime(date, '%Y.%m.%d')
+        is_after_sep_2025 = schedule_date >= datetime(2025, 9, 1)
+        brand_lower = brand.lower().replace(' ', '').replace('[', '').replace(']', '')
+        album_match = schedule_parser.ALBUM_PAGES_RE.search(album)
+        album_pages = int(album_match.group(1)) if album_match else 30
+        if 'k세븐스' in brand_lower:
+            return 140000 if is_after_sep_2025 else 150000
+        elif 'b세븐스' in brand_lower:
+            return (140000 if is_after_sep_2025 else 150000) + 20000
+        elif 'a세븐스프리미엄' in brand_lower:
+            return 190000
+        elif '더그라피' in brand_lower or '세컨플로우' in brand_lower:
+            if album_pages <= 30:
+                return 170000
+            elif album_pages <= 40:
+                return 190000 if is_after_sep_2025 else 200000
+            elif album_pages >= 50:
+                return 240000 if is_after_sep_2025 else 250000
+            return 170000
+        return 0
+    except (ValueError, AttributeError):
+        return 0
+
+
+def make_schedules(count, seed=42):
+    rng = random.Random(seed)
+    schedules = []
+    for _ in range(count):
+        if rng.random() < 0.02:
+            date = rng.choice(['2025.02.30', '2025-09-01', '2025.13.01', ''])
+        else:
+            date = f"{rng.choice([2024, 2025, 2026])}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}"
+        schedules.append({'brand': rng.choice(BRANDS), 'album': rng.choice(ALBUMS), 'date': date})
+    return schedules
+
+
+def legacy_prices(schedules):
+    return [legacy_calculate_price(s['brand'], s['album'], s['date']) if s['brand'] and s['album'] and s['date'] else 0
+            for s in schedules]
+
+
+def table_prices(schedules):
+    return [schedule_parser.calculate_price(s['brand'], s['album'], s['date']) if s['brand'] and s['album'] and s['date'] else 0
+            for s in schedules]
+
+
+def clear_caches():
+    for fn in (schedule_parser.price_brand_key, schedule_parser.album_bucket, schedule_parser.date_key):
+        fn.cache_clear()
+
+
+def timed(fn, *args):
+    clear_caches()
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--schedules', type=int, default=100000)
+    args = ap.parse_args()
+
+    schedules = make_schedules(args.schedules)
+    legacy, legacy_s = timed(legacy_prices, schedules)
+    table, table_s = timed(table_prices, schedules)
+    batch, batch_s = timed(schedule_parser.calculate_prices, schedules)
+
+    assert legacy == table == batch, "price table differs from legacy calculate_price"
+    per_item = lambda seconds: seconds / len(schedules) * 1e6
+    print(f"schedules: {len(schedules):,}")
+    print(f"legacy calculate_price : {per_item(legacy_s):6.2f} µs/schedule  ({legacy_s:.3f}s)")
+    print(f"calculate_price (table): {per_item(table_s):6.2f} µs/schedule  ({table_s:.3f}s)")
+    print(f"calculate_prices (batch): {per_item(batch_s):5.2f} µs/schedule  ({batch_s:.3f}s)")
+
+
+if __name__ == '__main__':
+    main()
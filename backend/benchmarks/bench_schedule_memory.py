@@ -0,0 +1,97 @@
+"""
+대용량 내보내기 파싱 메모리 벤치마크 (tracemalloc)
+
+--lines줄(기본 870,000줄 ≈ 스케줄 10만 개) 데스크탑 내보내기를 parse_schedules_classic_only로 파싱하며
+피크 메모리와 결과(스케줄 dict 리스트)가 차지하는 메모리를 잰다.
+- current: 지금 파서 (줄을 조각 단위로 나눔, 장소/담당자/화자 intern, 블록 리스트 조기 해제)
+- eager splitlines: 예전처럼 raw_text.splitlines()로 모든 줄을 한꺼번에 만듦
+- slots record: Schedule을 @dataclass(slots=True) + 미리 계산한 키 튜플로 dict를 만드는 to_dict로 교체
+세 결과가 모두 같은지 확인한다.
+
+CPython 3.11+에서는 일반 dataclass 인스턴스도 __dict__ 없이 값을 인스턴스에 바로 저장하고,
+to_dict()가 __dict__를 처음 꺼낼 때 클래스와 키를 공유하는 작은 dict가 된다. __slots__ 레코드는 객체가
+조금 작지만 to_dict()마다 키를 따로 가진 새 dict를 만들어야 해서 결과 메모리가 오히려 커진다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_schedule_memory.py [--lines 870000] [--seed 1]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from operator import attrgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+
+
+def slotted_schedule_class():
+    """Schedule와 같은 필드의 __slots__ 레코드 (to_dict = 키 튜플과 attrgetter 값 튜플을 zip)"""
+    base = schedule_parser.Schedule
+    keys = tuple(f.name for f in fields(base))
+    values = attrgetter(*keys)
+
+    def to_dict(self):
+        return dict(zip(keys, values(self)))
+
+    return make_dataclass('Schedule', [(f.name, f.type, field(default=f.default)) for f in fields(base)],
+                          namespace={'to_dict': to_dict}, slots=True)
+
+
+def measure(label, text, parse):
+    schedule_parser.classify_line.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = parse(text, parallel=False)
+    elapsed = time.perf_counter() - start
+    # 줄 분류 캐시는 파싱 사이에 공유되므로 결과 메모리에서 뺀다
+    schedule_parser.classify_line.cache_clear()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:18s}: {len(result):8,} schedules  peak {peak / 1e6:7.1f} MB  "
+          f"result {retained / 1e6:6.1f} MB ({retained / max(len(result), 1):5.0f} B/schedule)  "
+          f"{elapsed:6.2f}s (traced)")
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=870000)
+    ap.add_argument('--seed', type=int, default=1)
+    args = ap.parse_args()
+
+    text = generate_desktop_export(args.lines, seed=args.seed)
+    print(f"{args.lines:,} lines ({len(text.encode('utf-8')) / 1e6:.1f} MB)")
+    parse = schedule_parser.parse_schedules_classic_only
+
+    current = measure('current', text, parse)
+    del current[:]
+
+    lazy_splitlines = schedule_parser.iter_splitlines
+    schedule_parser.iter_splitlines = str.splitlines
+    try:
+        eager = measure('eager splitlines', text, parse)
+    finally:
+        schedule_parser.iter_splitlines = lazy_splitlines
+
+    record = schedule_parser.Schedule
+    schedule_parser.Schedule = slotted_schedule_class()
+    try:
+        slotted = measure('slots record', text, parse)
+    finally:
+        schedule_parser.Schedule = record
+
+    current = parse(text, parallel=False)
+    assert eager == current, "eager splitlines result differs"
+    assert slotted == current, "slots record result differs"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+포맷 감지 벤치마크
+
+큰 합성 내보내기에서 결합 패턴 도입 이전 detect_chat_format(전체 텍스트 ※ 검사 2회 +
+전체 splitlines + 줄당 최대 7개 정규식)과 sniff_chat_format의 1회 비용을 비교하고,
+파이프라인 전체에서 감지가 몇 번 실행되는지(프로필의 detect_format 호출 수)도 출력한다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_sniff.py [--lines 300000] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export, generate_mobile_export  # noqa: E402
+
+
+# --- 결합 패턴 도입 이전 구현 (비교 기준) ---
+
+def legacy_detect_chat_format(raw_text):
+    if (schedule_parser.ASTERISK_DATE_WEEKDAY_RE.search(raw_text)
+            and schedule_parser.ASTERISK_FIELD_RE.search(raw_text)):
+        return 'asterisk'
+    counts = {'structured': 0, 'desktop': 0, 'mobile': 0, 'compact': 0}
+    for line in raw_text.splitlines()[:50]:
+        line = line.strip()
+        if not line:
+            continue
+        if schedule_parser.STRUCTURED_KEY_RE.search(line):
+            counts['structured'] += 1
+        if schedule_parser.DESKTOP_SPEAKER_RE.search(line):
+            counts['desktop'] += 1
+        elif schedule_parser.MOBILE_SPEAKER_DETECT_RE.search(line):
+            counts['mobile'] += 1
+        elif any(pattern.search(line) for pattern in schedule_parser.COMPACT_DETECT_RES):
+            counts['compact'] += 1
+    return schedule_parser._decide_format(counts)[0]
+
+
+def best_of(repeat, fn, *args):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=300000)
+    ap.add_argument('--repeat', type=int, default=20)
+    args = ap.parse_args()
+
+    for name, generate in (('desktop', generate_desktop_export), ('mobile', generate_mobile_export)):
+        text = generate(args.lines)
+        legacy, legacy_s = best_of(args.repeat, legacy_detect_chat_format, text)
+        sniff, sniff_s = best_of(args.repeat, schedule_parser.sniff_chat_format, text)
+        assert legacy == sniff.format, (legacy, sniff)
+
+        with schedule_parser.profile_parse() as profile:
+            schedule_parser.parse_schedules_classic_only(text)
+        calls = profile.stages['detect_format'][1]
+
+        print(f"{name}: {len(text) / 1024 / 1024:.1f} MB -> {sniff.format} "
+              f"(confidence {sniff.confidence}, counts {sniff.counts}, {sniff.lines_examined} lines)")
+        print(f"  legacy detect_chat_format : {legacy_s * 1000:8.3f} ms")
+        print(f"  sniff_chat_format         : {sniff_s * 1000:8.3f} ms  ({legacy_s / sniff_s:.0f}x)")
+        print(f"  detections per classic parse: {calls}")
+
+
+if __name__ == '__main__':
+    main()
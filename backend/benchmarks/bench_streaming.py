@@ -0,0 +1,67 @@
+"""
+스트리밍 파서 메모리 벤치마크
+
+같은 합성 내보내기 파일을 parse_schedules(전체 읽기)와 parse_schedules_iter(줄 단위)로
+파싱하여 tracemalloc 최대 메모리와 결과 동일성을 비교한다.
+tracemalloc 자체 오버헤드 때문에 시간은 참고용.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_streaming.py [--lines 300000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+
+
+def run_batch(path):
+    with open(path, encoding='utf-8') as f:
+        return schedule_parser.parse_schedules(f.read())
+
+
+def run_stream(path):
+    with open(path, encoding='utf-8') as f:
+        return schedule_parser.collect_streamed_schedules(schedule_parser.parse_schedules_iter(f))
+
+
+def measure(fn, path):
+    schedule_parser.classify_line.cache_clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=300000)
+    args = ap.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+        f.write(generate_desktop_export(args.lines))
+        path = f.name
+    try:
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        batch, batch_peak, batch_s = measure(run_batch, path)
+        stream, stream_peak, stream_s = measure(run_stream, path)
+    finally:
+        os.unlink(path)
+
+    assert batch == stream, "streaming result differs from batch result"
+    print(f"input: {args.lines:,} lines, {size_mb:.1f} MB, {len(batch):,} schedules")
+    print(f"parse_schedules      : peak {batch_peak / 1024 / 1024:7.1f} MB  ({batch_s:.2f}s)")
+    print(f"parse_schedules_iter : peak {stream_peak / 1024 / 1024:7.1f} MB  ({stream_s:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Schedule 필드 밖의 키(구조화 형식 컷수 줄의 cuts) 확인
+
+파싱 결과 dict에는 Schedule 데이터클래스에 없는 키가 붙을 수 있다.
+결과를 합치는 경로가 dict를 Schedule로 되돌리다 TypeError로 죽지 않고, 그 키를 그대로 남기는지 본다.
+- merge_schedule_dicts: 같은 스케줄 두 벌이 하나로 합쳐지고 cuts가 남는다.
+- 하이브리드 / LLM 텍스트 출력 모드: 가짜 LLM(services.fake_llm)이 시스템 프롬프트처럼 컷수 줄을 내보내고,
+  Classic 재파싱 결과를 합칠 때 cuts가 남는다.
+- 일괄 파싱(parse_batch_async + merge_batch_results): 같은 메시지 두 항목이 하나로 합쳐지고 cuts가 남는다.
+  스케줄이 dict가 아닌 항목이 섞여도 그 항목만 오류가 되고 나머지는 합쳐진다.
+- 스트리밍(parse_llm_events): LLM / 하이브리드 스케줄 이벤트가 끝까지 나오고 cuts가 남는다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/check_extra_fields.py
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser as schedule_parser  # noqa: E402
+from samples import STRUCTURED_WITH_CUTS  # noqa: E402
+from services import llm_parser  # noqa: E402
+from services.fake_llm import FakeLLMBackend  # noqa: E402
+from services.llm_cache import LLMResponseCache  # noqa: E402
+
+CUTS = 50
+
+
+def check_cuts(schedules, where):
+    assert len(schedules) == 1, f"{where}: expected 1 schedule, got {len(schedules)}"
+    assert schedules[0].get('cuts') == CUTS, f"{where}: cuts lost ({schedules[0].get('cuts')!r})"
+    print(f"{where}: ok (cuts={schedules[0]['cuts']})")
+
+
+async def streamed(hybrid):
+    return [event.data['schedule'] async for event in schedule_parser.parse_llm_events(STRUCTURED_WITH_CUTS, hybrid)
+            if event.event == 'schedule']
+
+
+def main():
+    classic = schedule_parser.parse_schedules_classic_only(STRUCTURED_WITH_CUTS)
+    check_cuts(classic, 'classic')
+    check_cuts(schedule_parser.merge_schedule_dicts([classic, [dict(d) for d in classic]]), 'merge_schedule_dicts')
+
+    llm_parser.set_llm_backend(FakeLLMBackend(0.0))
+    llm_parser.llm_cache = LLMResponseCache(max_bytes=0)
+    check_cuts(asyncio.run(schedule_parser.parse_schedules_hybrid_llm_async(STRUCTURED_WITH_CUTS)), 'hybrid')
+    llm_parser.LLM_OUTPUT_FORMAT = 'text'  # JSON 모드 대신 키-값 텍스트 + Classic 재파싱 경로
+    check_cuts(asyncio.run(schedule_parser.parse_schedules_llm_async(STRUCTURED_WITH_CUTS)), 'llm (text output)')
+    check_cuts(asyncio.run(streamed(hybrid=False)), 'llm stream (text output)')
+    llm_parser.LLM_OUTPUT_FORMAT = 'json'
+    check_cuts(asyncio.run(streamed(hybrid=True)), 'hybrid stream')
+
+    batch = asyncio.run(schedule_parser.parse_batch_async([(STRUCTURED_WITH_CUTS, 'classic')] * 2))
+    merged, counted = schedule_parser.merge_batch_results(batch)
+    check_cuts(merged, 'batch')
+    assert [result.duplicates for result in counted] == [0, 1], "batch duplicates miscounted"
+    bad = schedule_parser.BatchItemResult(['not a schedule'], None, 0.0)
+    merged, counted = schedule_parser.merge_batch_results([bad] + batch)
+    check_cuts(merged, 'batch with a bad item')
+    assert counted[0].data is None and counted[0].error, "bad batch item not turned into an error"
+    assert all(result.error is None for result in counted[1:]), "bad batch item broke the other items"
+    schedule_parser.shutdown_process_pool()
+    print("ok")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+파싱 결과 가져오기(import_parsed_schedules) 확인 — /api/parse-and-import가 쓰는 저장 단계
+
+메모리 SQLite에 테이블을 만들고, 데스크탑 내보내기(--lines줄)를 Classic으로 파싱한 결과를 두 번 가져온다.
+- 1회차: 가져오기 안의 중복(같은 날짜·시간·장소 사본)은 건너뛰고, 같은 날짜·시간에 장소만 다른 스케줄은
+  추가하되 검토 필요로 표시한다. 장소 키워드 단가 규칙이 맞는 스케줄은 규칙 단가를 쓰고,
+  브랜드/앨범 태그는 없는 것만 한 번씩 만든다.
+- 2회차: 같은 입력을 다시 가져오면 모두 기존 스케줄 id와 함께 건너뛰고 아무것도 추가하지 않는다.
+--date-chunk로 IN 목록 하나에 넣는 날짜 수를 줄여 나눠 읽는 경로도 확인할 수 있다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/check_import.py [--lines 300] [--date-chunk 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# database 모듈이 실제 DB 파일을 가리키지 않도록 (아래에서 따로 만든 메모리 DB만 쓴다)
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import parser as schedule_parser  # noqa: E402
+import routers.schedules as schedules_router  # noqa: E402
+from database import Base, PricingRule, Schedule, Tag  # noqa: E402
+from samples import generate_desktop_export  # noqa: E402
+
+USER_ID = 'check-import'
+RULE_PRICE = 123000
+
+
+def run_import(session, parsed):
+    start = time.perf_counter()
+    summary = schedules_router.import_parsed_schedules(session, USER_ID, parsed)
+    session.commit()
+    return summary, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--lines', type=int, default=300)
+    ap.add_argument('--seed', type=int, default=42)
+    ap.add_argument('--date-chunk', type=int, default=schedules_router.IMPORT_DATE_CHUNK,
+                    help='IN 목록 하나에 넣는 날짜 수 (IMPORT_DATE_CHUNK)')
+    args = ap.parse_args()
+    schedules_router.IMPORT_DATE_CHUNK = args.date_chunk
+
+    parsed = schedule_parser.parse_schedules_classic_only(
+        generate_desktop_export(args.lines, seed=args.seed), parallel=False
+    )
+    assert parsed, "no schedules parsed from the sample export"
+    first = parsed[0]
+    copies = parsed[:3]
+    conflict = {**first, 'location': first['location'] + ' 별관', 'needs_review': False}
+    batch = parsed + copies + [conflict]
+
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    keyword = next(sch['location'].split()[0] for sch in parsed if sch['location'].strip())
+    session.add(PricingRule(user_id=USER_ID, location=keyword, price=RULE_PRICE, priority=10, is_active=True))
+    session.commit()
+
+    slots = {}
+    for sch in parsed:
+        slots.setdefault((sch['date'], sch['time']), set()).add(sch['location'])
+    unique = sum(len(locations) for locations in slots.values())
+
+    first_run, first_s = run_import(session, batch)
+    inserted = first_run['inserted']
+    print(f"{len(batch)} rows ({len(parsed)} parsed + {len(copies)} copies + 1 conflict), "
+          f"date chunk {args.date_chunk}")
+    print(f"run 1: {len(inserted)} inserted, {len(first_run['skipped'])} skipped, "
+          f"{first_run['needs_review']} need review, {first_run['priced_by_rule']} priced by rule, "
+          f"{first_run['created_tags']} tags created ({first_s * 1000:.1f} ms)")
+
+    # 태그는 추가된 스케줄의 브랜드/앨범에서만 (같은 정규화)
+    tags = {
+        (tag_type, ' '.join(row[tag_type].split()))
+        for row in inserted for tag_type in ('brand', 'album') if row[tag_type].strip()
+    }
+    assert len(inserted) == unique + 1, f"expected {unique + 1} inserted, got {len(inserted)}"
+    assert len(first_run['skipped']) == len(batch) - unique - 1, "in-import duplicates were not skipped"
+    assert all(row['existing_id'] is None for row in first_run['skipped']), "in-import duplicate has an existing id"
+    conflict_row = next(row for row in inserted if row['location'] == conflict['location'])
+    assert conflict_row['isDuplicate'] and conflict_row['reviewReason'] == schedules_router.IMPORT_CONFLICT_REASON, \
+        "same slot with a different location is not flagged for review"
+    ruled = [row for row in inserted if keyword in row['location']]
+    assert first_run['priced_by_rule'] == len(ruled) and all(row['price'] == RULE_PRICE for row in ruled), \
+        "pricing rule not applied to every matching location"
+    assert first_run['created_tags'] == len(tags), f"expected {len(tags)} tags, got {first_run['created_tags']}"
+
+    second_run, second_s = run_import(session, batch)
+    print(f"run 2: {len(second_run['inserted'])} inserted, {len(second_run['skipped'])} skipped, "
+          f"{second_run['created_tags']} tags created ({second_s * 1000:.1f} ms)")
+
+    assert not second_run['inserted'], "re-import inserted schedules again"
+    assert len(second_run['skipped']) == len(batch), "re-import did not skip every row"
+    ids = {row['id'] for row in inserted}
+    assert all(row['existing_id'] in ids for row in second_run['skipped']), "skipped row without its existing id"
+    assert second_run['created_tags'] == 0, "re-import created tags again"
+    assert session.query(Schedule).filter(Schedule.user_id == USER_ID).count() == len(inserted)
+    assert session.query(Tag).filter(Tag.user_id == USER_ID).count() == len(tags)
+    print("ok")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+벤치마크용 합성 카카오톡 내보내기 생성기
+
+실제 고객 데이터를 저장소에 둘 수 없으므로, 매니저 블록(4줄 코어 + 부가 정보)과
+다른 화자의 잡담을 섞어 실제 내보내기와 비슷한 분포의 텍스트를 만든다.
+같은 seed면 항상 같은 텍스트가 생성된다.
+"""
+import random
+from typing import List
+
+MANAGER = 'KPAG(업무용)'
+OTHER_SPEAKERS = ['안현우', '김영수', '이민호']
+
+LOCATIONS = [
+    '더블유 웨딩홀', '그랜드 블랑 3층', '메르시앙 컨벤션', '아시아드 마그리트홀',
+    '부산 롯데호텔 (크리스탈볼룸)', '해운대 그랜드조선호텔', '이리스 단독홀',
+]
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임']
+GIVEN = ['철수', '영희', '민준', '서연', '지훈', '수빈', '도윤', '하은', '현우', '지아']
+BRAND_LINES = ['K [ 세븐스 ] 30P', 'B 세븐스 40P', 'A 세븐스프리미엄', '더그라피 기본 50p', '세컨플로우 기본30P']
+PHOTOGRAPHERS = ['안현우', '나은빈', '정수연', '최영희']
+MANAGERS = ['그랜드 블랑', '메르시앙', '아시아드', '더블유']
+CHATTER = [
+    '네 확인했습니다', '감사합니다~', '이번주 스케줄 공유드려요', '사진 보내드렸어요',
+    '(이모티콘)', '내일 뵙겠습니다', '주차 가능한가요?', '넵',
+]
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN)
+
+
+def _schedule_lines(rng: random.Random) -> List[str]:
+    year = rng.choice([2025, 2026])
+    lines = [
+        f"{year}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}",
+        rng.choice(LOCATIONS),
+        f"{rng.randint(10, 18):02d}:{rng.choice(['00', '30'])}",
+        f"{_name(rng)} {_name(rng)}",
+    ]
+    if rng.random() < 0.7:
+        lines.append(f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}")
+    lines.append(rng.choice(BRAND_LINES))
+    lines.append(rng.choice(PHOTOGRAPHERS))
+    if rng.random() < 0.3:
+        lines.append('폐백있음 / 선촬영 10:30')
+    lines.append(rng.choice(MANAGERS))
+    return lines
+
+
+def _stamp(rng: random.Random) -> str:
+    return f"{rng.choice(['오전', '오후'])} {rng.randint(1, 12)}:{rng.randint(0, 59):02d}"
+
+
+def generate_desktop_export(target_lines: int, seed: int = 42) -> str:
+    """데스크탑 형식([화자] [오후 H:MM] 내용) 내보내기를 약 target_lines 줄 생성"""
+    rng = random.Random(seed)
+    out: List[str] = []
+    while len(out) < target_lines:
+        if rng.random() < 0.6:
+            sched = _schedule_lines(rng)
+            out.append(f"[{MANAGER}] [{_stamp(rng)}] {sched[0]}")
+            out.extend(sched[1:])
+        else:
+            out.append(f"[{rng.choice(OTHER_SPEAKERS)}] [{_stamp(rng)}] {rng.choice(CHATTER)}")
+    return "\n".join(out[:target_lines])
+
+
+def generate_mobile_export(target_lines: int, seed: int = 42) -> str:
+    """모바일 형식(YYYY년 M월 D일 오후 H:MM, 화자 : 내용) 내보내기를 약 target_lines 줄 생성"""
+    rng = random.Random(seed)
+    out: List[str] = []
+    while len(out) < target_lines:
+        prefix = f"2025년 {rng.randint(1, 12)}월 {rng.randint(1, 28)}일 {_stamp(rng)}"
+        if rng.random() < 0.6:
+            sched = _schedule_lines(rng)
+            out.append(f"{prefix}, {MANAGER} : {sched[0]}")
+            out.extend(sched[1:])
+        else:
+            out.append(f"{prefix}, {rng.choice(OTHER_SPEAKERS)} : {rng.choice(CHATTER)}")
+    return "\n".join(out[:target_lines])
+
+
+def generate_compact_block(count: int, seed: int = 42) -> str:
+    """간결한 형식(MM월 DD일 HH시 장소 신랑 신부 - 작가) 스케줄 count개 생성"""
+    rng = random.Random(seed)
+    out: List[str] = []
+    for _ in range(count):
+        when = rng.choice([
+            f"{rng.randint(10, 18)}시",
+            f"{rng.randint(10, 18)}시30분",
+            f"{rng.randint(10, 18)}:30시",
+        ])
+        out.append(
+            f"{rng.randint(1, 12)}월 {rng.randint(1, 28)}일 {when} 이리스 "
+            f"{_name(rng)} {_name(rng)} - {rng.choice(PHOTOGRAPHERS)} 작가"
+        )
+    return "\n".join(out)
+
+
+def generate_manager_block(schedules: int, compact_lines: int, seed: int = 42) -> str:
+    """간결한 형식 줄 compact_lines개와 4줄 코어 스케줄 schedules개로 이루어진 단일 매니저 블록"""
+    rng = random.Random(seed)
+    out: List[str] = [generate_compact_block(compact_lines, seed)]
+    for _ in range(schedules):
+        out.extend(_schedule_lines(rng))
+    return "\n".join(out)
+
+
+# 구조화 형식(키: 값) 스케줄 하나 — 컷수 줄은 Schedule 필드 밖의 cuts 키로 파싱된다
+STRUCTURED_WITH_CUTS = "\n".join([
+    '예식일: 2025.11.15',
+    '식시간: 13:00',
+    '예식장: 라온제나 컨벤션 3층',
+    '신랑신부님: 김철수 이영희',
+    '컷수: 50',
+])
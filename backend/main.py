@@ -19,7 +19,9 @@ load_dotenv()
 from config import settings
 
 # Import parsing functions from our parser module
-from parser import parse_schedules, parse_schedules_classic_only
+from parser import parse_schedules, parse_schedules_classic_only, shutdown_process_pool
+from services.llm_cache import llm_cache
+from services.parse_jobs import parse_jobs
 
 # Import database modules
 from database import get_database, ScheduleService, create_tables, test_connection, run_migrations, SessionLocal, Schedule, Tag, User, PricingRule, TrashSchedule
@@ -101,6 +103,19 @@ async def startup_event():
         print(f"❌ Database initialization failed: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop parse job workers, release parser worker processes and the pooled LLM connections on shutdown"""
+    await parse_jobs.shutdown()
+    shutdown_process_pool()
+    llm_cache.close()
+    try:
+        from services.llm_parser import close_openai_client
+    except ImportError:
+        return
+    await close_openai_client()
+
+
 def add_default_tags():
     """Add default tags for all users (idempotent)"""
     try:
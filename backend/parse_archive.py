@@ -0,0 +1,176 @@
+"""
+카카오톡 내보내기 아카이브 오프라인 일괄 파싱 CLI
+
+웹 API를 거치지 않고 디렉토리(하위 *.txt 전체) / glob / 파일 경로로 지정한 내보내기들을
+-j개 프로세스로 나눠 파싱하고, 스케줄을 NDJSON으로 쓴다 (단가 규칙 변경 후 재계산, memo 재생성 등).
+    한 줄 = {"file": 내보내기 경로, "schedule": {...parse_schedules 결과 dict...}}
+출력 순서는 입력 파일 경로 순서 (큰 파일부터 워커에 배정하지만 쓰기는 경로 순서로).
+stderr에 파일별 시간과 전체 처리량(MB/s, schedules/s) 요약을 출력하므로 파서 처리량 벤치마크로도 쓴다.
+
+엔진:
+    classic  parse_schedules_classic_only (API의 classic 엔진과 같음, 기본값)
+    full     parse_schedules (클래식 패턴으로 못 찾은 블록에 유연한 형식 파서까지 사용)
+
+사용법 (backend 디렉토리에서):
+    python parse_archive.py exports/ -o schedules.ndjson [-j 4] [--engine classic|full]
+    python parse_archive.py 'archive/2025-*/*.txt' -j 8 -o - --summary-json stats.json
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from parser import parse_schedules, parse_schedules_classic_only
+
+PARSE_ENGINES = {
+    'classic': parse_schedules_classic_only,
+    'full': parse_schedules,
+}
+
+
+class FileResult(NamedTuple):
+    path: str
+    bytes: int
+    data: Optional[List[Dict]]   # 실패하면 None
+    error: Optional[str]
+    seconds: float               # 읽기 + 파싱 시간 (워커 안에서 잰 값)
+
+
+def collect_inputs(inputs: List[str], pattern: str = '*.txt') -> List[str]:
+    """
+    디렉토리는 하위까지 pattern에 맞는 파일, glob은 펼친 결과 중 파일, 그 밖의 경로는 그대로
+    (없는 파일은 파싱 단계에서 실패로 보고). 중복 제거 후 경로 순으로 정렬
+    """
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, '**', pattern), recursive=True)
+        elif glob.has_magic(item):
+            matches = glob.glob(item, recursive=True)
+        else:
+            paths.add(os.path.normpath(item))
+            continue
+        paths.update(os.path.normpath(path) for path in matches if os.path.isfile(path))
+    return sorted(paths)
+
+
+def parse_file(path: str, engine: str = 'classic') -> FileResult:
+    """Worker entry point: read and parse one export, capturing its error and duration."""
+    start = time.perf_counter()
+    size = 0
+    try:
+        size = os.path.getsize(path)
+        with open(path, encoding='utf-8') as f:
+            raw_text = f.read()
+        # 파일 단위로 이미 프로세스를 나눴으므로 블록 병렬 파싱은 끈다
+        data = PARSE_ENGINES[engine](raw_text, parallel=False)
+    except Exception as e:
+        return FileResult(path, size, None, f"{type(e).__name__}: {e}", time.perf_counter() - start)
+    return FileResult(path, size, data, None, time.perf_counter() - start)
+
+
+def iter_results(paths: List[str], engine: str, workers: int):
+    """파일별 FileResult를 paths 순서대로. workers > 1이면 큰 파일부터 프로세스 풀에 제출해 부하를 고르게 한다"""
+    if workers <= 1:
+        for path in paths:
+            yield parse_file(path, engine)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        by_size = sorted(paths, key=lambda path: os.path.getsize(path) if os.path.isfile(path) else 0, reverse=True)
+        futures = {path: pool.submit(parse_file, path, engine) for path in by_size}
+        for path in paths:
+            yield futures[path].result()
+
+
+def write_ndjson(out, result: FileResult) -> None:
+    for schedule in result.data:
+        out.write(json.dumps({"file": result.path, "schedule": schedule}, ensure_ascii=False))
+        out.write('\n')
+
+
+def format_file_line(index: int, total: int, result: FileResult) -> str:
+    mb = result.bytes / 1e6
+    if result.error:
+        return f"[{index}/{total}] FAILED {result.seconds:7.2f}s {mb:8.2f} MB  {result.path}: {result.error}"
+    rate = mb / result.seconds if result.seconds else 0.0
+    return (f"[{index}/{total}] {result.seconds:7.2f}s {mb:8.2f} MB {len(result.data):8,} schedules "
+            f"{rate:7.2f} MB/s  {result.path}")
+
+
+def summarize(results: List[FileResult], wall_seconds: float, workers: int, engine: str) -> Dict:
+    parsed = [result for result in results if result.error is None]
+    total_bytes = sum(result.bytes for result in parsed)
+    schedules = sum(len(result.data) for result in parsed)
+    busy = sum(result.seconds for result in results)
+    return {
+        "engine": engine,
+        "workers": workers,
+        "files": len(results),
+        "failed": len(results) - len(parsed),
+        "bytes": total_bytes,
+        "schedules": schedules,
+        "wall_seconds": round(wall_seconds, 3),
+        "busy_seconds": round(busy, 3),   # 파일별 시간 합 (워커 수 × 경과 시간에 가까울수록 고르게 나뉨)
+        "mb_per_second": round(total_bytes / 1e6 / wall_seconds, 3) if wall_seconds else 0.0,
+        "schedules_per_second": round(schedules / wall_seconds, 1) if wall_seconds else 0.0,
+        "per_file": [
+            {"file": result.path, "bytes": result.bytes, "seconds": round(result.seconds, 4),
+             "schedules": len(result.data) if result.data is not None else None, "error": result.error}
+            for result in results
+        ],
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('inputs', nargs='+', help='디렉토리, glob (따옴표로 감쌀 것) 또는 파일 경로')
+    ap.add_argument('-o', '--output', default='-', help="NDJSON 출력 파일 ('-'면 stdout, 기본값)")
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='파싱 프로세스 수 (1이면 이 프로세스에서)')
+    ap.add_argument('--engine', choices=sorted(PARSE_ENGINES), default='classic')
+    ap.add_argument('--pattern', default='*.txt', help='디렉토리 입력에서 찾을 파일 이름 패턴')
+    ap.add_argument('--summary-json', help='요약(처리량, 파일별 시간)을 JSON으로 저장할 경로')
+    ap.add_argument('--quiet', action='store_true', help='파일별 진행 줄을 출력하지 않음')
+    args = ap.parse_args()
+
+    paths = collect_inputs(args.inputs, args.pattern)
+    if not paths:
+        ap.error(f"no input files matched: {' '.join(args.inputs)}")
+    workers = max(1, min(args.jobs, len(paths)))
+    worker_label = f"{workers} worker{'s' if workers > 1 else ''}"
+    print(f"📂 {len(paths)} files, {worker_label}, engine {args.engine}", file=sys.stderr)
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    results = []
+    start = time.perf_counter()
+    try:
+        for index, result in enumerate(iter_results(paths, args.engine, workers), 1):
+            results.append(result)
+            if result.data is not None:
+                write_ndjson(out, result)
+            if not args.quiet or result.error:
+                print(format_file_line(index, len(paths), result), file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    summary = summarize(results, time.perf_counter() - start, workers, args.engine)
+
+    print(f"\n✅ {summary['files'] - summary['failed']}/{summary['files']} files, {summary['bytes'] / 1e6:.1f} MB, "
+          f"{summary['schedules']:,} schedules in {summary['wall_seconds']:.2f}s", file=sys.stderr)
+    print(f"   throughput: {summary['mb_per_second']:.2f} MB/s, {summary['schedules_per_second']:,.0f} schedules/s "
+          f"(per-file time sum {summary['busy_seconds']:.2f}s over {worker_label})", file=sys.stderr)
+    slowest = sorted(results, key=lambda result: result.seconds, reverse=True)[:5]
+    print("   slowest: " + ", ".join(f"{os.path.basename(r.path)} {r.seconds:.2f}s" for r in slowest), file=sys.stderr)
+
+    if args.summary_json:
+        with open(args.summary_json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
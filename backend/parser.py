@@ -1,6 +1,19 @@
+import os
 import re
+import sys
+import hashlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, Any
+from functools import lru_cache, wraps
+from bisect import bisect_right
+from itertools import chain, islice
+from typing import List, Dict, Tuple, Optional, Any, NamedTuple, Iterable, Iterator, AsyncIterator, Union, Callable
 from datetime import datetime, timedelta
 
 # --- Constants ---
@@ -23,6 +36,8 @@ PHOTOGRAPHER_EXCLUDED_TERMS = [
     '선촬영', '홀스냅', '주례없음', '주례있음', '플래시컷', '플라워샤워'
 ]
 
+PHOTOGRAPHER_EXCLUDED_SET = frozenset(PHOTOGRAPHER_EXCLUDED_TERMS)
+
 PHOTOGRAPHER_NAMES = [
     '안현우', '홍길동', '김영수', '이민호', '박지성', '최영희', '정수연', '나은빈'
 ]
@@ -30,6 +45,9 @@ PHOTOGRAPHER_NAMES = [
 DEFAULT_ALBUM = '30P'
 MANAGER_NAME = 'KPAG(업무용)'
 
+# 파싱 결과에 영향을 주는 변경 시 올린다 (파싱 결과 캐시 키에 포함)
+PARSER_VERSION = '2025.06'
+
 # NLP-style parsing constants
 LOCATION_KEYWORDS = [
     '호텔', '웨딩홀', '컨벤션', '교회', '성당', '채플', '스튜디오', '홀', '센터', '타워',
@@ -41,6 +59,12 @@ COMMON_WORDS = [
     '건당', '만원', '추가', '입니다', '출장비', '예약', '문의', '확인'
 ]
 
+# 매니저 화자 추정용 장소 힌트 키워드 (find_manager_speaker)
+VENUE_HINT_KEYWORDS = ['홀', '층', '컨벤션', '웨딩', '더']
+
+# 단가 계산용 브랜드 키 (normalize_brand 결과에서 찾는 부분 문자열)
+BRAND_PRICE_KEYS = ['k세븐스', 'b세븐스', 'a세븐스프리미엄', '더그라피', '세컨플로우']
+
 # Date prediction constants
 WEEKDAY_PATTERNS = {
     r'일요일?': 6,  # Sunday
@@ -52,6 +76,314 @@ WEEKDAY_PATTERNS = {
     r'토요일?': 5   # Saturday
 }
 
+# --- Pattern Registry ---
+# 파서에서 쓰는 모든 정규식은 import 시 여기서 한 번만 컴파일한다.
+# 함수 안에서 re.search(문자열, ...) 형태로 패턴을 다시 조회/조합하지 말고
+# 아래 컴파일된 객체를 사용할 것. PATTERNS는 이름 → 컴파일된 패턴 목록.
+PATTERNS: Dict[str, re.Pattern] = {}
+
+def _compile(name: str, pattern: str, flags: int = 0) -> re.Pattern:
+    """패턴을 컴파일하여 레지스트리에 등록"""
+    compiled = re.compile(pattern, flags)
+    PATTERNS[name] = compiled
+    return compiled
+
+# 공통 필드
+DATE_RE = _compile('date', r'(\d{4}\.\d{2}\.\d{2})')
+DATE_LINE_RE = _compile('date_line', r'^\d{4}\.\d{2}\.\d{2}$')
+TIME_LINE_RE = _compile('time_line', r'^\d{2}:\d{2}$')
+CONTACT_RE = _compile('contact', r'(010[- .]?\d{4}[- .]?\d{4})')
+NON_DIGIT_RE = _compile('non_digit', r'[^0-9]')
+WHITESPACE_RE = _compile('whitespace', r'\s+')
+PARENTHESES_RE = _compile('parentheses', r'\([^)]*\)')
+INVISIBLE_CHARS_RE = _compile('invisible_chars', '\u202d|\u202c')  # LRO/PDF 방향 제어 문자
+HANGUL_THREE_PARTS_RE = _compile('hangul_three_parts', r'^[가-힣]+\s+[가-힣]+\s+[가-힣]+$')
+PHOTOGRAPHER_NAME_RE = _compile('photographer_name', r'^[가-힣]{2,4}$')
+STANDALONE_HOLE_RE = _compile('standalone_hole', r'단독홀?')
+
+# 브랜드/앨범: 목록을 하나의 alternation으로 합쳐 한 번에 검색
+BRAND_RE = _compile('brand', '|'.join(f'({pattern})' for pattern in BRAND_PATTERNS))
+ALBUM_RE = _compile('album', '|'.join(f'({pattern})' for pattern in ALBUM_PATTERNS), re.IGNORECASE)
+# 우선순위(목록 순서)대로 개별 검사가 필요한 곳용
+ALBUM_RES = [_compile(f'album_{i}', pattern, re.IGNORECASE) for i, pattern in enumerate(ALBUM_PATTERNS)]
+ALBUM_PAGES_RE = _compile('album_pages', r'(?<!\d)(\d+)[Pp]')  # 숫자 구간 중간에서 다시 시작하지 않음 (이차 → 선형)
+DEFAULT_ALBUM_NORMALIZE_RE = _compile('default_album_normalize', r'기본\s*(\d{2,3}[Pp])', re.IGNORECASE)
+BRACKETS_ONLY_RE = _compile('brackets_only', r'^[\[\]\s]*$')
+
+# 날짜 추측
+WEEKDAY_RES = [(_compile(f'weekday_{num}', pattern), num) for pattern, num in WEEKDAY_PATTERNS.items()]
+PREDICT_DATE_RES = [
+    _compile('predict_date_korean', r'(\d{1,2})월\s*(\d{1,2})일'),   # MM월 DD일
+    _compile('predict_date_full', r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})'),  # YYYY-MM-DD
+    _compile('predict_date_short', r'(\d{1,2})[-./](\d{1,2})'),       # MM-DD
+]
+
+# 포맷 감지
+ASTERISK_DATE_WEEKDAY_RE = _compile('asterisk_date_weekday', r'\d{4}\.\d{2}\.\d{2}\s*\([일월화수목금토]\)')
+ASTERISK_FIELD_RE = _compile('asterisk_field', r'※\s*(발주처|신부연락처|신랑연락처|특이사항)')
+STRUCTURED_KEY_RE = _compile(
+    'structured_key',
+    r'^(예식일|식시간|예식장|신랑신부님?|사진업체|플래너|담당감독|상품|촬영범위|페이)\s*[:：]'
+)
+DESKTOP_SPEAKER_RE = _compile('desktop_speaker', r'^\[([^\]]+)\]\s*\[(오전|오후)\s*\d{1,2}:\d{2}\]')
+# 화자 이름 부분의 \s*[^:]+\s*는 공백에서 겹쳐 ':'가 없는 긴 줄에서 세제곱 역추적이 생긴다.
+# (?=[^:]*:)로 ':'가 있는 줄만 들어가게 하면 첫 시도(탐욕 매치)에서 끝나고 매치/그룹은 같다
+MOBILE_SPEAKER_RE = _compile(
+    'mobile_speaker',
+    r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)\s*\d{1,2}:\d{2},(?=[^:]*:)\s*([^:]+)\s*:\s*(.*)'
+)
+MOBILE_SPEAKER_DETECT_RE = _compile(
+    'mobile_speaker_detect',
+    r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)\s*\d{1,2}:\d{2},(?=[^:]*:)\s*[^:]+\s*:'
+)
+COMPACT_DETECT_RES = [
+    # 장소 앞뒤의 \s+.+\s+는 공백 구간에서 겹쳐 세제곱 역추적이 생긴다. 줄 단위(개행 없음)로만 쓰이므로
+    # .+가 나머지 공백을 흡수하는 \s.+\s와 맞는 줄이 같다
+    _compile(
+        'compact_detect_full',
+        r'^\d{1,2}월\s*\d{1,2}일\s*\d{1,2}시(?:\d{1,2}분|:\d{2}시)?\s.+\s[가-힣]+\s+[가-힣]+\s*-\s*[가-힣]+\s*작가'
+    ),
+    # [가-힣\s"]+ 뒤의 공백은 한 글자만 요구해도 같은 줄에 맞는다 (\s+를 쓰면 공백 구간에서 이차 역추적)
+    _compile('compact_detect_venue_time', r'^[가-힣\s"]+\s\d{1,2}시(?:\d{1,2}분)?(?:\s[가-힣\s]*)?$'),
+    _compile('compact_detect_no_space', r'^\d{1,2}월\d{1,2}일\s+[가-힣]+'),
+]
+# 위 감지 패턴들을 줄당 한 번의 match로 평가하는 결합 패턴 (그룹 이름 = 포맷).
+# 네 포맷의 패턴은 줄 첫 글자부터 서로 겹치지 않으므로(키워드 / '[' / 'YYYY년' / 'M월'·한글 장소)
+# 어느 그룹이 맞았는지가 개별 패턴을 순서대로 검사한 결과와 같다.
+FORMAT_SNIFF_RE = _compile('format_sniff', '|'.join(
+    f"(?P<{name}>{'|'.join(f'(?:{pattern.pattern})' for pattern in patterns)})"
+    for name, patterns in (
+        ('structured', [STRUCTURED_KEY_RE]),
+        ('desktop', [DESKTOP_SPEAKER_RE]),
+        ('mobile', [MOBILE_SPEAKER_DETECT_RE]),
+        ('compact', COMPACT_DETECT_RES),
+    )
+))
+
+# 간결한 형식 (패턴 1-3을 하나로 합친 패턴)
+# 시간 부분 alternation 순서가 기존 패턴 우선순위와 같다: HH시MM분 > HH:MM시 > HH시
+# 장소는 \S로 시작해 \S로 끝나는 경우를 먼저 보고, 그래도 안 맞을 때만 (장소 없이 공백 3개 이상 뒤에
+# 신랑이 오는 줄) 공백 한 글자를 장소로 잡는다. \s+(?P<location>.+?)\s+와 그룹까지 같은 매치를 내면서
+# 공백 구간에서의 세제곱 역추적이 없다
+MONTH_HEADER_RE = _compile('month_header', r'^(\d{1,2})월$')
+COMPACT_SCHEDULE_RE = _compile(
+    'compact_schedule',
+    r'^(?P<month>\d{1,2})월\s*(?P<day>\d{1,2})일\s*(?P<hour>\d{1,2})'
+    r'(?:시(?P<minute>\d{1,2})분|:(?P<colon_minute>\d{2})시|시)'
+    r'\s+(?P<location>\S.*?(?<=\S)|\s(?=\s[가-힣]))\s+(?P<groom>[가-힣]+)\s+(?P<bride>[가-힣]+)\s*-\s*(?P<photographer>[가-힣]+)\s*작가'
+)
+
+# ※ 형식
+# 전체 텍스트에 적용하는 패턴이라 괄호 안에 '['를 허용하지 않는다 (닫히지 않은 '['마다 끝까지 훑는 이차 시간 방지)
+ASTERISK_SPEAKER_HEADER_RE = _compile('asterisk_speaker_header', r'\[[^\[\]]+\]\s*\[(?:오전|오후)\s*\d{1,2}:\d{2}\]\s*')
+ASTERISK_BLOCK_START_RE = _compile('asterisk_block_start', r'^\d{4}\.\d{2}\.\d{2}\s*\([일월화수목금토]\)', re.MULTILINE)
+ASTERISK_SEPARATOR_RE = _compile('asterisk_separator', r'ㅡ{3,}')
+HOUR_MINUTE_KOREAN_RE = _compile('hour_minute_korean', r'(\d{1,2})시\s*(\d{1,2})분')
+HOUR_KOREAN_RE = _compile('hour_korean', r'(\d{1,2})시')
+ASTERISK_CONTACT_RE = _compile('asterisk_contact', r'(?:신부|신랑)?연락처\s*[:：]\s*(.+)')
+ASTERISK_MANAGER_RE = _compile('asterisk_manager', r'발주처\s*[:：]\s*(.+)')
+ASTERISK_MEMO_RE = _compile('asterisk_memo', r'특이사항\s*[:：]\s*(.+)')
+
+# 구조화된 형식
+# 키 문자 클래스가 공백을 포함하므로 ':' 앞의 \s*는 항상 빈 매치 (있으면 ':' 없는 줄에서 이차 역추적)
+KEY_VALUE_RE = _compile('key_value', r'^([가-힣a-zA-Z0-9\s]+)[:：]\s*(.*)$')
+STRUCTURED_DATE_RE = _compile('structured_date', r'(\d{4})[.\-](\d{1,2})[.\-](\d{1,2})')
+STRUCTURED_TIME_RE = _compile('structured_time', r'(\d{1,2}):(\d{2})')
+HANGUL_NAME_RE = _compile('hangul_name', r'[가-힣]{2,4}')
+NUMBER_RE = _compile('number', r'(\d+)')
+# 전체 텍스트에 적용: 제목에 '['를 허용하지 않아 닫히지 않은 '['에서 다음 '['까지만 훑는다
+SECTION_RE = _compile('section', r'\[([^\[\]]*)\](.*?)(?=\[|$)', re.DOTALL)
+
+# 유연한 형식 (구성 요소 추출)
+FLEX_DATE_RES = [
+    _compile('flex_date_korean', r'(\d{1,2})월(\d{1,2})일'),  # MM월DD일
+    _compile('flex_date_full', r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})'),  # YYYY-MM-DD
+    _compile('flex_date_short', r'(\d{1,2})[-./](\d{1,2})'),  # MM-DD
+]
+FLEX_WEEKDAY_RE = _compile('flex_weekday', r'([가-힣]요일?)')
+FLEX_TIME_RES = [
+    _compile('flex_time_colon', r'(\d{1,2}):(\d{2})'),  # HH:MM
+    _compile('flex_time_hour_minute', r'(\d{1,2})시(\d{1,2})분'),  # HH시MM분
+    _compile('flex_time_hour', r'(\d{1,2})시(?!간)'),  # HH시 (시간이 아닌 경우)
+]
+FLEX_VENUE_RES = [
+    _compile('flex_venue_suffix', r'([가-힣]{2,}(?:호텔|센터|컨벤션|웨딩홀|교회|성당|예식장|리조트|펜션))'),
+    _compile('flex_venue_brand', r'([가-힣]{2,}(?:메르시앙|그랜드|조선|롯데|신라|하얏트|힐튼))'),
+    # 수식어는 공백/따옴표/영숫자로 시작한다. 한글로 시작하는 수식어는 앞의 [가-힣]+가 흡수하므로 매치는 같고,
+    # 두 반복이 겹치지 않아 긴 한글 구간에서 세제곱 역추적이 생기지 않는다 (한글 두 글자 이상 + 따옴표는 마지막 대안)
+    _compile('flex_venue_hall', r'([가-힣]+(?:(?:\s+["\']?|["\']|(?=[a-zA-Z0-9]))[a-zA-Z0-9가-힣]+["\']?|(?<=[가-힣]{2})["\'])?(?:홀|룸|관|동))'),
+]
+FLEX_REGION_RE = _compile('flex_region', r'(김해|창원|부산|해운대|센텀|광주|대구|서울|인천|대전)(?:\s*[가-힣]*)?')
+FLEX_PHOTOGRAPHER_RE = _compile('flex_photographer', r'([가-힣]+)\s*작가')
+MONTH_DAY_DIGITS_RE = _compile('month_day_digits', r'(\d{1,2})(\d{1,2})$')
+DATE_SEPARATOR_RE = _compile('date_separator', r'[-./]')
+
+# LLM 입력 분할 (스케줄 경계 추정)
+LLM_DATE_HINT_RE = _compile(
+    'llm_date_hint',
+    r'\d{4}\s*[.\-/년]\s*\d{1,2}\s*[.\-/월]\s*\d{1,2}|\d{1,2}\s*월\s*\d{1,2}\s*일|\d{1,2}/\d{1,2}\s*\('
+)
+LLM_SEPARATOR_RE = _compile('llm_separator', r'^(?:-{3,}|ㅡ{3,}|={3,})$', re.MULTILINE)
+
+# LLM 전처리: 스케줄 정보가 없는 줄 (시스템 메시지, 이모티콘, 인사/대답만 있는 줄)
+# 인사/대답 줄은 "대답 단어 또는 구두점으로 시작해 대답 단어/공백/구두점만 이어지는 줄".
+# 단어 안에 반복(네+, [ㅋㅎ]+)을 두거나 구두점을 단어와 구분자 양쪽에 넣으면 (…+)+ 중첩 반복이 되어
+# "ㅋㅋㅋ…ㅋ가" 같은 줄에서 역추적이 지수적으로 늘어난다. 반복은 바깥 *에서만 하고, 단어와 구분자는
+# 첫 글자가 겹치지 않게 둔다 (benchmarks/audit_patterns.py 참고).
+LLM_ACK_WORDS = [
+    '네', '넵', '넹', '예', 'ㅇㅋ', '오케이', '확인(?:했습니다|했어요|요|합니다)?', '감사(?:합니다|해요|드립니다)',
+    '수고(?:하셨습니다|하세요|하십니다)', '안녕하세요', '좋습니다', '알겠습니다', '[ㅋㅎㅠㅜ]',
+]
+LLM_ACK_WORD = '|'.join(LLM_ACK_WORDS)
+LLM_NOISE_LINE_RE = _compile(
+    'llm_noise_line',
+    r'^(?:'
+    r'\(?이모티콘\)?|사진(?:\s*\d+장)?|동영상|파일\s*:.*|삭제된 메시지입니다\.?|'
+    r'.*님이 (?:들어왔습니다|나갔습니다|초대했습니다)\.?|'
+    r'---.*---|저장한 날짜\s*:.*|.*님과 카카오톡 대화|'
+    r'(?:' + LLM_ACK_WORD + r'|[~!.^])(?:' + LLM_ACK_WORD + r'|[\s~!.^])*'
+    r')$'
+)
+HANGUL_CHAR_RE = _compile('hangul_char', r'[가-힣]')
+
+def normalize_brand(brand: str) -> str:
+    """Lower-case brand with spaces and brackets removed ('K [ 세븐스 ]' → 'k세븐스')."""
+    return brand.lower().replace(' ', '').replace('[', '').replace(']', '')
+
+# --- Parse Profiling ---
+# 느린 파싱이 포맷 감지/화자 분리/매니저 추정/블록 파싱/단가 계산 중 어디서 시간을 썼는지 보기 위한 계측.
+# profile_parse() 안에서 실행된 파서 단계만 기록되며(컨텍스트 변수), 밖에서는 거의 비용이 없다.
+# 단계는 중첩될 수 있다 (예: calculate_price는 parse_blocks 안에서 호출됨).
+# 멀티프로세스 블록 파싱 시 워커 안의 단계/카운터는 잡히지 않고 parse_blocks 벽시계 시간만 남는다.
+# 끝난 프로필은 프로세스 전역 히스토그램(PARSE_STAGE_HISTOGRAMS)에 합산된다.
+
+class ParseProfile:
+    """한 번의 파싱 요청에 대한 단계별 시간/호출 수와 카운터"""
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}   # stage → [누적 초, 호출 수]
+        self.counters: Dict[str, int] = {}
+        self.total_seconds = 0.0
+
+    def add(self, stage: str, seconds: float) -> None:
+        entry = self.stages.setdefault(stage, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "stages": {
+                stage: {"ms": round(seconds * 1000, 3), "calls": calls}
+                for stage, (seconds, calls) in self.stages.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+_active_profile: ContextVar[Optional[ParseProfile]] = ContextVar('parse_profile', default=None)
+
+def profiled(stage: str) -> Callable:
+    """Decorator: add the wrapped call's duration to the active profile under stage."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            profile = _active_profile.get()
+            if profile is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profile.add(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+@contextmanager
+def parse_stage(stage: str) -> Iterator[None]:
+    """Time a block of code as stage in the active profile (no-op without one)."""
+    profile = _active_profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(stage, time.perf_counter() - start)
+
+def count_parse(name: str, n: int = 1) -> None:
+    """Increment counter name in the active profile (no-op without one)."""
+    profile = _active_profile.get()
+    if profile is not None:
+        profile.count(name, n)
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 전부
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+class StageHistograms:
+    """단계별 소요 시간(ms) 히스토그램 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = HISTOGRAM_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, ms: float) -> None:
+        index = next((i for i, bound in enumerate(self.buckets_ms) if ms <= bound), len(self.buckets_ms))
+        with self._lock:
+            hist = self._stages.get(stage)
+            if hist is None:
+                hist = self._stages[stage] = {"count": 0, "sum_ms": 0.0, "max_ms": 0.0,
+                                              "buckets": [0] * (len(self.buckets_ms) + 1)}
+            hist["count"] += 1
+            hist["sum_ms"] += ms
+            hist["max_ms"] = max(hist["max_ms"], ms)
+            hist["buckets"][index] += 1
+
+    def record(self, profile: ParseProfile) -> None:
+        self.observe("total", profile.total_seconds * 1000)
+        for stage, (seconds, _) in profile.stages.items():
+            self.observe(stage, seconds * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}" for bound in self.buckets_ms] + [f">{self.buckets_ms[-1]}"]
+        with self._lock:
+            return {
+                stage: {
+                    "count": hist["count"],
+                    "avg_ms": round(hist["sum_ms"] / hist["count"], 3),
+                    "max_ms": round(hist["max_ms"], 3),
+                    "buckets": dict(zip(labels, hist["buckets"])),
+                }
+                for stage, hist in self._stages.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+PARSE_STAGE_HISTOGRAMS = StageHistograms()
+
+@contextmanager
+def profile_parse() -> Iterator[ParseProfile]:
+    """
+    Profile every parser stage run inside the with-block.
+    On exit the profile is added to PARSE_STAGE_HISTOGRAMS (skipped if no stage ran, e.g. a cache hit).
+    """
+    profile = ParseProfile()
+    token = _active_profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_seconds = time.perf_counter() - start
+        _active_profile.reset(token)
+        if profile.stages:
+            PARSE_STAGE_HISTOGRAMS.record(profile)
+
 # Date prediction functions
 def get_next_saturday():
     """이번 주 토요일 날짜를 반환"""
@@ -68,8 +400,8 @@ def get_date_from_weekday(weekday_text):
 
     # 요일 패턴 매칭
     target_weekday = None
-    for pattern, weekday_num in WEEKDAY_PATTERNS.items():
-        if re.search(pattern, weekday_text):
+    for pattern, weekday_num in WEEKDAY_RES:
+        if pattern.search(weekday_text):
             target_weekday = weekday_num
             break
 
@@ -87,19 +419,13 @@ def get_date_from_weekday(weekday_text):
 def predict_date_from_text(text):
     """텍스트에서 날짜 정보가 없으면 추측해서 반환"""
     # 기존 날짜 패턴이 있는지 확인
-    date_patterns = [
-        r'(\d{1,2})월\s*(\d{1,2})일',  # MM월 DD일
-        r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',  # YYYY-MM-DD
-        r'(\d{1,2})[-./](\d{1,2})',  # MM-DD
-    ]
-
-    for pattern in date_patterns:
-        if re.search(pattern, text):
+    for pattern in PREDICT_DATE_RES:
+        if pattern.search(text):
             return None  # 기존 날짜가 있으면 None 반환 (변경 없음)
 
     # 요일이 있는지 확인
-    for pattern in WEEKDAY_PATTERNS.keys():
-        if re.search(pattern, text):
+    for pattern, _ in WEEKDAY_RES:
+        if pattern.search(text):
             return get_date_from_weekday(text)
 
     # 날짜 정보가 전혀 없으면 이번 주 토요일
@@ -128,6 +454,9 @@ class Schedule:
     review_reason: str = ""  # 검토 필요 이유
 
     def to_dict(self) -> Dict:
+        # __slots__를 쓰지 않는 이유: CPython 3.11+는 일반 인스턴스도 값을 __dict__ 없이 저장하다가
+        # 여기서 처음 꺼낼 때 클래스와 키를 공유하는 dict로 만든다. 키 튜플로 새 dict를 만드는 slots 레코드보다
+        # 결과 dict가 스케줄당 절반 크기 (benchmarks/bench_schedule_memory.py)
         return self.__dict__
 
 # --- Helper Functions ---
@@ -139,8 +468,7 @@ def extract_date(line: str) -> str:
     """
     # Look for YYYY.MM.DD pattern anywhere in the line
     # More flexible pattern that doesn't require word boundaries
-    date_pattern = r'(\d{4}\.\d{2}\.\d{2})'
-    match = re.search(date_pattern, line.strip())
+    match = DATE_RE.search(line.strip())
     return match.group(1) if match else ""
 
 def is_valid_date(line: str) -> bool:
@@ -150,7 +478,7 @@ def is_valid_date(line: str) -> bool:
     making it resilient to various formatting issues and typos.
     """
     return bool(extract_date(line))
-def is_valid_time(line: str) -> bool: return bool(re.match(r'^\d{2}:\d{2}$', line.strip()))
+def is_valid_time(line: str) -> bool: return bool(TIME_LINE_RE.match(line.strip()))
 def is_valid_couple(line: str) -> bool:
     line = line.strip()
 
@@ -170,7 +498,7 @@ def is_valid_couple(line: str) -> bool:
         return True
 
     # 외자 이름 패턴 (3개 부분)
-    if len(parts) == 3 and re.match(r'^[가-힣]+\s+[가-힣]+\s+[가-힣]+$', line):
+    if len(parts) == 3 and HANGUL_THREE_PARTS_RE.match(line):
         # 패턴 1: "배승희 윤 정" (한글이름 + 한글자 + 한글자)
         if len(parts[1]) == 1 and len(parts[2]) == 1:
             return True
@@ -194,7 +522,7 @@ def separate_couple_names(couple_str: str) -> str:
     couple_str = couple_str.strip()
 
     # 외자 이름 패턴 처리
-    if re.match(r'^[가-힣]+\s+[가-힣]+\s+[가-힣]+$', couple_str):
+    if HANGUL_THREE_PARTS_RE.match(couple_str):
         parts = couple_str.split()
         if len(parts) == 3:
             # 패턴 1: "배승희 윤 정" -> "배승희 윤정"
@@ -235,18 +563,32 @@ def separate_couple_names(couple_str: str) -> str:
     # 분리할 수 없으면 원본 반환
     return couple_str
 
+def remove_parenthesized(text: str) -> str:
+    """
+    PARENTHESES_RE.sub('', text)와 같은 결과. 마지막 ')' 뒤의 '('에서는 매치가 없으므로 그 앞까지만 정규식을 돌린다
+    (닫는 괄호 없는 '('가 많은 줄에서 '('마다 줄 끝까지 훑는 이차 시간을 피함)
+    """
+    end = text.rfind(')') + 1
+    return PARENTHESES_RE.sub('', text[:end]) + text[end:] if end else text
+
+def strip_photographer_line(line: str) -> str:
+    """Remove contact, role info like (메인)/(서브) and invisible characters to get a photographer name candidate."""
+    name_part = CONTACT_RE.sub('', line).strip()
+    name_part = remove_parenthesized(name_part).strip()
+    return INVISIBLE_CHARS_RE.sub('', name_part).strip()
+
 def is_valid_photographer_name(name: str) -> bool:
     name = name.strip()
-    if name in PHOTOGRAPHER_EXCLUDED_TERMS:
+    if name in PHOTOGRAPHER_EXCLUDED_SET:
         return False
-    return bool(re.match(r'^[가-힣]{2,4}$', name))
+    return bool(PHOTOGRAPHER_NAME_RE.match(name))
 def parse_contact(line: str) -> str:
-    m = re.search(r'(010[- .]?\d{4}[- .]?\d{4})', line)
+    m = CONTACT_RE.search(line)
     if not m:
         return ""
 
     # Extract only digits and format as 010-XXXX-XXXX
-    digits = re.sub(r'[^0-9]', '', m.group(1))
+    digits = NON_DIGIT_RE.sub('', m.group(1))
     if len(digits) == 11 and digits.startswith('010'):
         return f"{digits[:3]}-{digits[3:7]}-{digits[7:]}"
     return m.group(1)  # Return original if formatting fails
@@ -256,10 +598,10 @@ def clean_location(location: str) -> str:
         return location
 
     # Remove parentheses and their content (e.g., "(17층)", "(해운대)")
-    location = re.sub(r'\([^)]*\)', '', location).strip()
+    location = remove_parenthesized(location).strip()
 
     # Remove "단독" or "단독홀"
-    location = re.sub(r'단독홀?', '', location).strip()
+    location = STANDALONE_HOLE_RE.sub('', location).strip()
 
     # Remove "홀" at the end of location name
     if location.endswith('홀'):
@@ -277,27 +619,22 @@ def clean_location(location: str) -> str:
 
     return location.strip()
 def parse_brand_album(line: str) -> (str, str):
-    # Create regex pattern from BRAND_PATTERNS
-    brand_pattern = '|'.join([f'({pattern})' for pattern in BRAND_PATTERNS])
-    brand_match = re.search(brand_pattern, line)
-
-    # Create regex pattern from ALBUM_PATTERNS
-    album_pattern = '|'.join([f'({pattern})' for pattern in ALBUM_PATTERNS])
-    album_match = re.search(album_pattern, line, re.IGNORECASE)
+    brand_match = BRAND_RE.search(line)
+    album_match = ALBUM_RE.search(line)
 
     # 브랜드: 대괄호 제거, trim, 연속 공백 정규화
     brand = brand_match.group(0).replace('[', '').replace(']', '').strip() if brand_match else ""
     if brand:
-        brand = re.sub(r'\s+', ' ', brand)  # 연속된 공백을 하나로
+        brand = WHITESPACE_RE.sub(' ', brand)  # 연속된 공백을 하나로
 
     # 앨범: 대문자 변환, 연속 공백 정규화
     album = album_match.group(0).upper() if album_match else ""
     if album:
-        album = re.sub(r'\s+', ' ', album)  # 연속된 공백을 하나로
+        album = WHITESPACE_RE.sub(' ', album)  # 연속된 공백을 하나로
 
     # "기본 30P" 형태에서 공백 제거하여 "기본30P"로 정규화
     if album and '기본' in album:
-        album = re.sub(r'기본\s*(\d{2,3}[Pp])', r'기본\1', album, flags=re.IGNORECASE)
+        album = DEFAULT_ALBUM_NORMALIZE_RE.sub(r'기본\1', album)
 
     # If no album found but "기본" is mentioned, default to DEFAULT_ALBUM
     if not album and "기본" in line:
@@ -311,11 +648,110 @@ def parse_brand_album(line: str) -> (str, str):
             remaining_text = line.replace(brand_match.group(0), '').strip()
 
         # If remaining text is empty or only contains brackets/spaces, default to DEFAULT_ALBUM
-        if not remaining_text or re.match(r'^[\[\]\s]*$', remaining_text):
+        if not remaining_text or BRACKETS_ONLY_RE.match(remaining_text):
             album = DEFAULT_ALBUM
 
     return brand, album
 
+# --- Line Classifier ---
+# 클래식 파서 단계(find_manager_speaker, parse_manager_block, 완성도 점수 등)가
+# 같은 줄에 날짜/시간/신랑신부/연락처/브랜드 검사를 반복하지 않도록,
+# 모든 줄은 classify_line()으로 한 번만 분류하고 그 결과(LineToken)를 공유한다.
+# 같은 문자열은 LRU 캐시로 재사용되므로 반복되는 줄(시간, 브랜드, 계약자 등)은 사실상 무료.
+
+# LineToken.kind 값 (우선순위 순)
+KIND_DATE = 'date'
+KIND_TIME = 'time'
+KIND_BRAND = 'brand'
+KIND_CONTACT = 'contact'
+KIND_PHOTOGRAPHER = 'photographer'
+KIND_COUPLE = 'couple'
+KIND_VENUE = 'venue'
+KIND_TEXT = 'text'
+
+CLASSIFY_CACHE_SIZE = 16384
+
+class LineToken(NamedTuple):
+    """한 줄의 분류 결과. 파서들은 원본 문자열 대신 이 값을 사용한다."""
+    text: str           # 앞뒤 공백 제거된 원문
+    kind: str           # 대표 종류 (KIND_*)
+    date: str           # extract_date 결과 (YYYY.MM.DD 또는 "")
+    is_time: bool       # HH:MM 단독 줄
+    is_couple: bool     # 신랑신부 이름 형식
+    contact: str        # 정규화된 연락처 또는 ""
+    brand: str          # parse_brand_album 결과
+    album: str
+    photographer: str   # 유효한 작가 이름 후보 또는 ""
+    score: int          # 매니저 화자 추정용 스케줄 지표 가중치
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify_line(line: str) -> LineToken:
+    """Classify a single line once, extracting every value the classic parsers need."""
+    count_parse('classified_lines')  # 캐시 미스 = 정규식을 실제로 평가한 줄
+    text = line.strip()
+    date = extract_date(text)
+    is_time = is_valid_time(text)
+    is_couple = is_valid_couple(text)
+    contact = parse_contact(text)
+    brand, album = parse_brand_album(text)
+    name_part = strip_photographer_line(text)
+    photographer = name_part if is_valid_photographer_name(name_part) else ""
+    is_venue = any(keyword in text for keyword in VENUE_HINT_KEYWORDS)
+
+    # find_manager_speaker 가중치: 날짜 단독 줄 > 시간/브랜드 > 장소 힌트
+    if date and date == text:
+        score = 3
+    elif is_time or brand:
+        score = 2
+    elif is_venue:
+        score = 1
+    else:
+        score = 0
+
+    if date:
+        kind = KIND_DATE
+    elif is_time:
+        kind = KIND_TIME
+    elif brand or album:
+        kind = KIND_BRAND
+    elif contact:
+        kind = KIND_CONTACT
+    elif photographer:
+        kind = KIND_PHOTOGRAPHER
+    elif is_couple:
+        kind = KIND_COUPLE
+    elif is_venue:
+        kind = KIND_VENUE
+    else:
+        kind = KIND_TEXT
+
+    return LineToken(text, kind, date, is_time, is_couple, contact, brand, album, photographer, score)
+
+def tokenize_block(block_text: str) -> List[LineToken]:
+    """Turn a manager block into the token stream consumed by the block parsers (empty and '---' lines dropped)."""
+    return [
+        classify_line(line)
+        for line in block_text.splitlines()
+        if line.strip() and not line.startswith('---')
+    ]
+
+# --- Format Sniffer ---
+# 포맷 감지는 파싱마다 한 번만: sniff_chat_format()이 (포맷, 신뢰도, 포맷별 줄 수)를 돌려주고
+# 파이프라인(split_chat_by_speaker 등)은 다시 감지하지 않고 그 결과를 넘겨받는다.
+# 앞 FORMAT_SNIFF_LINES 줄만 보며, 줄마다 FORMAT_SNIFF_RE 한 번만 평가한다.
+# 결과가 더 이상 바뀔 수 없으면(구조화 키 3줄 확보, 또는 간결한 형식이 나왔고 남은 줄로 구조화 3줄이 불가능)
+# 거기서 멈춘다. 데스크탑/모바일은 뒤에 간결한 형식 줄이 하나만 나와도 결과가 바뀌므로 끝까지 센다.
+
+FORMAT_SNIFF_LINES = 50           # 포맷 판단에 쓰는 선두 줄 수
+STRUCTURED_MIN_KEY_LINES = 3      # 구조화 형식으로 판단하는 최소 키-값 줄 수
+_SNIFF_HEAD_CHUNK_CHARS = 8192
+
+class FormatSniff(NamedTuple):
+    format: str               # 'asterisk' | 'structured' | 'compact' | 'desktop' | 'mobile' | 'unknown'
+    confidence: float         # 0~1: 판단 근거 줄 수 / 패턴에 맞은 줄 수 (asterisk는 1.0)
+    counts: Dict[str, int]    # 포맷별 맞은 줄 수
+    lines_examined: int
+
 def _is_asterisk_format(raw_text: str) -> bool:
     """
     새로운 ※ 표기 형식 메시지 감지.
@@ -324,132 +760,168 @@ def _is_asterisk_format(raw_text: str) -> bool:
         1. YYYY.MM.DD(요일) 패턴 존재 (예: 2026.05.09(토))
         2. ※ 마커 + 알려진 라벨(발주처/신부연락처/신랑연락처/특이사항) 존재
     """
-    has_date_with_weekday = bool(
-        re.search(r'\d{4}\.\d{2}\.\d{2}\s*\([일월화수목금토]\)', raw_text)
-    )
-    has_asterisk_field = bool(
-        re.search(r'※\s*(발주처|신부연락처|신랑연락처|특이사항)', raw_text)
-    )
-    return has_date_with_weekday and has_asterisk_field
-
-def detect_chat_format(raw_text: str) -> str:
+    # ※가 없으면 정규식 없이 바로 탈락 (대부분의 입력)
+    if '※' not in raw_text:
+        return False
+    return bool(ASTERISK_FIELD_RE.search(raw_text)) and bool(ASTERISK_DATE_WEEKDAY_RE.search(raw_text))
+
+def _head_lines(raw_text: str, count: int) -> List[str]:
+    """raw_text.splitlines()[:count] without splitting the whole text."""
+    size = _SNIFF_HEAD_CHUNK_CHARS
+    while True:
+        lines = raw_text[:size].splitlines()
+        # count+1 줄 이상이면 앞 count 줄은 잘리지 않은 완전한 줄
+        if len(lines) > count or size >= len(raw_text):
+            return lines[:count]
+        size *= 2
+
+def _decide_format(counts: Dict[str, int]) -> Tuple[str, int]:
+    """(format, number of lines supporting it) from per-format line counts."""
+    if counts['structured'] >= STRUCTURED_MIN_KEY_LINES:
+        return 'structured', counts['structured']
+    if counts['compact'] > 0:
+        return 'compact', counts['compact']
+    if counts['desktop'] > counts['mobile']:
+        return 'desktop', counts['desktop']
+    if counts['mobile'] > 0:
+        return 'mobile', counts['mobile']
+    return 'unknown', 0
+
+@profiled('detect_format')
+def sniff_chat_format(raw_text: str) -> FormatSniff:
     """
-    Detect if the chat log is from desktop, mobile, compact, structured, or asterisk format.
-    Returns 'desktop', 'mobile', 'compact', 'structured', 'asterisk', or 'unknown'.
+    Detect the chat format in one bounded pass over the first FORMAT_SNIFF_LINES lines.
+    Returns FormatSniff(format, confidence, per-format counts, lines examined).
     """
     # 새 ※ 형식이 가장 특징적이므로 최우선 감지
     if _is_asterisk_format(raw_text):
-        return 'asterisk'
-
-    lines = raw_text.splitlines()[:50]  # Check first 50 lines for format detection
-
-    desktop_pattern_count = 0
-    mobile_pattern_count = 0
-    compact_pattern_count = 0
-    structured_pattern_count = 0
+        return FormatSniff('asterisk', 1.0, {'asterisk': 1}, 0)
 
-    for line in lines:
+    counts = {'structured': 0, 'desktop': 0, 'mobile': 0, 'compact': 0}
+    lines = _head_lines(raw_text, FORMAT_SNIFF_LINES)
+    examined = 0
+    for examined, line in enumerate(lines, 1):
         line = line.strip()
         if not line:
             continue
+        match = FORMAT_SNIFF_RE.match(line)
+        if match:
+            counts[match.lastgroup] += 1
+            remaining = len(lines) - examined
+            if counts['structured'] >= STRUCTURED_MIN_KEY_LINES:
+                break
+            if counts['compact'] and counts['structured'] + remaining < STRUCTURED_MIN_KEY_LINES:
+                break
+    count_parse('sniffed_lines', examined)
 
-        # Structured format: key-value pairs like "예식일:", "식시간:", "신랑신부님:" etc
-        if re.search(r'^(예식일|식시간|예식장|신랑신부님?|사진업체|플래너|담당감독|상품|촬영범위|페이)\s*[:：]', line):
-            structured_pattern_count += 1
-
-        # Desktop format: [Speaker] [오전/오후 HH:MM] content
-        if re.search(r'^\[([^\]]+)\]\s*\[(오전|오후)\s*\d{1,2}:\d{2}\]', line):
-            desktop_pattern_count += 1
-
-        # Mobile format: YYYY년 MM월 DD일 오전/오후 HH:MM, Speaker : content
-        elif re.search(r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)\s*\d{1,2}:\d{2},\s*[^:]+\s*:', line):
-            mobile_pattern_count += 1
-
-        # Compact format patterns:
-        # 1. MM월 DD일 HH시 장소 신랑 신부 - 작가
-        # 2. MM월 DD일 HH시MM분 장소 신랑 신부 - 작가
-        # 3. MM월 DD일 HH:MM시 장소 신랑 신부 - 작가
-        # 4. 장소 HH시 (incomplete format)
-        # 5. 장소명 HH시MM분 (more incomplete)
-        elif (re.search(r'^\d{1,2}월\s*\d{1,2}일\s*\d{1,2}시(?:\d{1,2}분|:\d{2}시)?\s+.+\s+[가-힣]+\s+[가-힣]+\s*-\s*[가-힣]+\s*작가', line) or
-              re.search(r'^[가-힣\s"]+\s+\d{1,2}시(?:\d{1,2}분)?(?:\s+[가-힣\s]*)?$', line) or
-              re.search(r'^\d{1,2}월\d{1,2}일\s+[가-힣]+', line)):
-            compact_pattern_count += 1
-
-    # Structured format has highest priority if detected (needs at least 3 key-value pairs)
-    if structured_pattern_count >= 3:
-        return 'structured'
-    elif compact_pattern_count > 0:
-        return 'compact'
-    elif desktop_pattern_count > mobile_pattern_count:
-        return 'desktop'
-    elif mobile_pattern_count > 0:
-        return 'mobile'
-    else:
-        return 'unknown'
+    chat_format, supporting = _decide_format(counts)
+    matched = sum(counts.values())
+    confidence = round(supporting / matched, 3) if matched else 0.0
+    return FormatSniff(chat_format, confidence, counts, examined)
 
-def split_chat_by_speaker_desktop(raw_text: str) -> List[Tuple[str, str]]:
-    """Splits the desktop format chat log into blocks per speaker turn."""
-    speaker_blocks = []
+def detect_chat_format(raw_text: str) -> str:
+    """
+    Detect if the chat log is from desktop, mobile, compact, structured, or asterisk format.
+    Returns 'desktop', 'mobile', 'compact', 'structured', 'asterisk', or 'unknown'.
+    """
+    return sniff_chat_format(raw_text).format
+
+def iter_speaker_blocks_desktop(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yields (speaker, block) per desktop-format speaker turn as soon as the turn ends."""
     current_speaker = ""
     current_block = []
     # Desktop format: [Speaker] [오전/오후 HH:MM] content
-    speaker_line_re = re.compile(r'^\[([^\]]+)\]\s*\[(오전|오후)\s*\d{1,2}:\d{2}\]')
-
-    for line in raw_text.splitlines():
-        match = speaker_line_re.match(line)
+    for line in lines:
+        match = DESKTOP_SPEAKER_RE.match(line)
         if match:
-            # If a new speaker starts, save the previous block
+            # If a new speaker starts, emit the previous block
             if current_speaker and current_block:
-                speaker_blocks.append((current_speaker, "\n".join(current_block)))
+                yield current_speaker, "\n".join(current_block)
 
-            # Start a new block
-            current_speaker = match.group(1)
+            # Start a new block (화자 이름은 블록마다 반복되므로 intern해 하나만 남김)
+            current_speaker = sys.intern(match.group(1))
             # The actual content of the line is after the matched tag
             content_line = line[match.end():].strip()
             current_block = [content_line] if content_line else []
         elif current_speaker: # This is a multi-line message
             current_block.append(line.strip())
 
-    # Add the last block
+    # Emit the last block
     if current_speaker and current_block:
-        speaker_blocks.append((current_speaker, "\n".join(current_block)))
+        yield current_speaker, "\n".join(current_block)
 
-    return speaker_blocks
-
-def split_chat_by_speaker_mobile(raw_text: str) -> List[Tuple[str, str]]:
-    """Splits the mobile format chat log into blocks per speaker turn."""
-    speaker_blocks = []
+def iter_speaker_blocks_mobile(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yields (speaker, block) per mobile-format speaker turn as soon as the turn ends."""
     current_speaker = ""
     current_block = []
 
     # Mobile format: YYYY년 MM월 DD일 오전/오후 HH:MM, Speaker : content
-    speaker_line_re = re.compile(r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*(오전|오후)\s*\d{1,2}:\d{2},\s*([^:]+)\s*:\s*(.*)')
-
-    for line in raw_text.splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             continue
 
-        match = speaker_line_re.match(line)
+        match = MOBILE_SPEAKER_RE.match(line)
         if match:
-            # If a new speaker starts, save the previous block
+            # If a new speaker starts, emit the previous block
             if current_speaker and current_block:
-                speaker_blocks.append((current_speaker, "\n".join(current_block)))
+                yield current_speaker, "\n".join(current_block)
 
             # Start a new block
-            current_speaker = match.group(2).strip()
+            current_speaker = sys.intern(match.group(2).strip())
             content_line = match.group(3).strip()
             current_block = [content_line] if content_line else []
         elif current_speaker: # This is a multi-line message
             current_block.append(line)
 
-    # Add the last block
+    # Emit the last block
     if current_speaker and current_block:
-        speaker_blocks.append((current_speaker, "\n".join(current_block)))
+        yield current_speaker, "\n".join(current_block)
+
+# 수십만 줄짜리 내보내기에서 raw_text.splitlines()는 모든 줄 문자열을 한꺼번에 만들어 피크 메모리를 키운다.
+# '\n' 경계에서 자른 조각 단위로 나누면 결과는 같고 살아 있는 줄은 한 조각 분량뿐이다.
+_SPLITLINES_CHUNK_CHARS = 1 << 20
+
+def iter_splitlines(raw_text: str, chunk_chars: int = _SPLITLINES_CHUNK_CHARS) -> Iterator[str]:
+    """Same lines as raw_text.splitlines(), produced one chunk at a time."""
+    start = 0
+    while start < len(raw_text):
+        # '\n' 바로 뒤에서 자르므로 '\r\n'이 갈라지거나 빈 줄이 생기거나 사라지지 않는다
+        end = raw_text.find('\n', start + chunk_chars)
+        end = len(raw_text) if end < 0 else end + 1
+        yield from raw_text[start:end].splitlines()
+        start = end
 
-    return speaker_blocks
+def split_chat_by_speaker_desktop(raw_text: str) -> List[Tuple[str, str]]:
+    """Splits the desktop format chat log into blocks per speaker turn."""
+    return list(iter_speaker_blocks_desktop(iter_splitlines(raw_text)))
 
+def split_chat_by_speaker_mobile(raw_text: str) -> List[Tuple[str, str]]:
+    """Splits the mobile format chat log into blocks per speaker turn."""
+    return list(iter_speaker_blocks_mobile(iter_splitlines(raw_text)))
+
+def parse_compact_line(line: str, current_year: int) -> Optional[Schedule]:
+    """Parse one compact-format line (패턴 1-3) with the combined pattern; None if it does not match."""
+    schedule_match = COMPACT_SCHEDULE_RE.match(line)
+    if not schedule_match:
+        return None
+
+    month = int(schedule_match.group('month'))
+    day = int(schedule_match.group('day'))
+    hour = int(schedule_match.group('hour'))
+    minute = int(schedule_match.group('minute') or schedule_match.group('colon_minute') or 0)
+
+    return Schedule(
+        date=f"{current_year}.{month:02d}.{day:02d}",
+        location=clean_location(schedule_match.group('location').strip()),
+        time=f"{hour:02d}:{minute:02d}",
+        couple=f"{schedule_match.group('groom').strip()} {schedule_match.group('bride').strip()}",
+        photographer=schedule_match.group('photographer').strip(),
+        manager="", brand="", album="", contact="", memo="", needs_review=True,
+        review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
+    )
+
+@profiled('parse_compact')
 def parse_compact_format(raw_text: str) -> List[Schedule]:
     """
     Parse compact format messages like:
@@ -463,107 +935,17 @@ def parse_compact_format(raw_text: str) -> List[Schedule]:
     schedules = []
     lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
 
-    current_month = None
     current_year = datetime.now().year  # 기본적으로 현재 연도 사용
 
     for line in lines:
-        # 월 헤더 감지 (예: "10월")
-        month_match = re.match(r'^(\d{1,2})월$', line)
-        if month_match:
-            current_month = int(month_match.group(1))
-            continue
-
-        # 패턴 1: MM월 DD일 HH시MM분 장소 신랑 신부 - 작가 (분 단위 포함)
-        schedule_match = re.match(
-            r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시(\d{1,2})분\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-            line
-        )
-        if schedule_match:
-            month = int(schedule_match.group(1))
-            day = int(schedule_match.group(2))
-            hour = int(schedule_match.group(3))
-            minute = int(schedule_match.group(4))
-            location = schedule_match.group(5).strip()
-            groom = schedule_match.group(6).strip()
-            bride = schedule_match.group(7).strip()
-            photographer = schedule_match.group(8).strip()
-
-            if current_month is None:
-                current_month = month
-
-            date = f"{current_year}.{month:02d}.{day:02d}"
-            time = f"{hour:02d}:{minute:02d}"
-            couple = f"{groom} {bride}"
-
-            schedule = Schedule(
-                date=date, location=clean_location(location), time=time, couple=couple,
-                photographer=photographer, manager="", brand="", album="",
-                contact="", memo="", needs_review=True,
-                review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-            )
-            schedules.append(schedule)
-            continue
-
-        # 패턴 2: MM월 DD일 HH:MM시 장소 신랑 신부 - 작가 (콜론 형태)
-        schedule_match = re.match(
-            r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2}):(\d{2})시\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-            line
-        )
-        if schedule_match:
-            month = int(schedule_match.group(1))
-            day = int(schedule_match.group(2))
-            hour = int(schedule_match.group(3))
-            minute = int(schedule_match.group(4))
-            location = schedule_match.group(5).strip()
-            groom = schedule_match.group(6).strip()
-            bride = schedule_match.group(7).strip()
-            photographer = schedule_match.group(8).strip()
-
-            if current_month is None:
-                current_month = month
-
-            date = f"{current_year}.{month:02d}.{day:02d}"
-            time = f"{hour:02d}:{minute:02d}"
-            couple = f"{groom} {bride}"
-
-            schedule = Schedule(
-                date=date, location=clean_location(location), time=time, couple=couple,
-                photographer=photographer, manager="", brand="", album="",
-                contact="", memo="", needs_review=True,
-                review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-            )
-            schedules.append(schedule)
+        # 월 헤더 (예: "10월")는 건너뜀 — 각 줄에 월이 있으므로 쓰지 않는다
+        if MONTH_HEADER_RE.match(line):
             continue
 
-        # 패턴 3: MM월 DD일 HH시 장소 신랑 신부 - 작가 (기본 형태)
-        schedule_match = re.match(
-            r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-            line
-        )
-        if schedule_match:
-            month = int(schedule_match.group(1))
-            day = int(schedule_match.group(2))
-            hour = int(schedule_match.group(3))
-            location = schedule_match.group(4).strip()
-            groom = schedule_match.group(5).strip()
-            bride = schedule_match.group(6).strip()
-            photographer = schedule_match.group(7).strip()
-
-            if current_month is None:
-                current_month = month
-
-            date = f"{current_year}.{month:02d}.{day:02d}"
-            time = f"{hour:02d}:00"
-            couple = f"{groom} {bride}"
-
-            schedule = Schedule(
-                date=date, location=clean_location(location), time=time, couple=couple,
-                photographer=photographer, manager="", brand="", album="",
-                contact="", memo="", needs_review=True,
-                review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-            )
+        # 패턴 1-3: MM월 DD일 HH시[MM분|:MM시] 장소 신랑 신부 - 작가
+        schedule = parse_compact_line(line, current_year)
+        if schedule:
             schedules.append(schedule)
-            continue
 
     return schedules
 
@@ -589,19 +971,19 @@ def _parse_single_asterisk_block(block_text: str) -> Optional[Schedule]:
 
     # 1행: 날짜 + 시간 (예: "2026.05.09(토)  11시10분")
     first_line = lines[0]
-    date_match = re.search(r'(\d{4}\.\d{2}\.\d{2})', first_line)
+    date_match = DATE_RE.search(first_line)
     if not date_match:
         return None
     sch.date = date_match.group(1)
 
     # 시간: "11시10분" 또는 "11시" (분 생략 가능)
-    time_with_minute = re.search(r'(\d{1,2})시\s*(\d{1,2})분', first_line)
+    time_with_minute = HOUR_MINUTE_KOREAN_RE.search(first_line)
     if time_with_minute:
         hour = int(time_with_minute.group(1))
         minute = int(time_with_minute.group(2))
         sch.time = f"{hour:02d}:{minute:02d}"
     else:
-        time_only = re.search(r'(\d{1,2})시', first_line)
+        time_only = HOUR_KOREAN_RE.search(first_line)
         if time_only:
             sch.time = f"{int(time_only.group(1)):02d}:00"
 
@@ -623,7 +1005,7 @@ def _parse_single_asterisk_block(block_text: str) -> Optional[Schedule]:
 
     if len(info_lines) >= 2:
         # "김경현, 최슬기" → "김경현 최슬기"
-        couple_raw = re.sub(r'\s+', ' ', info_lines[1].replace(',', ' ').strip())
+        couple_raw = WHITESPACE_RE.sub(' ', info_lines[1].replace(',', ' ').strip())
         if is_valid_couple(couple_raw):
             sch.couple = separate_couple_names(couple_raw)
 
@@ -640,19 +1022,19 @@ def _parse_single_asterisk_block(block_text: str) -> Optional[Schedule]:
     for line in asterisk_lines:
         content = line.lstrip('※').strip()
 
-        contact_m = re.match(r'(?:신부|신랑)?연락처\s*[:：]\s*(.+)', content)
+        contact_m = ASTERISK_CONTACT_RE.match(content)
         if contact_m:
             contact = parse_contact(contact_m.group(1))
             if contact:
                 sch.contact = contact
             continue
 
-        manager_m = re.match(r'발주처\s*[:：]\s*(.+)', content)
+        manager_m = ASTERISK_MANAGER_RE.match(content)
         if manager_m:
             sch.manager = manager_m.group(1).strip()
             continue
 
-        memo_m = re.match(r'특이사항\s*[:：]\s*(.+)', content)
+        memo_m = ASTERISK_MEMO_RE.match(content)
         if memo_m:
             memo_parts.append(memo_m.group(1).strip())
             continue
@@ -683,6 +1065,7 @@ def _parse_single_asterisk_block(block_text: str) -> Optional[Schedule]:
 
     return sch
 
+@profiled('parse_asterisk')
 def parse_asterisk_format(raw_text: str) -> List[Schedule]:
     """
     ※ 표기를 사용하는 새로운 거래처 메시지 포맷 파싱.
@@ -694,24 +1077,13 @@ def parse_asterisk_format(raw_text: str) -> List[Schedule]:
     """
     schedules = []
 
-    # 데스크탑 카카오톡 발신자 헤더 ('[KPAG(업무용)] [오후 2:44] ')
-    speaker_header_re = re.compile(
-        r'\[[^\]]+\]\s*\[(?:오전|오후)\s*\d{1,2}:\d{2}\]\s*'
-    )
-
-    # 새 블록의 시작 위치: 라인 시작의 'YYYY.MM.DD(요일)'
-    date_start_re = re.compile(
-        r'^\d{4}\.\d{2}\.\d{2}\s*\([일월화수목금토]\)',
-        re.MULTILINE
-    )
-
     # 1차 분리: 'ㅡㅡㅡ' 구분자 (기존 호환)
-    for coarse in re.split(r'ㅡ{3,}', raw_text):
-        # 발신자 헤더 제거 → 날짜 라인이 라인 시작에 노출되도록
-        coarse = speaker_header_re.sub('', coarse)
+    for coarse in ASTERISK_SEPARATOR_RE.split(raw_text):
+        # 발신자 헤더('[KPAG(업무용)] [오후 2:44] ') 제거 → 날짜 라인이 라인 시작에 노출되도록
+        coarse = ASTERISK_SPEAKER_HEADER_RE.sub('', coarse)
 
-        # 2차 분리: 날짜 시작 위치 기준
-        starts = [m.start() for m in date_start_re.finditer(coarse)]
+        # 2차 분리: 라인 시작의 'YYYY.MM.DD(요일)' 위치 기준
+        starts = [m.start() for m in ASTERISK_BLOCK_START_RE.finditer(coarse)]
         if not starts:
             continue
 
@@ -726,6 +1098,7 @@ def parse_asterisk_format(raw_text: str) -> List[Schedule]:
 
     return schedules
 
+@profiled('parse_structured')
 def parse_structured_format(raw_text: str) -> List[Schedule]:
     """
     범용 구조화된 형식 파서 - 모든 키-값 쌍을 추출하여 처리
@@ -754,7 +1127,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     # 모든 라인을 순회하며 키-값 쌍 추출 (범용 패턴)
     for line in lines:
         # 범용 키-값 패턴: "한글단어: 값" (섹션 헤더 제외)
-        key_value_match = re.match(r'^([가-힣a-zA-Z0-9\s]+)\s*[:：]\s*(.*)$', line)
+        key_value_match = KEY_VALUE_RE.match(line)
 
         # 섹션 헤더 제외 ([제목] 형식)
         if line.startswith('['):
@@ -800,7 +1173,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     for key in ['예식일', '날짜']:
         if key in data:
             date_text = data[key]
-            date_match = re.search(r'(\d{4})[.\-](\d{1,2})[.\-](\d{1,2})', date_text)
+            date_match = STRUCTURED_DATE_RE.search(date_text)
             if date_match:
                 year, month, day = date_match.groups()
                 schedule.date = f"{year}.{int(month):02d}.{int(day):02d}"
@@ -811,7 +1184,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     for key in ['식시간', '시간']:
         if key in data:
             time_text = data[key]
-            time_match = re.search(r'(\d{1,2}):(\d{2})', time_text)
+            time_match = STRUCTURED_TIME_RE.search(time_text)
             if time_match:
                 hour, minute = time_match.groups()
                 schedule.time = f"{int(hour):02d}:{int(minute):02d}"
@@ -829,7 +1202,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     for key in ['신랑신부님', '신랑신부']:
         if key in data:
             couple_text = data[key].replace('&', ' ').strip()
-            names = re.findall(r'[가-힣]{2,4}', couple_text)
+            names = HANGUL_NAME_RE.findall(couple_text)
             if len(names) >= 2:
                 schedule.couple = f"{names[0]} {names[1]}"
             elif len(names) == 1:
@@ -855,7 +1228,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     for key in ['컷수', '컷']:
         if key in data:
             cuts_text = data[key]
-            cuts_match = re.search(r'(\d+)', cuts_text)
+            cuts_match = NUMBER_RE.search(cuts_text)
             if cuts_match:
                 schedule.cuts = int(cuts_match.group(1))
                 mapped_keys.add(key)
@@ -878,8 +1251,8 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
         else:
             # 앨범 패턴이 있으면 분리
             album_found = False
-            for pattern in ALBUM_PATTERNS:
-                album_match = re.search(pattern, product_text, re.IGNORECASE)
+            for pattern in ALBUM_RES:
+                album_match = pattern.search(product_text)
                 if album_match:
                     schedule.album = album_match.group(0).upper()
                     # 브랜드는 앨범을 제외한 나머지
@@ -895,7 +1268,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
     for key in ['페이', '촬영비', '금액']:
         if key in data:
             price_text = data[key]
-            price_match = re.search(r'(\d+)', price_text)
+            price_match = NUMBER_RE.search(price_text)
             if price_match:
                 price_value = int(price_match.group(1))
                 # 페이는 만원 단위 (페이: 25 -> 250000)
@@ -923,9 +1296,9 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
         if key in data:
             manager_text = data[key]
             # 연락처 제거
-            manager_text = re.sub(r'010[- .]?\d{4}[- .]?\d{4}', '', manager_text)
+            manager_text = CONTACT_RE.sub('', manager_text)
             # 괄호 내용 제거
-            manager_text = re.sub(r'\([^)]*\)', '', manager_text)
+            manager_text = remove_parenthesized(manager_text)
             schedule.manager = manager_text.strip()
             mapped_keys.add(key)
             break
@@ -950,8 +1323,7 @@ def parse_structured_format(raw_text: str) -> List[Schedule]:
             memo_parts.append(f"{key}: {value}")
 
     # 2. 섹션 내용 추출 ([신부님 전달사항], [식순], [촬영 요구사항] 등)
-    section_pattern = r'\[(.*?)\](.*?)(?=\[|$)'
-    sections = re.findall(section_pattern, raw_text, re.DOTALL)
+    sections = SECTION_RE.findall(raw_text)
     for section_title, section_content in sections:
         section_title = section_title.strip()
         section_content = section_content.strip()
@@ -1101,30 +1473,20 @@ def extract_schedule_components(text: str) -> Dict[str, Any]:
     }
 
     # 📅 날짜 추출
-    date_patterns = [
-        r'(\d{1,2})월(\d{1,2})일',  # MM월DD일
-        r'(\d{4})[-./](\d{1,2})[-./](\d{1,2})',  # YYYY-MM-DD
-        r'(\d{1,2})[-./](\d{1,2})'  # MM-DD
-    ]
-    for pattern in date_patterns:
-        match = re.search(pattern, text)
+    for pattern in FLEX_DATE_RES:
+        match = pattern.search(text)
         if match:
             components['date'] = match.group(0)
             break
 
     # 📆 요일 추출
-    weekday_match = re.search(r'([가-힣]요일?)', text)
+    weekday_match = FLEX_WEEKDAY_RE.search(text)
     if weekday_match:
         components['weekday'] = weekday_match.group(1)
 
     # ⏰ 시간 추출
-    time_patterns = [
-        r'(\d{1,2}):(\d{2})',  # HH:MM
-        r'(\d{1,2})시(\d{1,2})분',  # HH시MM분
-        r'(\d{1,2})시(?!간)',  # HH시 (시간이 아닌 경우)
-    ]
-    for pattern in time_patterns:
-        match = re.search(pattern, text)
+    for pattern in FLEX_TIME_RES:
+        match = pattern.search(text)
         if match:
             if len(match.groups()) == 2:
                 hour, minute = match.groups()
@@ -1135,21 +1497,15 @@ def extract_schedule_components(text: str) -> Dict[str, Any]:
             break
 
     # 🏢 장소 추출 (한글 장소명)
-    venue_patterns = [
-        r'([가-힣]{2,}(?:호텔|센터|컨벤션|웨딩홀|교회|성당|예식장|리조트|펜션))',
-        r'([가-힣]{2,}(?:메르시앙|그랜드|조선|롯데|신라|하얏트|힐튼))',
-        r'([가-힣]+(?:\s*["\']?[a-zA-Z0-9가-힣]+["\']?)?(?:홀|룸|관|동))',
-    ]
-    for pattern in venue_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in FLEX_VENUE_RES:
+        matches = pattern.findall(text)
         if matches:
             components['location'] = matches[0]
             break
 
     # 🏢 지역명 기반 장소 추출
     if not components['location']:
-        location_pattern = r'(김해|창원|부산|해운대|센텀|광주|대구|서울|인천|대전)(?:\s*[가-힣]*)?'
-        location_match = re.search(location_pattern, text)
+        location_match = FLEX_REGION_RE.search(text)
         if location_match:
             components['location'] = location_match.group(0).strip()
 
@@ -1162,19 +1518,14 @@ def extract_schedule_components(text: str) -> Dict[str, Any]:
                 break
 
     # 👥 인명 추출 (한글 2-4글자)
-    name_patterns = [
-        r'([가-힣]{2,4})\s+([가-힣]{2,4})\s*-\s*([가-힣]+)\s*작가',  # 신랑 신부 - 작가
-        r'([가-힣]{2,4})',  # 일반적인 한글 이름
-    ]
-
     # 작가 패턴 우선 확인
-    photographer_match = re.search(r'([가-힣]+)\s*작가', text)
+    photographer_match = FLEX_PHOTOGRAPHER_RE.search(text)
     if photographer_match:
         components['photographer'] = photographer_match.group(1)
 
     # 일반 이름들 추출
     names = []
-    for name_match in re.finditer(r'[가-힣]{2,4}', text):
+    for name_match in HANGUL_NAME_RE.finditer(text):
         name = name_match.group(0)
         # 일반적이지 않은 단어들 제외
         if name not in ['스케줄', '촬영', '연락', '출장비', '만원', '추가', '입니다', '있으면', '주세요', '가능']:
@@ -1194,7 +1545,7 @@ def format_date_to_standard(date_str: str, current_year: int) -> str:
                 month, day = date_clean.split()
             else:
                 # 11월29일 같은 형식에서 숫자 분리
-                match = re.match(r'(\d{1,2})(\d{1,2})$', date_clean)
+                match = MONTH_DAY_DIGITS_RE.match(date_clean)
                 if match and len(date_clean) <= 4:
                     month, day = match.groups()
                 else:
@@ -1205,7 +1556,7 @@ def format_date_to_standard(date_str: str, current_year: int) -> str:
 
         # YYYY-MM-DD 또는 MM-DD 형식
         elif '-' in date_str or '.' in date_str or '/' in date_str:
-            parts = re.split(r'[-./]', date_str)
+            parts = DATE_SEPARATOR_RE.split(date_str)
             if len(parts) == 3:
                 return f"{parts[0]}.{int(parts[1]):02d}.{int(parts[2]):02d}"
             elif len(parts) == 2:
@@ -1215,12 +1566,14 @@ def format_date_to_standard(date_str: str, current_year: int) -> str:
 
     return ""
 
-def split_chat_by_speaker(raw_text: str) -> List[Tuple[str, str]]:
+@profiled('split_speakers')
+def split_chat_by_speaker(raw_text: str, chat_format: Optional[str] = None) -> List[Tuple[str, str]]:
     """
     Splits the raw chat log into blocks per speaker turn.
-    Automatically detects format (desktop/mobile) and uses appropriate parser.
+    Automatically detects format (desktop/mobile) unless the caller already sniffed it, and uses appropriate parser.
     """
-    chat_format = detect_chat_format(raw_text)
+    if chat_format is None:
+        chat_format = detect_chat_format(raw_text)
 
     if chat_format == 'compact':
         # Compact format doesn't have speakers, return empty list
@@ -1233,29 +1586,15 @@ def split_chat_by_speaker(raw_text: str) -> List[Tuple[str, str]]:
         # Fallback to desktop format for backward compatibility
         return split_chat_by_speaker_desktop(raw_text)
 
+@profiled('find_manager')
 def find_manager_speaker(speaker_blocks: List[Tuple[str, str]]) -> str:
     """Find the most likely manager speaker by analyzing content patterns."""
     # Look for speakers with schedule-like content (dates, venues, etc.)
+    # 줄별 가중치(날짜 3, 시간/브랜드 2, 장소 힌트 1)는 classify_line이 계산
     speaker_schedule_counts = {}
 
     for speaker, content in speaker_blocks:
-        schedule_indicators = 0
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            # Count date patterns
-            if re.match(r'^\d{4}\.\d{2}\.\d{2}$', line):
-                schedule_indicators += 3  # High weight for dates
-            # Count time patterns
-            elif re.match(r'^\d{2}:\d{2}$', line):
-                schedule_indicators += 2  # Medium weight for times
-            # Count brand patterns
-            elif any(re.search(pattern, line) for pattern in BRAND_PATTERNS):
-                schedule_indicators += 2  # Medium weight for brands
-            # Count location-like patterns (contains 홀, 층, etc.)
-            elif any(keyword in line for keyword in ['홀', '층', '컨벤션', '웨딩', '더']):
-                schedule_indicators += 1  # Low weight for venues
+        schedule_indicators = sum(classify_line(line).score for line in content.split('\n'))
 
         if schedule_indicators > 0:
             speaker_schedule_counts[speaker] = schedule_indicators
@@ -1267,22 +1606,115 @@ def find_manager_speaker(speaker_blocks: List[Tuple[str, str]]) -> str:
     # Fallback to MANAGER_NAME if no clear manager found
     return MANAGER_NAME
 
+def _schedule_start_indices(tokens: List[LineToken]) -> List[int]:
+    """Indices of tokens that start a 4-line core block (lines containing a date)."""
+    return [i for i, token in enumerate(tokens) if token.date]
+
+def _parse_core_schedule(schedule_tokens: List[LineToken]) -> Optional[Schedule]:
+    """
+    Parse one schedule from its tokens: the 4-line core (date, location, time, couple)
+    followed by contact/brand/photographer lines, memo lines and the manager on the last line.
+    Returns None if the core block is invalid.
+    """
+    if len(schedule_tokens) < 4:
+        return None
+
+    # Core 4-line block validation
+    date_token, location_token, time_token, couple_token = schedule_tokens[:4]
+    if not (date_token.date and time_token.is_time and couple_token.is_couple):
+        return None
+
+    # 신랑신부 이름 분리 처리
+    separated_couple = separate_couple_names(couple_token.text)
+    # 장소/담당자는 종류가 몇 개뿐인데 줄마다 새 문자열이 생기므로 intern해 결과 스케줄들이 한 객체를 공유
+    sch = Schedule(date=date_token.date, location=sys.intern(clean_location(location_token.text)),
+                   time=time_token.text, couple=separated_couple)
+
+    # Subtractive parsing on the rest of the lines
+    remaining = schedule_tokens[4:]
+    processed_indices = set()
+
+    if remaining:
+        sch.manager = remaining.pop(-1).text
+        # Standardize contractor names
+        if '그랜드 블랑' in sch.manager:
+            sch.manager = sch.manager.replace('그랜드 블랑', '그랜드블랑')
+        sch.manager = sys.intern(sch.manager)
+
+    # First, check for contact number in the first line only (right after couple names)
+    if remaining and remaining[0].contact:
+        sch.contact = remaining[0].contact
+        processed_indices.add(0)
+
+    j = 0
+    while j < len(remaining):
+        token = remaining[j]
+        is_known_pattern = False
+
+        # Skip contact parsing since we already handled it above
+        if j == 0 and sch.contact:
+            is_known_pattern = True
+
+        if token.brand or token.album:
+            if token.brand: sch.brand = token.brand
+            if token.album: sch.album = token.album
+            processed_indices.add(j); is_known_pattern = True
+
+        # Photographer name (contact and role info already stripped by the classifier)
+        if token.photographer:
+            photographers = [token.photographer]
+            processed_indices.add(j); is_known_pattern = True
+
+            # Check next line for additional photographer
+            if (j + 1) < len(remaining) and remaining[j + 1].photographer:
+                photographers.append(remaining[j + 1].photographer)
+                processed_indices.add(j + 1)
+                j += 1  # Skip next line since we processed it
+
+            sch.photographer = ", ".join(photographers)
+
+        # Only mark as needs_review if line is not empty and not a known pattern
+        # We'll handle comments content separately
+        if not is_known_pattern and token.text:
+            sch.needs_review = True
+            if not sch.review_reason:
+                sch.review_reason = "알 수 없는 내용"
+
+        j += 1
+
+    # Create comments from unprocessed lines
+    sch.memo = "\n".join(remaining[k].text for k in range(len(remaining)) if k not in processed_indices).strip()
+
+    # If we have comments content, it means there were unprocessed lines
+    # Reset needs_review to False since comments content is intentional
+    if sch.memo:
+        sch.needs_review = False
+        sch.review_reason = ""
+
+    # Mark for review if critical fields are missing
+    missing_fields = []
+    if not sch.brand: missing_fields.append("브랜드")
+    if not sch.album: missing_fields.append("앨범")
+    if not sch.photographer: missing_fields.append("작가")
+    if not sch.manager: missing_fields.append("계약자")
+
+    if missing_fields:
+        sch.needs_review = True
+        sch.review_reason = f"필수 필드 누락: {', '.join(missing_fields)}"
+
+    # 촬영단가 자동 계산 (파싱할 때만)
+    if sch.brand and sch.album and sch.date:
+        sch.price = calculate_price(sch.brand, sch.album, sch.date)
+
+    return sch
+
 def parse_manager_block(block_text: str) -> List[Schedule]:
     """Parses a single text block from the manager, which might contain multiple schedules."""
     schedules = []
-    current_year = datetime.now().year  # NLP 파서용 현재 연도
-    lines = [line.strip() for line in block_text.splitlines() if line.strip() and not line.startswith('---')]
-    
-    # Find all schedule start indices (line 1 of the 4-line core)
-    start_indices = []
-    for i, line in enumerate(lines):
-        if is_valid_date(line):
-            start_indices.append(i)
-            # Extract and use the clean date
-            clean_date = extract_date(line)
-            if clean_date:
-                lines[i] = clean_date
+    tokens = tokenize_block(block_text)
 
+    # Find all schedule start indices (line 1 of the 4-line core)
+    start_indices = _schedule_start_indices(tokens)
 
     # 일반적인 스케줄 패턴이 없으면 빈 결과 반환
     if not start_indices:
@@ -1290,132 +1722,41 @@ def parse_manager_block(block_text: str) -> List[Schedule]:
 
     for i, start_idx in enumerate(start_indices):
         # Determine the end of the current schedule block
-        end_idx = start_indices[i+1] if (i + 1) < len(start_indices) else len(lines)
-        schedule_lines = lines[start_idx:end_idx]
-
-        if len(schedule_lines) < 4: continue
-
-        # Core 4-line block validation
-        date, location, time, couple = schedule_lines[0], schedule_lines[1], schedule_lines[2], schedule_lines[3]
-        if not (is_valid_date(date) and is_valid_time(time) and is_valid_couple(couple)):
-            continue
-
-        # 신랑신부 이름 분리 처리
-        separated_couple = separate_couple_names(couple)
-        sch = Schedule(date=date, location=clean_location(location), time=time, couple=separated_couple)
-        
-        # Subtractive parsing on the rest of the lines
-        remaining_lines = schedule_lines[4:]
-        processed_indices = set()
-
-        if remaining_lines:
-            sch.manager = remaining_lines.pop(-1).strip()
-            # Standardize contractor names
-            if '그랜드 블랑' in sch.manager:
-                sch.manager = sch.manager.replace('그랜드 블랑', '그랜드블랑')
-
-        # First, check for contact number in the first line only (right after couple names)
-        if remaining_lines:
-            contact = parse_contact(remaining_lines[0])
-            if contact:
-                sch.contact = contact
-                processed_indices.add(0)
-
-        j = 0
-        while j < len(remaining_lines):
-            line = remaining_lines[j]
-            is_known_pattern = False
-
-            # Skip contact parsing since we already handled it above
-            if j == 0 and sch.contact:
-                is_known_pattern = True
-
-            brand, album = parse_brand_album(line)
-            if brand or album:
-                if brand: sch.brand = brand
-                if album: sch.album = album
-                processed_indices.add(j); is_known_pattern = True
-
-            # Extract photographer name by removing contact and role info
-            name_part = re.sub(r'010[- .]?\d{4}[- .]?\d{4}', '', line).strip()
-            name_part = re.sub(r'\([^)]*\)', '', name_part).strip()  # Remove parentheses content like (메인), (서브)
-            name_part = re.sub(r'‭|‬', '', name_part).strip()  # Remove invisible characters
-
-            if is_valid_photographer_name(name_part):
-                photographers = [name_part]
-                processed_indices.add(j); is_known_pattern = True
-
-                # Check next line for additional photographer
-                if (j + 1) < len(remaining_lines):
-                    next_line = remaining_lines[j+1]
-                    next_name_part = re.sub(r'010[- .]?\d{4}[- .]?\d{4}', '', next_line).strip()
-                    next_name_part = re.sub(r'\([^)]*\)', '', next_name_part).strip()
-                    next_name_part = re.sub(r'‭|‬', '', next_name_part).strip()
-
-                    if is_valid_photographer_name(next_name_part):
-                        photographers.append(next_name_part)
-                        processed_indices.add(j + 1)
-                        j += 1  # Skip next line since we processed it
-
-                sch.photographer = ", ".join(photographers)
-                is_known_pattern = True
-
-            # Only mark as needs_review if line is not empty and not a known pattern
-            # We'll handle comments content separately
-            if not is_known_pattern and line.strip():
-                sch.needs_review = True
-                if not sch.review_reason:
-                    sch.review_reason = "알 수 없는 내용"
-
-            j += 1
-
-        # Create comments from unprocessed lines
-        sch.memo = "\n".join(remaining_lines[k] for k in range(len(remaining_lines)) if k not in processed_indices).strip()
-
-        # If we have comments content, it means there were unprocessed lines
-        # Reset needs_review to False since comments content is intentional
-        if sch.memo:
-            sch.needs_review = False
-            sch.review_reason = ""
-
-        # Mark for review if critical fields are missing
-        missing_fields = []
-        if not sch.brand: missing_fields.append("브랜드")
-        if not sch.album: missing_fields.append("앨범")
-        if not sch.photographer: missing_fields.append("작가")
-        if not sch.manager: missing_fields.append("계약자")
-
-        if missing_fields:
-            sch.needs_review = True
-            sch.review_reason = f"필수 필드 누락: {', '.join(missing_fields)}"
-
-        # 촬영단가 자동 계산 (파싱할 때만)
-        if sch.brand and sch.album and sch.date:
-            sch.price = calculate_price(sch.brand, sch.album, sch.date)
-
-        schedules.append(sch)
+        end_idx = start_indices[i+1] if (i + 1) < len(start_indices) else len(tokens)
+        sch = _parse_core_schedule(tokens[start_idx:end_idx])
+        if sch:
+            schedules.append(sch)
 
     return schedules
 
 def get_schedule_completeness_score(schedule: Schedule) -> int:
     """Calculate completeness score for data integrity comparison."""
+    return get_schedule_dict_score(schedule.to_dict())
+
+def get_schedule_dict_score(data: Dict) -> int:
+    """
+    Completeness score of a schedule dict (to_dict() result).
+    dict에서 바로 계산하므로 Schedule 필드에 없는 키(구조화 형식의 cuts 등)가 있어도 된다.
+    """
     score = 0
+    get = data.get
 
     # Core fields (must exist for basic validity)
-    if schedule.date and extract_date(schedule.date): score += 10
-    if schedule.location: score += 5
-    if schedule.time and is_valid_time(schedule.time): score += 10
-    if schedule.couple and is_valid_couple(schedule.couple): score += 10
+    date, time, couple, contact = get('date'), get('time'), get('couple'), get('contact')
+    if date and classify_line(date).date: score += 10
+    if get('location'): score += 5
+    if time and classify_line(time).is_time: score += 10
+    if couple and classify_line(couple).is_couple: score += 10
 
     # Critical fields for business logic
-    if schedule.brand: score += 8
-    if schedule.album: score += 8
-    if schedule.photographer: score += 8
-    if schedule.manager: score += 8
+    if get('brand'): score += 8
+    if get('album'): score += 8
+    if get('photographer'): score += 8
+    if get('manager'): score += 8
 
     # Optional but valuable fields
-    if schedule.contact and parse_contact(schedule.contact): score += 5
-    if schedule.memo: score += 2
+    if contact and classify_line(contact).contact: score += 5
+    if get('memo'): score += 2
 
     return score
 
@@ -1424,8 +1765,15 @@ def is_better_schedule(existing: Schedule, new: Schedule) -> bool:
     Determine if new schedule is better than existing one.
     Returns True if new schedule should replace existing one.
     """
-    existing_score = get_schedule_completeness_score(existing)
-    new_score = get_schedule_completeness_score(new)
+    return _is_better_rank(
+        (get_schedule_completeness_score(existing), existing.needs_review),
+        (get_schedule_completeness_score(new), new.needs_review),
+    )
+
+def _is_better_rank(existing: Tuple[int, bool], new: Tuple[int, bool]) -> bool:
+    """is_better_schedule on precomputed (completeness score, needs_review) pairs."""
+    existing_score, existing_review = existing
+    new_score, new_review = new
 
     # If new schedule has significantly higher completeness, use it
     if new_score > existing_score:
@@ -1433,16 +1781,106 @@ def is_better_schedule(existing: Schedule, new: Schedule) -> bool:
 
     # If scores are equal, prefer the one without needs_review flag
     if new_score == existing_score:
-        if existing.needs_review and not new.needs_review:
+        if existing_review and not new_review:
             return True
         # If both have same review status, prefer the new one (latest wins for ties)
-        if existing.needs_review == new.needs_review:
+        if existing_review == new_review:
             return True
         return False
 
     # If new score is lower, keep existing
     return False
 
+def schedule_key(sch: Schedule) -> str:
+    """Deduplication key shared by every parse entry point."""
+    return f"{sch.date}-{sch.time}-{sch.couple}"
+
+def schedule_dict_key(data: Dict) -> str:
+    """schedule_key of a schedule dict (파싱 결과 dict를 Schedule로 되돌리지 않고 병합할 때)."""
+    return f"{data.get('date', '')}-{data.get('time', '')}-{data.get('couple', '')}"
+
+# --- Price Table ---
+# 단가는 (정규화된 브랜드, 앨범 페이지 구간, 기간)으로 정해지는 표 조회다.
+# 기간은 PRICE_CUTOFFS(YYYYMMDD 정수) 기준으로 나누며, 각 행은 기간별 단가 튜플.
+# 브랜드/앨범/날짜 문자열 → 키 변환은 LRU 캐시로 문자열마다 한 번만 계산한다.
+
+PRICE_CUTOFFS = (20250901,)  # 2025.09.01 단가 변경
+
+ALBUM_BUCKET_30 = '30'       # 30P 이하
+ALBUM_BUCKET_40 = '40'       # 31~40P
+ALBUM_BUCKET_50 = '50'       # 50P 이상
+ALBUM_BUCKET_OTHER = 'other' # 41~49P
+ALBUM_BUCKETS = (ALBUM_BUCKET_30, ALBUM_BUCKET_40, ALBUM_BUCKET_50, ALBUM_BUCKET_OTHER)
+
+# 브랜드 키(BRAND_PRICE_KEYS 순서로 우선 매칭) → 앨범 구간 → 기간별 단가. None이면 앨범과 무관
+_GRAPHY_PRICES = {
+    ALBUM_BUCKET_30: (170000, 170000),
+    ALBUM_BUCKET_40: (200000, 190000),
+    ALBUM_BUCKET_50: (250000, 240000),
+    ALBUM_BUCKET_OTHER: (170000, 170000),  # 기본값
+}
+PRICE_RULES: Dict[str, Dict[Optional[str], Tuple[int, ...]]] = {
+    'k세븐스': {None: (150000, 140000)},
+    'b세븐스': {None: (170000, 160000)},          # K세븐스 + 2만원
+    'a세븐스프리미엄': {None: (190000, 190000)},
+    '더그라피': _GRAPHY_PRICES,
+    '세컨플로우': _GRAPHY_PRICES,
+}
+
+def _compile_price_table(rules: Dict[str, Dict[Optional[str], Tuple[int, ...]]]) -> Dict[Tuple[str, str], Tuple[int, ...]]:
+    table = {}
+    for brand_key, by_bucket in rules.items():
+        for bucket in ALBUM_BUCKETS:
+            prices = by_bucket.get(bucket, by_bucket.get(None))
+            assert prices is not None and len(prices) == len(PRICE_CUTOFFS) + 1, brand_key
+            table[(brand_key, bucket)] = prices
+    return table
+
+PRICE_TABLE = _compile_price_table(PRICE_RULES)
+
+PRICE_KEY_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=PRICE_KEY_CACHE_SIZE)
+def price_brand_key(brand: str) -> Optional[str]:
+    """Brand string → PRICE_RULES key (first BRAND_PRICE_KEYS entry contained in the normalized brand)."""
+    normalized = normalize_brand(brand)
+    return next((key for key in BRAND_PRICE_KEYS if key in normalized), None)
+
+@lru_cache(maxsize=PRICE_KEY_CACHE_SIZE)
+def album_bucket(album: str) -> str:
+    """Album string (30P, 기본40P, ...) → page bucket; no page count means 30P."""
+    album_match = ALBUM_PAGES_RE.search(album)
+    album_pages = int(album_match.group(1)) if album_match else 30
+    if album_pages <= 30:
+        return ALBUM_BUCKET_30
+    if album_pages <= 40:
+        return ALBUM_BUCKET_40
+    if album_pages >= 50:
+        return ALBUM_BUCKET_50
+    return ALBUM_BUCKET_OTHER
+
+@lru_cache(maxsize=PRICE_KEY_CACHE_SIZE)
+def date_key(date: str) -> Optional[int]:
+    """YYYY.MM.DD → YYYYMMDD integer, None if not a valid date (same rules as strptime '%Y.%m.%d')."""
+    try:
+        parsed = datetime.strptime(date, '%Y.%m.%d')
+    except ValueError:
+        return None
+    return parsed.year * 10000 + parsed.month * 100 + parsed.day
+
+def _lookup_price(brand: str, album: str, date: str) -> int:
+    try:
+        day = date_key(date)
+        if day is None:
+            return 0
+        brand_key = price_brand_key(brand)
+        if brand_key is None:
+            return 0
+        return PRICE_TABLE[(brand_key, album_bucket(album))][bisect_right(PRICE_CUTOFFS, day)]
+    except (ValueError, AttributeError):
+        return 0
+
+@profiled('calculate_price')
 def calculate_price(brand: str, album: str, date: str) -> int:
     """
     브랜드와 앨범, 날짜에 따라 촬영단가를 계산합니다.
@@ -1453,55 +1891,88 @@ def calculate_price(brand: str, album: str, date: str) -> int:
         date: 촬영 날짜 (YYYY.MM.DD 형식)
 
     Returns:
-        int: 촬영단가 (숫자만)
+        int: 촬영단가 (숫자만). 날짜가 잘못되었거나 알 수 없는 브랜드면 0
     """
-    try:
-        # 날짜 파싱 (2025.09.01 기준 단가 변경)
-        schedule_date = datetime.strptime(date, '%Y.%m.%d')
-        price_change_date = datetime(2025, 9, 1)
-        is_after_sep_2025 = schedule_date >= price_change_date
-
-        # 브랜드명 정규화
-        brand_lower = brand.lower().replace(' ', '').replace('[', '').replace(']', '')
-
-        # 앨범에서 숫자 추출 (30P, 40P, 50P 등)
-        album_match = re.search(r'(\d+)[Pp]', album)
-        album_pages = int(album_match.group(1)) if album_match else 30
-
-        # K세븐스
-        if 'k세븐스' in brand_lower:
-            return 140000 if is_after_sep_2025 else 150000
-
-        # B세븐스 (K세븐스 + 2만원)
-        elif 'b세븐스' in brand_lower:
-            k_price = 140000 if is_after_sep_2025 else 150000
-            return k_price + 20000
-
-        # A세븐스프리미엄
-        elif 'a세븐스프리미엄' in brand_lower:
-            return 190000
-
-        # 더그라피, 세컨플로우
-        elif '더그라피' in brand_lower or '세컨플로우' in brand_lower:
-            if album_pages <= 30:
-                return 170000
-            elif album_pages <= 40:
-                return 190000 if is_after_sep_2025 else 200000
-            elif album_pages >= 50:
-                return 240000 if is_after_sep_2025 else 250000
-            else:
-                return 170000  # 기본값
+    return _lookup_price(brand, album, date)
 
-        # 알 수 없는 브랜드
+@profiled('calculate_price')
+def calculate_prices(schedules: Iterable[Union[Schedule, Dict]]) -> List[int]:
+    """
+    여러 스케줄(Schedule 또는 dict)의 단가를 한 번에 계산합니다.
+    브랜드/앨범/날짜 중 하나라도 비어 있으면 0 (파서가 단가를 계산하는 조건과 동일).
+    """
+    prices = []
+    for sch in schedules:
+        if isinstance(sch, dict):
+            brand, album, date = sch.get('brand'), sch.get('album'), sch.get('date')
         else:
-            return 0
-
-    except (ValueError, AttributeError):
-        # 날짜 파싱 실패 시 기본값 반환
-        return 0
+            brand, album, date = sch.brand, sch.album, sch.date
+        prices.append(_lookup_price(brand, album, date) if brand and album and date else 0)
+    return prices
+
+# === Parallel Block Parsing ===
+# 큰 내보내기에서는 매니저 블록 파싱이 단일 코어를 오래 점유하므로, 입력이
+# PARALLEL_PARSE_MIN_CHARS 이상이면 블록을 청크 단위로 프로세스 풀에 나눠 보낸다.
+# 결과는 블록 순서대로 합쳐지므로 중복 제거(is_better_schedule)와 출력 순서는 직렬 파싱과 동일하다.
+
+PARALLEL_PARSE_MIN_CHARS = int(os.getenv('PARSER_PARALLEL_MIN_CHARS', '2000000'))
+PARALLEL_PARSE_WORKERS = int(os.getenv('PARSER_PARALLEL_WORKERS', '0')) or min(4, os.cpu_count() or 1)
+PARALLEL_PARSE_CHUNK_BLOCKS = int(os.getenv('PARSER_PARALLEL_CHUNK_BLOCKS', '256'))
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """프로세스 풀은 처음 필요할 때 한 번만 생성하여 재사용"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PARALLEL_PARSE_WORKERS)
+    return _process_pool
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared block-parsing pool (app shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(cancel_futures=True)
+        _process_pool = None
+
+def _use_parallel(raw_text: str, parallel: Optional[bool]) -> bool:
+    if parallel is None:
+        return len(raw_text) >= PARALLEL_PARSE_MIN_CHARS
+    return parallel
+
+def _parse_block_chunk(block_parser: Callable[[str], List[Schedule]], blocks: List[str]) -> List[List[Schedule]]:
+    """Worker entry point: parse a chunk of blocks in order."""
+    return [block_parser(block) for block in blocks]
+
+def map_manager_blocks(block_parser: Callable[[str], List[Schedule]], blocks: List[str], parallel: bool = False) -> Iterator[List[Schedule]]:
+    """
+    Apply block_parser to every block, yielding results in block order.
+    With parallel=True the blocks are fanned out to the process pool in chunks;
+    if the pool is unavailable the blocks are parsed serially instead.
+    """
+    if not parallel or len(blocks) <= PARALLEL_PARSE_CHUNK_BLOCKS:
+        yield from map(block_parser, blocks)
+        return
 
-def parse_schedules(raw_text: str) -> List[Dict]:
-    """Main entry point for parsing schedules from a raw chat log."""
+    chunks = [blocks[i:i + PARALLEL_PARSE_CHUNK_BLOCKS] for i in range(0, len(blocks), PARALLEL_PARSE_CHUNK_BLOCKS)]
+    try:
+        pool = _get_process_pool()
+        results = list(pool.map(_parse_block_chunk, [block_parser] * len(chunks), chunks))
+    except (OSError, BrokenProcessPool) as e:
+        logging.getLogger(__name__).warning(f"Parallel block parsing unavailable, falling back to serial: {e}")
+        shutdown_process_pool()
+        yield from map(block_parser, blocks)
+        return
+
+    for chunk_result in results:
+        yield from chunk_result
+
+def parse_schedules(raw_text: str, parallel: Optional[bool] = None) -> List[Dict]:
+    """
+    Main entry point for parsing schedules from a raw chat log.
+    parallel: None이면 입력 크기로 자동 결정, True/False면 매니저 블록 멀티프로세스 파싱 강제/해제.
+    """
+    count_parse('lines', raw_text.count('\n') + 1)
     # Detect format first
     chat_format = detect_chat_format(raw_text)
 
@@ -1521,11 +1992,13 @@ def parse_schedules(raw_text: str) -> List[Dict]:
         return [sch.to_dict() for sch in parsed_schedules]
 
     # Handle chat formats (desktop/mobile)
-    speaker_blocks = split_chat_by_speaker(raw_text)
+    speaker_blocks = split_chat_by_speaker(raw_text, chat_format)
+    count_parse('speaker_blocks', len(speaker_blocks))
 
     # If no speaker blocks found (plain text input), treat the whole text as one block
     if not speaker_blocks:
-        parsed_schedules = parse_manager_block(raw_text)
+        with parse_stage('parse_blocks'):
+            parsed_schedules = parse_manager_block(raw_text)
         return [sch.to_dict() for sch in parsed_schedules]
 
     # Automatically find the manager speaker
@@ -1534,11 +2007,14 @@ def parse_schedules(raw_text: str) -> List[Dict]:
     # Use a dictionary to handle duplicates and merge if necessary
     final_schedules: Dict[str, Schedule] = {}
 
-    for speaker, content in speaker_blocks:
-        if speaker == manager_speaker:
-            parsed_schedules = parse_manager_block(content)
+    manager_blocks = [content for speaker, content in speaker_blocks if speaker == manager_speaker]
+    count_parse('manager_blocks', len(manager_blocks))
+    del speaker_blocks  # 다른 화자의 블록 문자열은 여기서 해제 (피크 메모리)
+    with parse_stage('parse_blocks'):
+        for parsed_schedules in map_manager_blocks(parse_manager_block, manager_blocks, _use_parallel(raw_text, parallel)):
+            count_parse('parsed_schedules', len(parsed_schedules))
             for sch in parsed_schedules:
-                key = f"{sch.date}-{sch.time}-{sch.couple}"
+                key = schedule_key(sch)
 
                 if key not in final_schedules:
                     # First occurrence, just add it
@@ -1548,9 +2024,600 @@ def parse_schedules(raw_text: str) -> List[Dict]:
                     if is_better_schedule(final_schedules[key], sch):
                         final_schedules[key] = sch
 
+    del manager_blocks
+    count_parse('schedules', len(final_schedules))
     return [sch.to_dict() for sch in final_schedules.values()]
 
 
+# === Streaming Parser ===
+# 수십 MB짜리 연간 내보내기를 통째로 메모리에 올리지 않고 줄 단위로 읽으며,
+# 화자 턴(블록)이 끝날 때마다 스케줄을 바로 내보낸다.
+# 유지하는 상태: 현재 블록, 매니저 추정 창(최대 MANAGER_DETECTION_WINDOW 블록),
+# 중복 제거용 키 → (완성도 점수, needs_review) 맵.
+
+FORMAT_DETECTION_LINES = FORMAT_SNIFF_LINES  # detect_chat_format과 동일하게 앞 50줄로 포맷 판단
+MANAGER_DETECTION_WINDOW = 200   # 매니저 화자 추정에 쓰는 선두 블록 수
+
+def iter_text_lines(stream: Union[str, Iterable[str], Iterable[bytes]]) -> Iterator[str]:
+    """Yield lines without line endings from a str, a text/binary file object or any iterable of lines."""
+    if isinstance(stream, str):
+        yield from iter_splitlines(stream)
+        return
+    for line in stream:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8')
+        yield line.rstrip('\r\n')
+
+def _iter_date_segments(lines: Iterable[str]) -> Iterator[str]:
+    """Split speakerless plain text into chunks that each start at a date line (schedule boundary)."""
+    segment = []
+    for line in lines:
+        if segment and classify_line(line).date:
+            yield "\n".join(segment)
+            segment = []
+        segment.append(line)
+    if segment:
+        yield "\n".join(segment)
+
+class _StreamDeduplicator:
+    """Streaming 'date-time-couple' dedup. Emits a schedule on first sight and again only if a later one is better."""
+
+    def __init__(self):
+        self._ranks: Dict[str, Tuple[int, bool]] = {}
+
+    def feed(self, schedules: Iterable[Schedule]) -> Iterator[Dict]:
+        return self.feed_dicts(sch.to_dict() for sch in schedules)
+
+    def feed_dicts(self, schedules: Iterable[Dict]) -> Iterator[Dict]:
+        """feed() for schedule dicts (LLM/하이브리드 결과) — dict를 그대로 내보낸다."""
+        for data in schedules:
+            key = schedule_dict_key(data)
+            rank = (get_schedule_dict_score(data), bool(data.get('needs_review')))
+            if key in self._ranks and not _is_better_rank(self._ranks[key], rank):
+                continue
+            self._ranks[key] = rank
+            yield data
+
+def parse_schedules_iter(stream: Union[str, Iterable[str], Iterable[bytes]], classic_only: bool = False) -> Iterator[Dict]:
+    """
+    parse_schedules / parse_schedules_classic_only의 스트리밍 버전.
+
+    stream은 텍스트/바이너리 파일 객체(업로드 포함) 또는 줄 iterable. 블록이 끝날 때마다
+    스케줄 dict를 yield 하므로 입력 크기와 무관하게 메모리 사용량이 일정하다.
+
+    일괄 파서와의 차이:
+        - 포맷은 앞 FORMAT_DETECTION_LINES 줄로만 판단
+        - 매니저 화자는 선두 MANAGER_DETECTION_WINDOW 블록으로 추정
+        - 중복 키의 더 나은 스케줄이 나중에 나오면 같은 키로 다시 yield됨
+          (소비자는 schedule_key 기준으로 덮어쓰면 일괄 파서와 같은 결과; collect_streamed_schedules 참고)
+        - ※/구조화 형식은 단일 메시지 포맷이므로 전체를 모아 일괄 파서로 처리
+    """
+    block_parser = parse_manager_block_classic_only if classic_only else parse_manager_block
+    lines = iter_text_lines(stream)
+    head = list(islice(lines, FORMAT_DETECTION_LINES))
+    chat_format = detect_chat_format("\n".join(head))
+    all_lines = chain(head, lines)
+
+    if chat_format in ('asterisk', 'structured'):
+        raw_text = "\n".join(all_lines)
+        yield from (parse_schedules_classic_only(raw_text) if classic_only else parse_schedules(raw_text))
+        return
+
+    if chat_format == 'compact':
+        # 간결한 형식은 줄 단위로 독립적
+        for line in all_lines:
+            for sch in parse_compact_format(line):
+                yield sch.to_dict()
+        return
+
+    if chat_format == 'unknown':
+        # 화자 헤더가 없는 일반 텍스트: 날짜 줄 단위로 잘라 블록 파서에 전달
+        for segment in _iter_date_segments(all_lines):
+            for sch in block_parser(segment):
+                yield sch.to_dict()
+        return
+
+    splitter = iter_speaker_blocks_mobile if chat_format == 'mobile' else iter_speaker_blocks_desktop
+    dedup = _StreamDeduplicator()
+    window: List[Tuple[str, str]] = []
+    manager_speaker = None
+
+    for speaker, content in splitter(all_lines):
+        if manager_speaker is None:
+            window.append((speaker, content))
+            if len(window) < MANAGER_DETECTION_WINDOW:
+                continue
+            manager_speaker = find_manager_speaker(window)
+            pending, window = window, []
+        else:
+            pending = [(speaker, content)]
+
+        for block_speaker, block_text in pending:
+            if block_speaker == manager_speaker:
+                yield from dedup.feed(block_parser(block_text))
+
+    # 창을 다 채우기 전에 입력이 끝난 경우
+    if manager_speaker is None and window:
+        manager_speaker = find_manager_speaker(window)
+        for block_speaker, block_text in window:
+            if block_speaker == manager_speaker:
+                yield from dedup.feed(block_parser(block_text))
+
+def collect_streamed_schedules(schedules: Iterable[Dict]) -> List[Dict]:
+    """Collect parse_schedules_iter output into a list, later re-emissions replacing earlier ones in place."""
+    final_schedules: Dict[str, Dict] = {}
+    for sch in schedules:
+        final_schedules[f"{sch['date']}-{sch['time']}-{sch['couple']}"] = sch
+    return list(final_schedules.values())
+
+
+# --- Parse Events (SSE / NDJSON 응답용) ---
+# 스트리밍 파서 결과를 스케줄이 나올 때마다 이벤트로 내보내고, 처리한 줄 수를 진행 이벤트로 알린다.
+#   ('schedule', {"key", "schedule"})  같은 key가 다시 오면 소비자는 덮어쓴다 (collect_streamed_schedules와 같은 규칙)
+#   ('progress', {...})                진행 상황 (마지막 이벤트는 "done": True, partial/truncated_lines 포함)
+# iter_parse_events는 Guarded Parsing의 한도를 기본값으로 쓰므로 그 절 끝에 있다.
+
+PROGRESS_EVERY_LINES = 2000
+
+class ParseEvent(NamedTuple):
+    event: str              # 'schedule' | 'progress'
+    data: Dict[str, Any]
+
+def schedule_event(sch: Dict) -> ParseEvent:
+    return ParseEvent('schedule', {"key": schedule_dict_key(sch), "schedule": sch})
+
+
+# === Guarded Parsing ===
+# 신뢰할 수 없는 입력(업로드, 붙여넣은 텍스트)이 파서를 오래 붙잡지 않도록 두 가지 한도를 건다.
+# 모든 Classic 진입점에 적용: 텍스트 전체는 parse_schedules_classic_guarded, 줄 스트림은 parse_schedules_guarded,
+# 스트리밍 이벤트는 iter_parse_events. 하이브리드/LLM 엔진의 입력도 cap_line_lengths로 줄 길이를 자른다.
+# - 줄 길이 한도: PARSE_MAX_LINE_CHARS를 넘는 줄은 잘라서 파싱한다. 레지스트리 패턴은 줄 길이에 대해
+#   최악 이차 시간이므로(benchmarks/audit_patterns.py) 줄 하나에 드는 시간이 한도로 묶인다.
+# - 파싱 시간 예산: 정규식 실행 도중에는 멈출 수 없으므로 줄을 읽을 때와 스케줄이 나올 때마다 확인하고,
+#   예산을 넘기면 입력을 더 읽지 않고 그때까지의 결과를 partial로 돌려준다 (블록 하나 처리 시간만큼 넘을 수 있음).
+
+PARSE_MAX_LINE_CHARS = int(os.getenv('PARSE_MAX_LINE_CHARS', '2000'))
+PARSE_TIME_BUDGET_SECONDS = float(os.getenv('PARSE_TIME_BUDGET_SECONDS', '30'))
+
+class GuardedParseResult(NamedTuple):
+    data: List[Dict]
+    partial: bool           # 시간 예산을 넘겨 입력 끝까지 파싱하지 못함
+    lines: int              # 읽은 줄 수
+    truncated_lines: int    # 줄 길이 한도로 잘린 줄 수
+    seconds: float
+
+class _ParseDeadline:
+    """시간 예산 (perf_counter 기준 deadline). 한 번 지나면 expired가 계속 True"""
+
+    def __init__(self, deadline: float):
+        self.expired = False
+        self.deadline = deadline
+
+    def check_deadline(self) -> bool:
+        if not self.expired and time.perf_counter() >= self.deadline:
+            self.expired = True
+        return self.expired
+
+class _LineGuard(_ParseDeadline):
+    """줄 iterable을 감싸 긴 줄을 자르고, deadline이 지나면 더 읽지 않는다"""
+
+    def __init__(self, lines: Iterable[str], max_chars: int, deadline: float):
+        super().__init__(deadline)
+        self.lines = 0
+        self.truncated = 0
+        self._lines = lines
+        self._max_chars = max_chars
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._lines:
+            if self.check_deadline():
+                return
+            self.lines += 1
+            if len(line) > self._max_chars:
+                self.truncated += 1
+                line = line[:self._max_chars]
+            yield line
+
+def parse_schedules_guarded(stream: Union[str, Iterable[str], Iterable[bytes]], classic_only: bool = False,
+                            max_line_chars: int = PARSE_MAX_LINE_CHARS,
+                            budget_seconds: float = PARSE_TIME_BUDGET_SECONDS) -> GuardedParseResult:
+    """
+    줄 길이 한도와 시간 예산을 지키는 parse_schedules_iter.
+    예산 안에 끝나면 collect_streamed_schedules(parse_schedules_iter(...))와 같은 결과
+    (한도를 넘는 줄이 없을 때), 넘기면 그때까지 파싱한 스케줄을 partial=True로 돌려준다.
+    """
+    start = time.perf_counter()
+    guard = _LineGuard(iter_text_lines(stream), max_line_chars, start + budget_seconds)
+    schedules = []
+    for sch in parse_schedules_iter(guard, classic_only=classic_only):
+        schedules.append(sch)
+        if guard.check_deadline():
+            break
+
+    _record_guard(guard.truncated, guard.expired, guard.lines, budget_seconds)
+    return GuardedParseResult(
+        collect_streamed_schedules(schedules), guard.expired, guard.lines, guard.truncated, time.perf_counter() - start
+    )
+
+def _record_guard(truncated: int, expired: bool, lines: int, budget_seconds: float) -> None:
+    """잘린 줄 수/예산 초과를 프로파일 카운터(guard_truncated_lines, guard_budget_exceeded)와 로그로 남긴다"""
+    if truncated:
+        count_parse('guard_truncated_lines', truncated)
+    if expired:
+        count_parse('guard_budget_exceeded')
+        logging.getLogger(__name__).warning(
+            f"Parse time budget ({budget_seconds:.1f}s) exceeded after {lines} lines, returning partial result"
+        )
+
+def cap_line_lengths(raw_text: str, max_chars: int = PARSE_MAX_LINE_CHARS) -> Tuple[str, int]:
+    """(max_chars를 넘는 줄을 자른 텍스트, 잘린 줄 수). 넘는 줄이 없으면 raw_text를 복사하지 않고 그대로 돌려준다"""
+    if len(raw_text) <= max_chars or all(len(line) <= max_chars for line in iter_splitlines(raw_text)):
+        return raw_text, 0
+    guard = _LineGuard(iter_splitlines(raw_text), max_chars, float('inf'))
+    return '\n'.join(guard), guard.truncated
+
+def parse_schedules_classic_guarded(raw_text: str, parallel: Optional[bool] = None,
+                                    max_line_chars: int = PARSE_MAX_LINE_CHARS,
+                                    budget_seconds: float = PARSE_TIME_BUDGET_SECONDS) -> GuardedParseResult:
+    """
+    줄 길이 한도와 시간 예산을 지키는 parse_schedules_classic_only (텍스트 전체를 받는 진입점용: 붙여넣기, 일괄 파싱 등).
+    한도를 넘는 줄이 없고 예산 안에 끝나면 parse_schedules_classic_only와 같은 결과,
+    예산을 넘기면 그때까지 파싱한 매니저 블록의 스케줄을 partial=True로 돌려준다 (병렬 파싱 중에는 끝난 뒤에야 확인).
+    """
+    start = time.perf_counter()
+    text, truncated = cap_line_lengths(raw_text, max_line_chars)
+    deadline = _ParseDeadline(start + budget_seconds)
+    data = parse_schedules_classic_only(text, parallel, deadline=deadline)
+    lines = text.count('\n') + 1
+    _record_guard(truncated, deadline.expired, lines, budget_seconds)
+    return GuardedParseResult(data, deadline.expired, lines, truncated, time.perf_counter() - start)
+
+def iter_parse_events(stream: Union[str, Iterable[str], Iterable[bytes]], classic_only: bool = False,
+                      progress_every: int = PROGRESS_EVERY_LINES, max_line_chars: int = PARSE_MAX_LINE_CHARS,
+                      budget_seconds: float = PARSE_TIME_BUDGET_SECONDS) -> Iterator[ParseEvent]:
+    """
+    parse_schedules_iter 결과를 스케줄/진행 이벤트로 (진행 이벤트는 progress_every줄마다, 스케줄이 나온 직후).
+    parse_schedules_guarded와 같은 줄 길이 한도/시간 예산을 걸고, 마지막 진행 이벤트(done)에 partial과 truncated_lines를 담는다
+    """
+    start = time.perf_counter()
+    guard = _LineGuard(iter_text_lines(stream), max_line_chars, start + budget_seconds)
+    keys = set()
+    reported = 0
+    for sch in parse_schedules_iter(guard, classic_only=classic_only):
+        event = schedule_event(sch)
+        keys.add(event.data["key"])
+        yield event
+        if guard.check_deadline():
+            break
+        if guard.lines - reported >= progress_every:
+            reported = guard.lines
+            yield ParseEvent('progress', {"lines": guard.lines, "schedules": len(keys)})
+    _record_guard(guard.truncated, guard.expired, guard.lines, budget_seconds)
+    yield ParseEvent('progress', {"lines": guard.lines, "schedules": len(keys), "done": True,
+                                  "partial": guard.expired, "truncated_lines": guard.truncated})
+
+
+# === Incremental Parsing ===
+# 매니저는 같은 카톡방 내보내기를 며칠마다 다시 올리고, 새 파일은 이전 파일 뒤에 메시지가 덧붙은 형태다.
+# 첫 화자 턴부터 마지막 화자 턴 끝까지(본문)의 길이/해시와 마지막 턴 머리 줄(타임스탬프)을 지문으로 남기고,
+# 다음 업로드의 본문 앞부분이 지문과 같으면 그 뒤(새 꼬리)만 파싱한다.
+# 내보내기 맨 위의 "저장한 날짜" 헤더는 매번 바뀌므로 본문에 포함하지 않는다.
+
+class ChatFingerprint(NamedTuple):
+    chat_format: str        # 'desktop' | 'mobile'
+    body_chars: int         # 첫 화자 턴 시작부터 본문 끝까지 글자 수
+    body_hash: str          # 그 구간의 SHA-256
+    last_turn_header: str   # 마지막 화자 턴 머리 줄 (화자 + 타임스탬프)
+
+def _speaker_header_re(chat_format: str) -> Optional[re.Pattern]:
+    if chat_format == 'desktop':
+        return DESKTOP_SPEAKER_RE
+    if chat_format == 'mobile':
+        return MOBILE_SPEAKER_RE
+    return None
+
+def _speaker_turn_bounds(raw_text: str, header_re: re.Pattern) -> Optional[Tuple[int, str]]:
+    """(첫 화자 턴 머리 줄의 시작 위치, 마지막 화자 턴 머리 줄) — 화자 턴이 없으면 None"""
+    first_offset = None
+    last_header = ""
+    offset = 0
+    for line in raw_text.splitlines(keepends=True):
+        stripped = line.strip()
+        if header_re.match(stripped):
+            if first_offset is None:
+                first_offset = offset
+            last_header = stripped
+        offset += len(line)
+    if first_offset is None:
+        return None
+    return first_offset, last_header
+
+def _body_hash(raw_text: str, start: int, end: int) -> str:
+    return hashlib.sha256(raw_text[start:end].encode('utf-8')).hexdigest()
+
+def chat_fingerprint(raw_text: str) -> Optional[ChatFingerprint]:
+    """Fingerprint of a desktop/mobile chat export body; None for other formats."""
+    chat_format = detect_chat_format(raw_text)
+    header_re = _speaker_header_re(chat_format)
+    if header_re is None:
+        return None
+    bounds = _speaker_turn_bounds(raw_text, header_re)
+    if bounds is None:
+        return None
+    start, last_header = bounds
+    end = len(raw_text.rstrip())
+    return ChatFingerprint(chat_format, end - start, _body_hash(raw_text, start, end), last_header)
+
+def split_incremental_tail(raw_text: str, fingerprint: Optional[ChatFingerprint]) -> Tuple[str, int]:
+    """
+    Return (text still to parse, number of chars skipped).
+    If raw_text continues the export the fingerprint was taken from, only the appended tail is returned;
+    otherwise the whole text is returned with 0 skipped.
+    """
+    if fingerprint is None:
+        return raw_text, 0
+    chat_format = detect_chat_format(raw_text)
+    header_re = _speaker_header_re(chat_format)
+    if chat_format != fingerprint.chat_format or header_re is None:
+        return raw_text, 0
+
+    bounds = _speaker_turn_bounds(raw_text, header_re)
+    if bounds is None:
+        return raw_text, 0
+    start = bounds[0]
+    end = start + fingerprint.body_chars
+
+    # 싼 검사(길이, 경계, 마지막 턴 타임스탬프)를 먼저 하고 해시는 마지막에 비교
+    if end > len(raw_text) or raw_text[end:end + 1] not in ('', '\n'):
+        return raw_text, 0
+    if raw_text.rfind(fingerprint.last_turn_header, start, end) == -1:
+        return raw_text, 0
+    if _body_hash(raw_text, start, end) != fingerprint.body_hash:
+        return raw_text, 0
+
+    return raw_text[end:].lstrip('\n'), end
+
+
+# === LLM Input Chunking ===
+# LLM 변환은 입력 3000자, 응답 5개 스케줄이 한도라 긴 메시지는 잘려서 스케줄이 사라졌다.
+# 입력을 화자 턴 / 날짜가 새로 나오는 줄 / 구분선 경계에서 잘라 한도 안의 조각으로 묶고,
+# 조각들을 동시에 변환한 뒤 기존 'date-time-couple' 중복 제거로 합친다.
+
+LLM_CHUNK_MAX_CHARS = 3000        # services.llm_parser 입력 한도와 같게 유지
+LLM_CHUNK_MAX_SCHEDULES = 5       # 시스템 프롬프트의 응답 스케줄 수 한도
+LLM_MAX_CONCURRENT_CHUNKS = int(os.getenv("LLM_MAX_CONCURRENT_CHUNKS", "4"))
+
+def _llm_segments(raw_text: str) -> List[Tuple[str, int]]:
+    """Split raw_text into (segment, schedule count) at speaker turns, new-date lines and separator lines."""
+    header_re = _speaker_header_re(detect_chat_format(raw_text))
+    segments: List[Tuple[str, int]] = []
+    current: List[str] = []
+    dates = 0
+
+    def flush():
+        nonlocal current, dates
+        if any(line.strip() for line in current):
+            segments.append(("\n".join(current), dates))
+        current, dates = [], 0
+
+    for line in raw_text.splitlines():
+        stripped = line.strip()
+        if LLM_SEPARATOR_RE.match(stripped):
+            flush()
+            continue
+        content = stripped
+        header = header_re.match(stripped) if header_re else None
+        if header:
+            flush()
+            # 모바일 머리 줄은 내용까지 그룹으로 잡고, 데스크탑은 머리 뒤가 내용
+            content = header.group(3) if header.re is MOBILE_SPEAKER_RE else stripped[header.end():]
+        has_date = bool(LLM_DATE_HINT_RE.search(content))
+        if has_date and dates:
+            flush()
+        current.append(line)
+        dates += has_date
+    flush()
+    return segments
+
+def _split_oversized(segment: str, max_chars: int) -> List[str]:
+    """Split one segment longer than max_chars at line boundaries (hard-cutting single huge lines)."""
+    pieces, current, size = [], [], 0
+    for line in segment.splitlines():
+        while len(line) > max_chars:
+            pieces.append(line[:max_chars])
+            line = line[max_chars:]
+        if current and size + len(line) + 1 > max_chars:
+            pieces.append("\n".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        pieces.append("\n".join(current))
+    return pieces
+
+def split_text_for_llm(raw_text: str, max_chars: int = LLM_CHUNK_MAX_CHARS,
+                       max_schedules: int = LLM_CHUNK_MAX_SCHEDULES) -> List[str]:
+    """
+    Pack raw_text into chunks of at most max_chars characters and about max_schedules schedules,
+    cutting only at speaker-turn / schedule / separator boundaries where possible.
+    """
+    if len(raw_text) <= max_chars and LLM_DATE_HINT_RE.findall(raw_text)[max_schedules:] == []:
+        return [raw_text]
+
+    chunks: List[str] = []
+    current: List[str] = []
+    size = schedules = 0
+    for segment, segment_schedules in _llm_segments(raw_text):
+        for piece in ([segment] if len(segment) <= max_chars else _split_oversized(segment, max_chars)):
+            if current and (size + len(piece) + 1 > max_chars or schedules + segment_schedules > max_schedules):
+                chunks.append("\n".join(current))
+                current, size, schedules = [], 0, 0
+            current.append(piece)
+            size += len(piece) + 1
+            schedules += segment_schedules
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+def merge_schedule_dicts(results: Iterable[List[Dict]]) -> List[Dict]:
+    """
+    Merge several parse results with the 'date-time-couple' dedup used by parse_schedules.
+    dict를 Schedule로 되돌리지 않으므로 Schedule 필드 밖의 키(구조화 형식의 cuts 등)도 그대로 남는다.
+    """
+    final_schedules: Dict[str, Tuple[Tuple[int, bool], Dict]] = {}
+    for schedules in results:
+        for data in schedules:
+            key = schedule_dict_key(data)
+            rank = (get_schedule_dict_score(data), bool(data.get('needs_review')))
+            if key not in final_schedules or _is_better_rank(final_schedules[key][0], rank):
+                final_schedules[key] = (rank, data)
+    return [data for _, data in final_schedules.values()]
+
+
+# === LLM Prefilter ===
+# LLM에 보내기 전에 스케줄 신호가 없는 내용을 걷어내 프롬프트 토큰과 지연을 줄인다.
+# - 화자 형식: find_manager_speaker로 매니저를 찾고, 매니저 블록과 날짜가 보이는 다른 화자 블록만 남긴다.
+#   classify_line 점수(find_manager_speaker와 같은 가중치)가 0이고 날짜도 없는 블록은 버린다.
+# - 남은 블록에서 시스템 메시지/이모티콘/인사·대답만 있는 줄(LLM_NOISE_LINE_RE)과 빈 줄을 지운다.
+# 블록 사이는 '---'로 이어 붙여 조각 분할(split_text_for_llm)과 LLM이 스케줄 경계로 쓰게 한다.
+
+LLM_PREFILTER_ENABLED = os.getenv("LLM_PREFILTER", "true").lower() == "true"
+
+class LLMPrefilter(NamedTuple):
+    text: str
+    original_chars: int
+    kept_chars: int
+    original_tokens: int      # estimate_tokens 근사치
+    kept_tokens: int
+    dropped_blocks: int
+    dropped_lines: int
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 근사치 (한글 음절 1토큰, 나머지 4자당 1토큰) — 절감량 비교용"""
+    hangul = len(HANGUL_CHAR_RE.findall(text))
+    return hangul + (len(text) - hangul + 3) // 4
+
+def _strip_noise_lines(content: str) -> Tuple[List[str], int]:
+    """(남길 줄, 지운 줄 수)"""
+    kept, dropped = [], 0
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if not stripped or LLM_NOISE_LINE_RE.match(stripped):
+            dropped += 1
+        else:
+            kept.append(stripped)
+    return kept, dropped
+
+@profiled('llm_prefilter')
+def prefilter_for_llm(raw_text: str) -> LLMPrefilter:
+    """raw_text에서 스케줄 신호가 없는 화자 블록과 줄을 걷어낸 LLM 입력"""
+    chat_format = detect_chat_format(raw_text)
+    speaker_blocks = [] if chat_format in ('asterisk', 'structured') else split_chat_by_speaker(raw_text, chat_format)
+
+    dropped_blocks = dropped_lines = 0
+    if speaker_blocks:
+        manager_speaker = find_manager_speaker(speaker_blocks)
+        sections = []
+        for speaker, content in speaker_blocks:
+            has_date = bool(LLM_DATE_HINT_RE.search(content))
+            score = sum(classify_line(line).score for line in content.split('\n'))
+            if not has_date and (speaker != manager_speaker or score == 0):
+                dropped_blocks += 1
+                dropped_lines += content.count('\n') + 1
+                continue
+            lines, dropped = _strip_noise_lines(content)
+            dropped_lines += dropped
+            if lines:
+                sections.append('\n'.join(lines))
+        text = '\n---\n'.join(sections)
+    else:
+        lines, dropped_lines = _strip_noise_lines(raw_text)
+        text = '\n'.join(lines)
+
+    return LLMPrefilter(
+        text=text,
+        original_chars=len(raw_text),
+        kept_chars=len(text),
+        original_tokens=estimate_tokens(raw_text),
+        kept_tokens=estimate_tokens(text),
+        dropped_blocks=dropped_blocks,
+        dropped_lines=dropped_lines,
+    )
+
+
+# === LLM Structured Output ===
+# LLM JSON 출력 모드: 스키마 검증된 필드를 Schedule에 바로 매핑해 키-값 텍스트 재파싱(형식 감지 포함)을 건너뛴다.
+# 키-값 텍스트 출력은 JSON 모드가 실패했을 때의 대비책으로만 Classic 파서로 다시 파싱한다.
+
+LLM_PARSED_MARKER = '<!-- LLM_PARSED -->'
+
+# 필수 필드 외에 memo에도 "키: 값"으로 남기는 필드 (parse_structured_format의 memo와 같은 모양)
+LLM_MEMO_FIELDS = [('contact', '연락처'), ('brand', '브랜드'), ('album', '앨범'), ('photographer', '작가'), ('manager', '담당자')]
+
+def schedule_from_llm_fields(fields: Dict[str, Any]) -> Schedule:
+    """LLM JSON 출력 한 건(services.llm_parser.validate_llm_schedules 결과)을 Schedule로 (parse_structured_format과 같은 정규화)"""
+    schedule = Schedule()
+
+    date_match = STRUCTURED_DATE_RE.search(fields.get('date', ''))
+    if date_match:
+        year, month, day = date_match.groups()
+        schedule.date = f"{year}.{int(month):02d}.{int(day):02d}"
+
+    time_match = STRUCTURED_TIME_RE.search(fields.get('time', ''))
+    if time_match:
+        hour, minute = time_match.groups()
+        schedule.time = f"{int(hour):02d}:{int(minute):02d}"
+
+    if fields.get('location'):
+        schedule.location = clean_location(fields['location'])
+
+    names = HANGUL_NAME_RE.findall(fields.get('couple', '').replace('&', ' '))
+    schedule.couple = ' '.join(names[:2])
+
+    schedule.contact = parse_contact(fields.get('contact', ''))
+    schedule.brand = fields.get('brand', '')
+    schedule.album = fields.get('album', '')
+    schedule.photographer = fields.get('photographer', '')
+    schedule.manager = remove_parenthesized(CONTACT_RE.sub('', fields.get('manager', ''))).strip()
+    schedule.price = fields.get('price', 0)
+
+    memo_parts = [f"{key}: {fields[name]}" for name, key in LLM_MEMO_FIELDS if fields.get(name)]
+    if schedule.price:
+        memo_parts.append(f"촬영비: {schedule.price}")
+    if fields.get('memo'):
+        memo_parts.append(fields['memo'])
+    if memo_parts:
+        schedule.memo = LLM_PARSED_MARKER + '\n' + '\n\n'.join(memo_parts)
+
+    # 필수 필드 누락 체크
+    missing_fields = [label for label, value in (
+        ("날짜", schedule.date), ("시간", schedule.time), ("장소", schedule.location), ("신랑신부", schedule.couple)
+    ) if not value]
+    if missing_fields:
+        schedule.needs_review = True
+        schedule.review_reason = f"LLM 파싱: 필수 필드 누락 - {', '.join(missing_fields)}"
+
+    # 촬영단가 자동 계산 (브랜드, 앨범, 날짜가 있으면)
+    if schedule.brand and schedule.album and schedule.date and not schedule.price:
+        schedule.price = calculate_price(schedule.brand, schedule.album, schedule.date)
+
+    return schedule
+
+def parse_llm_text_output(converted_text: str) -> List[Dict]:
+    """
+    키-값 텍스트 출력(대비책)을 Classic 파서로 재파싱.
+    구조화 형식 파서는 텍스트 하나를 스케줄 하나로 읽으므로 '---' 구분선마다 나눠서 파싱한다.
+    """
+    body = converted_text.strip()
+    if body.startswith(LLM_PARSED_MARKER):
+        body = body[len(LLM_PARSED_MARKER):]
+    parts = [part.strip() for part in LLM_SEPARATOR_RE.split(body) if part.strip()]
+    with parse_stage('llm_reparse'):
+        return merge_schedule_dicts(
+            parse_schedules_classic_only(f"{LLM_PARSED_MARKER}\n{part}") for part in parts
+        )
+
+
 # === Parser Engine Selection Functions ===
 
 def has_required_fields(schedule: Dict) -> bool:
@@ -1565,12 +2632,12 @@ def has_required_fields(schedule: Dict) -> bool:
     """
     # 날짜 검증: YYYY.MM.DD 형식이어야 함
     date = schedule.get('date', '')
-    if not date or not is_valid_date(date):
+    if not date or not classify_line(date).date:
         return False
 
     # 시간 검증: HH:MM 형식이어야 함
     time = schedule.get('time', '')
-    if not time or not is_valid_time(time):
+    if not time or not classify_line(time).is_time:
         return False
 
     # 장소 검증: 빈 문자열이 아니어야 함
@@ -1580,7 +2647,7 @@ def has_required_fields(schedule: Dict) -> bool:
 
     # 신랑신부 검증: 유효한 이름 형식이어야 하고 "없음"이 아니어야 함
     couple = schedule.get('couple', '')
-    if not couple or not is_valid_couple(couple):
+    if not couple or not classify_line(couple).is_couple:
         return False
     # "없음" 패턴 제외
     if '없음' in couple:
@@ -1588,66 +2655,198 @@ def has_required_fields(schedule: Dict) -> bool:
 
     return True
 
-def parse_schedules_hybrid_llm(raw_text: str) -> List[Dict]:
+def parse_classic_blocks(raw_text: str) -> List[Tuple[str, List[Dict]]]:
     """
-    하이브리드 파서 (Classic + GPT-4)
-    먼저 Classic 파서를 시도하고, 필수 필드 4개(날짜, 시간, 장소, 신랑신부)를 파싱하지 못했으면 GPT-4 파서로 fallback
+    하이브리드 파서용: Classic 파싱을 매니저 블록 단위로 수행해 [(블록 원문, 스케줄 목록)] 반환.
+    화자가 없는 형식(구조화/※/간결/일반 텍스트)은 전체 텍스트가 한 블록이다.
+    PARSE_MAX_LINE_CHARS를 넘는 줄은 잘라서 파싱한다 (Guarded Parsing, 카운터 guard_truncated_lines).
     """
-    import logging
+    raw_text, truncated = cap_line_lengths(raw_text)
+    _record_guard(truncated, False, 0, PARSE_TIME_BUDGET_SECONDS)
+    chat_format = detect_chat_format(raw_text)
+    speaker_blocks = [] if chat_format in ('asterisk', 'structured') else split_chat_by_speaker(raw_text, chat_format)
+    if not speaker_blocks:
+        return [(raw_text, parse_schedules_classic_only(raw_text))]
+
+    count_parse('lines', raw_text.count('\n') + 1)
+    count_parse('speaker_blocks', len(speaker_blocks))
+    manager_speaker = find_manager_speaker(speaker_blocks)
+    manager_blocks = [content for speaker, content in speaker_blocks if speaker == manager_speaker]
+    count_parse('manager_blocks', len(manager_blocks))
+    with parse_stage('parse_blocks'):
+        parsed = map_manager_blocks(parse_manager_block_classic_only, manager_blocks, _use_parallel(raw_text, None))
+        return [(block, [sch.to_dict() for sch in schedules]) for block, schedules in zip(manager_blocks, parsed)]
+
+def _block_needs_llm(schedules: List[Dict], block_text: str) -> bool:
+    """필수 필드가 빠진 스케줄이 있거나, 스케줄을 못 찾았는데 날짜가 보이는 블록"""
+    if schedules:
+        return not all(has_required_fields(sch) for sch in schedules)
+    return bool(LLM_DATE_HINT_RE.search(block_text))
+
+def _llm_circuit_open() -> bool:
+    """LLM circuit breaker가 열려 있어 호출을 보내지 않는 상태인지 (services.llm_resilience)"""
+    from services.llm_resilience import llm_caller
+    return llm_caller.breaker.is_open()
+
+def _chunk_texts_for_llm(texts: List[str]) -> List[List[str]]:
+    """LLM에 보낼 텍스트별 조각 목록 (전처리 → 스케줄/화자 턴 경계 분할)"""
     logger = logging.getLogger(__name__)
 
-    # 먼저 Classic 시도
-    logger.info("Hybrid: Trying Classic parser first...")
-    classic_result = parse_schedules_classic_only(raw_text)
-
-    # Classic이 성공했으면 필수 필드 검증
-    if classic_result and len(classic_result) > 0:
-        # 에러 응답이 아닌지 확인
-        if not isinstance(classic_result, dict) or not classic_result.get('error'):
-            # 모든 스케줄이 필수 필드 4개(날짜, 시간, 장소, 신랑신부)를 가지고 있는지 확인
-            all_have_required = all(has_required_fields(sch) for sch in classic_result)
-
-            if all_have_required:
-                logger.info(f"Hybrid: Classic parser succeeded with {len(classic_result)} schedules (all have required fields)")
-                return classic_result
-            else:
-                # 필수 필드가 누락된 스케줄 로깅
-                missing_count = sum(1 for sch in classic_result if not has_required_fields(sch))
-                logger.info(f"Hybrid: Classic parser returned {len(classic_result)} schedules, but {missing_count} are missing required fields")
+    # 스케줄 신호가 없는 화자 블록/줄 제거 (토큰 절감량은 프로파일 카운터로 남김)
+    if LLM_PREFILTER_ENABLED:
+        filtered = [prefilter_for_llm(text) for text in texts]
+        original_tokens = sum(f.original_tokens for f in filtered)
+        kept_tokens = sum(f.kept_tokens for f in filtered)
+        count_parse('llm_prompt_tokens_before', original_tokens)
+        count_parse('llm_prompt_tokens_after', kept_tokens)
+        logger.info(
+            f"LLM prefilter: {sum(f.original_chars for f in filtered)} → {sum(f.kept_chars for f in filtered)} chars, "
+            f"~{original_tokens - kept_tokens} prompt tokens saved"
+        )
+        texts = [f.text for f in filtered]
 
-    # Classic이 실패하거나 결과가 없거나 필수 필드가 누락된 경우 GPT-4 시도
-    logger.info("Hybrid: Classic parser failed or missing required fields. Falling back to GPT-4...")
-    return parse_schedules_llm(raw_text)
+    # 긴 메시지는 스케줄/화자 턴 경계에서 잘라 조각별로 변환
+    chunked = [split_text_for_llm(text) if text.strip() else [] for text in texts]
+    count_parse('llm_chunks', sum(map(len, chunked)))
+    return chunked
 
-def parse_schedules_llm(raw_text: str) -> List[Dict]:
+async def _llm_parse_chunk(chunk: str, semaphore) -> Optional[List[Dict]]:
+    """
+    조각 하나를 LLM으로 파싱 (semaphore로 동시 호출 수 제한).
+    JSON 출력 모드로 Schedule을 바로 만들고, 응답이 JSON/스키마 검증에 실패하면 키-값 텍스트 변환 + Classic 재파싱으로
+    대신한다. 호출 자체가 실패(deadline, breaker, 공급자 오류)하면 텍스트 모드로 다시 보내지 않는다. 실패 시 None
+    """
+    from services.llm_parser import parse_with_llm, parse_with_llm_json, LLM_OUTPUT_FORMAT
+
+    async with semaphore:
+        if LLM_OUTPUT_FORMAT == 'json':
+            try:
+                fields = await parse_with_llm_json(chunk)
+            except Exception as e:
+                logging.getLogger(__name__).error(f"LLM parsing failed: {e}")
+                return None
+            if fields is not None:
+                count_parse('llm_json_chunks')
+                return [schedule_from_llm_fields(item).to_dict() for item in fields]
+        converted_text = await parse_with_llm(chunk)
+    if not converted_text:
+        return None
+    count_parse('llm_text_chunks')
+    return parse_llm_text_output(converted_text)
+
+async def _parse_texts_with_llm(texts: List[str]) -> List[List[List[Dict]]]:
+    """
+    각 텍스트를 조각으로 나눠 LLM으로 파싱 (모든 조각이 동시 호출 수 제한 하나를 공유).
+    텍스트별로 성공한 조각들의 스케줄 목록을 반환한다.
+    """
+    import asyncio
+    logger = logging.getLogger(__name__)
+
+    chunked = _chunk_texts_for_llm(texts)
+    semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENT_CHUNKS)
+
+    async def convert(chunks: List[str]) -> List[List[Dict]]:
+        results = await asyncio.gather(*(_llm_parse_chunk(chunk, semaphore) for chunk in chunks))
+        parsed = [result for result in results if result is not None]
+        if parsed and len(parsed) < len(chunks):
+            logger.warning(f"LLM parsing failed for {len(chunks) - len(parsed)}/{len(chunks)} chunks")
+        return parsed
+
+    with parse_stage('llm_convert'):
+        return list(await asyncio.gather(*(convert(chunks) for chunks in chunked)))
+
+async def parse_schedules_hybrid_llm_async(raw_text: str) -> List[Dict]:
+    """
+    하이브리드 파서 (Classic + GPT-4)
+    Classic 파서를 매니저 블록 단위로 돌려, 필수 필드 4개(날짜, 시간, 장소, 신랑신부)를 모두 파싱한 블록은
+    그대로 쓰고 실패한 블록의 원문만 GPT-4로 보낸다 (블록들은 동시에 변환).
+    Classic이 아무 스케줄도 찾지 못하면 예전처럼 전체 텍스트를 GPT-4로 파싱한다.
+    블록 수는 프로파일 카운터 hybrid_classic_blocks / hybrid_llm_blocks로 남는다.
+    LLM circuit breaker가 열려 있으면 LLM을 건너뛰고 Classic 결과를 그대로 돌려준다 (카운터 llm_degraded).
+    Classic 파싱(CPU)은 워커 스레드에서 돌려 이벤트 루프를 막지 않는다.
+    """
+    import asyncio
+    logger = logging.getLogger(__name__)
+
+    # 먼저 Classic 시도 (블록 단위)
+    logger.info("Hybrid: Trying Classic parser first...")
+    blocks = await asyncio.to_thread(parse_classic_blocks, raw_text)
+
+    kept = [schedules for block, schedules in blocks if not _block_needs_llm(schedules, block)]
+    failing = [(block, schedules) for block, schedules in blocks if _block_needs_llm(schedules, block)]
+    count_parse('hybrid_classic_blocks', len(kept))
+
+    if not failing:
+        if any(kept):
+            result = merge_schedule_dicts(kept)
+            logger.info(f"Hybrid: Classic parser succeeded with {len(result)} schedules (all have required fields)")
+            return result
+        if _llm_circuit_open():
+            logger.warning("Hybrid: Classic parser found no schedules and LLM circuit is open, returning empty degraded result")
+            count_parse('llm_degraded')
+            return []
+        # Classic이 결과를 못 찾은 경우 전체를 GPT-4로
+        logger.info("Hybrid: Classic parser found no schedules. Falling back to GPT-4...")
+        count_parse('hybrid_llm_blocks', len(blocks))
+        return await parse_schedules_llm_async(raw_text)
+
+    # LLM 장애 중(circuit open)이면 기다리지 않고 Classic 결과로
+    if _llm_circuit_open():
+        result = merge_schedule_dicts(schedules for _, schedules in blocks)
+        logger.warning(f"Hybrid: LLM circuit is open, returning Classic result for {len(failing)} incomplete blocks (degraded)")
+        count_parse('llm_degraded')
+        return result
+
+    # 필수 필드가 누락된 블록만 GPT-4로 (변환 실패 시 그 블록은 Classic 결과 유지)
+    logger.info(f"Hybrid: {len(failing)}/{len(blocks)} blocks missing required fields. Sending them to GPT-4...")
+    count_parse('hybrid_llm_blocks', len(failing))
+    try:
+        converted = await _parse_texts_with_llm([block for block, _ in failing])
+    except Exception as e:
+        logger.error(f"Hybrid: GPT-4 fallback failed, keeping Classic result: {e}")
+        converted = [[] for _ in failing]
+
+    results = list(kept)
+    fell_back = False
+    for (block, schedules), chunk_results in zip(failing, converted):
+        if any(chunk_results):
+            results.extend(chunk_results)
+        else:
+            logger.warning("Hybrid: GPT-4 returned no schedules for a block, keeping Classic result")
+            results.append(schedules)
+            fell_back = True
+    # 파싱 도중 breaker가 열려 Classic 결과로 대신한 블록이 있으면 degraded
+    if fell_back and _llm_circuit_open():
+        count_parse('llm_degraded')
+
+    result = merge_schedule_dicts(results)
+    logger.info(f"Hybrid: {len(result)} schedules ({len(kept)} Classic blocks, {len(failing)} GPT-4 blocks)")
+    return result
+
+async def parse_schedules_llm_async(raw_text: str) -> List[Dict]:
     """
     GPT-4 기반 파서 (OpenAI GPT-4.1-nano)
-    GPT-4가 Classic parser 형식으로 변환 → Classic parser가 즉시 재파싱
+    GPT-4가 스케줄을 JSON으로 추출 → Schedule로 바로 매핑 (JSON 실패 시 키-값 텍스트 변환 → Classic parser 재파싱)
+    LLM 호출은 공유 비동기 클라이언트(커넥션 풀)로 기다리는 동안 이벤트 루프를 양보한다.
     """
     try:
-        from services.llm_parser import parse_with_llm
-        import asyncio
-        import logging
         logger = logging.getLogger(__name__)
 
-        # async 함수 실행: GPT-4가 Classic parser 형식으로 변환
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        converted_text = loop.run_until_complete(parse_with_llm(raw_text))
-        loop.close()
+        if _llm_circuit_open():
+            count_parse('llm_degraded')
+            return {"error": "LLM 파서가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도하거나 Classic 파서를 사용하세요.", "success": False}
+
+        # GPT-4가 조각별로 스케줄 추출 (JSON → Schedule 직접 매핑, 실패 시 키-값 텍스트 재파싱)
+        chunk_results = (await _parse_texts_with_llm([raw_text]))[0]
 
-        if not converted_text:
+        if not chunk_results:
             logger.error("GPT-4 conversion returned empty result")
             return []
 
-        logger.info(f"GPT-4 converted text to Classic format ({len(converted_text)} chars)")
-        logger.debug(f"Converted text:\n{converted_text}")
+        # 조각 결과 병합 (날짜-시간-신랑신부 중복 제거)
+        parsed_schedules = merge_schedule_dicts(chunk_results)
 
-        # Classic parser로 즉시 재파싱
-        logger.info("Re-parsing with Classic parser...")
-        parsed_schedules = parse_schedules_classic_only(converted_text)
-
-        logger.info(f"Classic parser found {len(parsed_schedules)} schedules")
+        logger.info(f"GPT-4 parsed {len(chunk_results)} chunk(s): {len(parsed_schedules)} schedules")
         return parsed_schedules
 
     except ImportError:
@@ -1655,8 +2854,103 @@ def parse_schedules_llm(raw_text: str) -> List[Dict]:
     except Exception as e:
         return {"error": f"LLM 파서 오류: {str(e)}", "success": False}
 
-def parse_schedules_classic_only(raw_text: str) -> List[Dict]:
-    """클래식 파서만 사용 (패턴 1-3만, NLP 비활성화)"""
+async def parse_llm_events(raw_text: str, hybrid: bool = False) -> AsyncIterator[ParseEvent]:
+    """
+    LLM / 하이브리드 파서의 스트리밍 버전: 조각 LLM 호출이 끝나는 순서대로 스케줄 이벤트를 내보낸다.
+    hybrid=True면 Classic이 완전히 파싱한 블록의 스케줄을 먼저 내보내고 실패 블록만 LLM으로 보낸다
+    (LLM이 아무것도 못 찾은 블록은 Classic 결과를 내보냄 — parse_schedules_hybrid_llm_async와 같은 규칙).
+    진행 이벤트: {"chunks_done", "chunks_total", "schedules"} (하이브리드는 classic_blocks / llm_blocks 포함,
+    LLM circuit breaker가 열려 Classic 결과로 대신하면 "degraded": True)
+    LLM 전용 파싱에서 breaker가 열려 있으면 CircuitOpenError
+    """
+    import asyncio
+
+    dedup = _StreamDeduplicator()
+    keys = set()
+
+    def emit(schedules: List[Dict]) -> Iterator[ParseEvent]:
+        for sch in dedup.feed_dicts(schedules):
+            event = schedule_event(sch)
+            keys.add(event.data["key"])
+            yield event
+
+    texts, fallbacks, progress = [raw_text], [None], {}
+    if hybrid:
+        blocks = await asyncio.to_thread(parse_classic_blocks, raw_text)
+        kept = [schedules for block, schedules in blocks if not _block_needs_llm(schedules, block)]
+        failing = [(block, schedules) for block, schedules in blocks if _block_needs_llm(schedules, block)]
+        count_parse('hybrid_classic_blocks', len(kept))
+        count_parse('hybrid_llm_blocks', len(failing) if failing or any(kept) else len(blocks))
+        progress = {"classic_blocks": len(kept), "llm_blocks": len(failing)}
+        for schedules in kept:
+            for event in emit(schedules):
+                yield event
+        if failing:
+            texts = [block for block, _ in failing]
+            fallbacks = [schedules for _, schedules in failing]
+        elif any(kept):
+            texts, fallbacks = [], []
+        if texts and _llm_circuit_open():
+            # LLM 장애 중: 실패 블록도 Classic 결과로 (batch와 같은 규칙)
+            count_parse('llm_degraded')
+            progress["degraded"] = True
+            for schedules in fallbacks:
+                for event in emit(schedules or []):
+                    yield event
+            texts, fallbacks = [], []
+    elif _llm_circuit_open():
+        from services.llm_resilience import CircuitOpenError
+        count_parse('llm_degraded')
+        raise CircuitOpenError("LLM circuit breaker is open")
+
+    chunked = _chunk_texts_for_llm(texts)
+    semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENT_CHUNKS)
+
+    async def run(index: int, chunk: str) -> Tuple[int, Optional[List[Dict]]]:
+        return index, await _llm_parse_chunk(chunk, semaphore)
+
+    tasks = [asyncio.ensure_future(run(index, chunk)) for index, chunks in enumerate(chunked) for chunk in chunks]
+    found = [False] * len(texts)
+    try:
+        with parse_stage('llm_convert'):
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                index, schedules = await next_result
+                if schedules:
+                    found[index] = True
+                    for event in emit(schedules):
+                        yield event
+                yield ParseEvent('progress', {"chunks_done": done, "chunks_total": len(tasks), "schedules": len(keys), **progress})
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    # 하이브리드: LLM이 스케줄을 못 찾은 블록은 Classic 결과 유지
+    for index, schedules in enumerate(fallbacks):
+        if schedules and not found[index]:
+            for event in emit(schedules):
+                yield event
+            if not progress.get("degraded") and _llm_circuit_open():
+                count_parse('llm_degraded')
+                progress["degraded"] = True
+    yield ParseEvent('progress', {"chunks_done": len(tasks), "chunks_total": len(tasks), "schedules": len(keys), **progress, "done": True})
+
+def parse_schedules_hybrid_llm(raw_text: str) -> List[Dict]:
+    """parse_schedules_hybrid_llm_async의 동기 버전 (이벤트 루프 밖에서 호출)"""
+    import asyncio
+    return asyncio.run(parse_schedules_hybrid_llm_async(raw_text))
+
+def parse_schedules_llm(raw_text: str) -> List[Dict]:
+    """parse_schedules_llm_async의 동기 버전 (이벤트 루프 밖에서 호출)"""
+    import asyncio
+    return asyncio.run(parse_schedules_llm_async(raw_text))
+
+def parse_schedules_classic_only(raw_text: str, parallel: Optional[bool] = None,
+                                 deadline: Optional[_ParseDeadline] = None) -> List[Dict]:
+    """
+    클래식 파서만 사용 (패턴 1-3만, NLP 비활성화). parallel은 parse_schedules와 동일.
+    deadline을 주면 매니저 블록마다 확인해 지나면 그때까지의 스케줄만 돌려준다 (parse_schedules_classic_guarded)
+    """
+    count_parse('lines', raw_text.count('\n') + 1)
     chat_format = detect_chat_format(raw_text)
 
     # Handle asterisk format (※ 표기 신규 거래처 포맷)
@@ -1673,221 +2967,167 @@ def parse_schedules_classic_only(raw_text: str) -> List[Dict]:
         parsed_schedules = parse_compact_format(raw_text)
         return [sch.to_dict() for sch in parsed_schedules]
 
-    speaker_blocks = split_chat_by_speaker(raw_text)
+    speaker_blocks = split_chat_by_speaker(raw_text, chat_format)
+    count_parse('speaker_blocks', len(speaker_blocks))
 
     if not speaker_blocks:
         # 일반 텍스트인 경우 클래식 패턴만 시도
-        parsed_schedules = parse_manager_block_classic_only(raw_text)
+        with parse_stage('parse_blocks'):
+            parsed_schedules = parse_manager_block_classic_only(raw_text)
         return [sch.to_dict() for sch in parsed_schedules]
 
     manager_speaker = find_manager_speaker(speaker_blocks)
     final_schedules: Dict[str, Schedule] = {}
 
-    for speaker, content in speaker_blocks:
-        if speaker == manager_speaker:
-            parsed_schedules = parse_manager_block_classic_only(content)
+    manager_blocks = [content for speaker, content in speaker_blocks if speaker == manager_speaker]
+    count_parse('manager_blocks', len(manager_blocks))
+    del speaker_blocks  # 다른 화자의 블록 문자열은 여기서 해제 (피크 메모리)
+    with parse_stage('parse_blocks'):
+        for parsed_schedules in map_manager_blocks(parse_manager_block_classic_only, manager_blocks, _use_parallel(raw_text, parallel)):
+            count_parse('parsed_schedules', len(parsed_schedules))
             for sch in parsed_schedules:
-                key = f"{sch.date}-{sch.time}-{sch.couple}"
+                key = schedule_key(sch)
                 if key not in final_schedules:
                     final_schedules[key] = sch
                 else:
                     if is_better_schedule(final_schedules[key], sch):
                         final_schedules[key] = sch
+            if deadline is not None and deadline.check_deadline():
+                break
 
+    del manager_blocks
+    count_parse('schedules', len(final_schedules))
     return [sch.to_dict() for sch in final_schedules.values()]
 
 def parse_manager_block_classic_only(block_text: str) -> List[Schedule]:
     """클래식 패턴만 사용하는 parse_manager_block"""
     schedules = []
     current_year = datetime.now().year
-    lines = [line.strip() for line in block_text.splitlines() if line.strip() and not line.startswith('---')]
+    tokens = tokenize_block(block_text)
+    lines = [token.date or token.text for token in tokens]
 
     # Find all schedule start indices (line 1 of the 4-line core)
-    start_indices = []
-    for i, line in enumerate(lines):
-        if is_valid_date(line):
-            start_indices.append(i)
-            clean_date = extract_date(line)
-            if clean_date:
-                lines[i] = clean_date
+    start_indices = _schedule_start_indices(tokens)
 
     # 클래식 모드에서는 NLP 파서 호출 안함
     if not start_indices:
         return []
 
     for i, start_idx in enumerate(start_indices):
-        end_idx = start_indices[i+1] if (i + 1) < len(start_indices) else len(lines)
-        schedule_lines = lines[start_idx:end_idx]
-
-        if len(schedule_lines) < 4:
-            continue
-
-        # Core 4-line block validation
-        date, location, time, couple = schedule_lines[0], schedule_lines[1], schedule_lines[2], schedule_lines[3]
-        if not (is_valid_date(date) and is_valid_time(time) and is_valid_couple(couple)):
+        end_idx = start_indices[i+1] if (i + 1) < len(start_indices) else len(tokens)
+        sch = _parse_core_schedule(tokens[start_idx:end_idx])
+        if not sch:
             continue
 
-        # 신랑신부 이름 분리 처리
-        separated_couple = separate_couple_names(couple)
-        sch = Schedule(date=date, location=clean_location(location), time=time, couple=separated_couple)
+        schedules.append(sch)
 
-        # Subtractive parsing on the rest of the lines
-        remaining_lines = schedule_lines[4:]
-        processed_indices = set()
+    # 클래식 패턴 1-3만 적용: 블록 전체를 한 번만 훑는다 (스케줄마다 다시 훑지 않음)
+    if schedules:
+        for line in lines:
+            compact = parse_compact_line(line, current_year)
+            if compact:
+                schedules.append(compact)
 
-        if remaining_lines:
-            sch.manager = remaining_lines.pop(-1).strip()
-            # Standardize contractor names
-            if '그랜드 블랑' in sch.manager:
-                sch.manager = sch.manager.replace('그랜드 블랑', '그랜드블랑')
+    return schedules
 
-        # First, check for contact number in the first line only (right after couple names)
-        if remaining_lines:
-            contact = parse_contact(remaining_lines[0])
-            if contact:
-                sch.contact = contact
-                processed_indices.add(0)
-
-        j = 0
-        while j < len(remaining_lines):
-            line = remaining_lines[j]
-            is_known_pattern = False
-
-            # Skip contact parsing since we already handled it above
-            if j == 0 and sch.contact:
-                is_known_pattern = True
-
-            brand, album = parse_brand_album(line)
-            if brand or album:
-                if brand: sch.brand = brand
-                if album: sch.album = album
-                processed_indices.add(j); is_known_pattern = True
-
-            # Extract photographer name by removing contact and role info
-            name_part = re.sub(r'010[- .]?\d{4}[- .]?\d{4}', '', line).strip()
-            name_part = re.sub(r'\([^)]*\)', '', name_part).strip()  # Remove parentheses content like (메인), (서브)
-            name_part = re.sub(r'‭|‬', '', name_part).strip()  # Remove invisible characters
-
-            if is_valid_photographer_name(name_part):
-                photographers = [name_part]
-                processed_indices.add(j); is_known_pattern = True
-
-                # Check next line for additional photographer
-                if (j + 1) < len(remaining_lines):
-                    next_line = remaining_lines[j+1]
-                    next_name_part = re.sub(r'010[- .]?\d{4}[- .]?\d{4}', '', next_line).strip()
-                    next_name_part = re.sub(r'\([^)]*\)', '', next_name_part).strip()
-                    next_name_part = re.sub(r'‭|‬', '', next_name_part).strip()
-
-                    if is_valid_photographer_name(next_name_part):
-                        photographers.append(next_name_part)
-                        processed_indices.add(j + 1)
-                        j += 1  # Skip next line since we processed it
-
-                sch.photographer = ", ".join(photographers)
-                is_known_pattern = True
-
-            # Only mark as needs_review if line is not empty and not a known pattern
-            # We'll handle comments content separately
-            if not is_known_pattern and line.strip():
-                sch.needs_review = True
-                if not sch.review_reason:
-                    sch.review_reason = "알 수 없는 내용"
-
-            j += 1
-
-        # Create comments from unprocessed lines
-        sch.memo = "\n".join(remaining_lines[k] for k in range(len(remaining_lines)) if k not in processed_indices).strip()
-
-        # If we have comments content, it means there were unprocessed lines
-        # Reset needs_review to False since comments content is intentional
-        if sch.memo:
-            sch.needs_review = False
-            sch.review_reason = ""
-
-        # Mark for review if critical fields are missing
-        missing_fields = []
-        if not sch.brand: missing_fields.append("브랜드")
-        if not sch.album: missing_fields.append("앨범")
-        if not sch.photographer: missing_fields.append("작가")
-        if not sch.manager: missing_fields.append("계약자")
-
-        if missing_fields:
-            sch.needs_review = True
-            sch.review_reason = f"필수 필드 누락: {', '.join(missing_fields)}"
+# === Batch Parsing ===
+# 전달받은 메시지 여러 개를 요청 한 번으로 파싱한다 (/api/parse-batch).
+# Classic 항목은 합친 크기가 BATCH_PARALLEL_MIN_CHARS 이상이면 항목 단위로 프로세스 풀에 나눠 보내고,
+# LLM/하이브리드 항목은 BATCH_MAX_CONCURRENT_LLM_ITEMS개까지 동시에 변환한다 (두 그룹도 동시에 진행).
+# 항목 사이 중복은 parse_schedules와 같은 'date-time-couple' 키로 합친다 (merge_batch_results).
+
+BATCH_MAX_ITEMS = int(os.getenv('PARSE_BATCH_MAX_ITEMS', '100'))
+BATCH_PARALLEL_MIN_CHARS = int(os.getenv('PARSE_BATCH_PARALLEL_MIN_CHARS', '200000'))
+BATCH_MAX_CONCURRENT_LLM_ITEMS = int(os.getenv('PARSE_BATCH_MAX_CONCURRENT_LLM', '4'))
+
+class BatchItemResult(NamedTuple):
+    data: Optional[List[Dict]]      # 실패 시 None
+    error: Optional[str]
+    seconds: float
+    degraded: bool = False          # LLM 장애로 Classic 결과를 대신 씀
+    duplicates: int = 0             # 앞 항목에 이미 있던 스케줄 수 (merge_batch_results에서 채움)
+    partial: bool = False           # Classic 항목이 시간 예산을 넘겨 일부만 파싱됨 (parse_schedules_classic_guarded)
+
+def _parse_classic_batch_item(text: str) -> BatchItemResult:
+    """Worker entry point: classic-parse one batch item (line cap + time budget), capturing its error and duration."""
+    start = time.perf_counter()
+    try:
+        result = parse_schedules_classic_guarded(text, parallel=False)
+    except Exception as e:
+        return BatchItemResult(None, str(e), time.perf_counter() - start)
+    return BatchItemResult(result.data, None, time.perf_counter() - start, partial=result.partial)
 
-        # 촬영단가 자동 계산 (클래식 파서에서도)
-        if sch.brand and sch.album and sch.date:
-            sch.price = calculate_price(sch.brand, sch.album, sch.date)
+def parse_classic_batch(texts: List[str], parallel: Optional[bool] = None) -> List[BatchItemResult]:
+    """
+    Classic-parse every text, returning results in input order.
+    parallel: None이면 워커 수/항목 수/합친 크기로 자동 결정. 프로세스 풀을 쓸 수 없으면 직렬로 파싱한다.
+    """
+    if parallel is None:
+        parallel = (PARALLEL_PARSE_WORKERS > 1 and len(texts) > 1
+                    and sum(map(len, texts)) >= BATCH_PARALLEL_MIN_CHARS)
+    if parallel:
+        try:
+            return list(_get_process_pool().map(_parse_classic_batch_item, texts))
+        except (OSError, BrokenProcessPool) as e:
+            logging.getLogger(__name__).warning(f"Parallel batch parsing unavailable, falling back to serial: {e}")
+            shutdown_process_pool()
+    return [_parse_classic_batch_item(text) for text in texts]
+
+async def _parse_llm_batch_item(text: str, engine: str, semaphore) -> BatchItemResult:
+    """LLM / 하이브리드 항목 하나 (항목별 프로필로 degraded 여부를 본다)"""
+    async with semaphore:
+        start = time.perf_counter()
+        parse = parse_schedules_hybrid_llm_async if engine == 'hybrid' else parse_schedules_llm_async
+        with profile_parse() as profile:
+            try:
+                data = await parse(text)
+            except Exception as e:
+                return BatchItemResult(None, str(e), time.perf_counter() - start)
+        degraded = bool(profile.counters.get('llm_degraded'))
+        if isinstance(data, dict):
+            return BatchItemResult(None, data.get('error', 'LLM parse failed'), time.perf_counter() - start, degraded)
+        return BatchItemResult(data, None, time.perf_counter() - start, degraded)
+
+async def parse_batch_async(items: List[Tuple[str, str]]) -> List[BatchItemResult]:
+    """
+    (text, engine) 항목들을 파싱해 같은 순서의 BatchItemResult 목록을 돌려준다.
+    Classic 항목은 워커 스레드에서(크면 프로세스 풀로), LLM/하이브리드 항목은 동시 실행 수 제한을 두고 비동기로 처리한다.
+    """
+    import asyncio
 
-        schedules.append(sch)
+    results: List[Optional[BatchItemResult]] = [None] * len(items)
+    classic = [index for index, (_, engine) in enumerate(items) if engine == 'classic']
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENT_LLM_ITEMS)
 
-        # 클래식 패턴 1-3만 적용
-        for line in lines:
-            # 패턴 1: MM월 DD일 HH시MM분 장소 신랑 신부 - 작가
-            schedule_match = re.match(
-                r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시(\d{1,2})분\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-                line
-            )
-            if schedule_match:
-                month, day, hour, minute, location, groom, bride, photographer = schedule_match.groups()
-                month, day, hour, minute = int(month), int(day), int(hour), int(minute)
-
-                date = f"{current_year}.{month:02d}.{day:02d}"
-                time = f"{hour:02d}:{minute:02d}"
-                couple = f"{groom} {bride}"
-
-                schedule = Schedule(
-                    date=date, location=clean_location(location), time=time, couple=couple,
-                    photographer=photographer, manager="", brand="", album="",
-                    contact="", memo="", needs_review=True,
-                    review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-                )
-                schedules.append(schedule)
-                continue
+    async def run_classic() -> None:
+        if classic:
+            parsed = await asyncio.to_thread(parse_classic_batch, [items[index][0] for index in classic])
+            for index, result in zip(classic, parsed):
+                results[index] = result
 
-            # 패턴 2: MM월 DD일 HH:MM시 장소 신랑 신부 - 작가 (콜론 형태)
-            schedule_match = re.match(
-                r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2}):(\d{2})시\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-                line
-            )
-            if schedule_match:
-                month, day, hour, minute, location, groom, bride, photographer = schedule_match.groups()
-                month, day, hour, minute = int(month), int(day), int(hour), int(minute)
-
-                date = f"{current_year}.{month:02d}.{day:02d}"
-                time = f"{hour:02d}:{minute:02d}"
-                couple = f"{groom} {bride}"
-
-                schedule = Schedule(
-                    date=date, location=clean_location(location), time=time, couple=couple,
-                    photographer=photographer, manager="", brand="", album="",
-                    contact="", memo="", needs_review=True,
-                    review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-                )
-                schedules.append(schedule)
-                continue
+    async def run_llm(index: int) -> None:
+        text, engine = items[index]
+        results[index] = await _parse_llm_batch_item(text, engine, semaphore)
 
-            # 패턴 3: MM월 DD일 HH시 장소 신랑 신부 - 작가 (기본 형태)
-            schedule_match = re.match(
-                r'^(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s+(.+?)\s+([가-힣]+)\s+([가-힣]+)\s*-\s*([가-힣]+)\s*작가',
-                line
-            )
-            if schedule_match:
-                month, day, hour, location, groom, bride, photographer = schedule_match.groups()
-                month, day, hour = int(month), int(day), int(hour)
-
-                date = f"{current_year}.{month:02d}.{day:02d}"
-                time = f"{hour:02d}:00"
-                couple = f"{groom} {bride}"
-
-                schedule = Schedule(
-                    date=date, location=clean_location(location), time=time, couple=couple,
-                    photographer=photographer, manager="", brand="", album="",
-                    contact="", memo="", needs_review=True,
-                    review_reason="간결한 형식: 브랜드, 앨범, 계약자 정보 누락"
-                )
-                schedules.append(schedule)
-                continue
+    count_parse('batch_items', len(items))
+    await asyncio.gather(run_classic(), *(run_llm(index) for index, (_, engine) in enumerate(items) if engine != 'classic'))
+    return results
 
-    return schedules
\ No newline at end of file
+def merge_batch_results(results: List[BatchItemResult]) -> Tuple[List[Dict], List[BatchItemResult]]:
+    """
+    항목 결과를 'date-time-couple' 키로 합친 스케줄 목록과,
+    항목마다 앞 항목과 겹친 스케줄 수(duplicates)를 채운 결과 목록을 돌려준다.
+    스케줄 dict는 그대로 합친다 (cuts 같은 Schedule 필드 밖의 키도 남음).
+    스케줄이 dict가 아닌 항목은 그 항목만 오류 결과로 바꾸고 병합에서 빼서, 나머지 항목은 그대로 돌려준다.
+    """
+    seen = set()
+    counted = []
+    for result in results:
+        try:
+            keys = {schedule_dict_key(d) for d in result.data or []}
+        except (AttributeError, TypeError) as e:
+            counted.append(result._replace(data=None, error=f"Invalid schedule data: {e}"))
+            continue
+        counted.append(result._replace(duplicates=len(keys & seen)))
+        seen |= keys
+    return merge_schedule_dicts(result.data for result in counted if result.data), counted
@@ -1,13 +1,257 @@
-from fastapi import APIRouter, UploadFile, File
+import io
+import json
+import asyncio
+from typing import Optional
 
-from parser import parse_schedules, parse_schedules_classic_only, parse_schedules_llm, parse_schedules_hybrid_llm
-from schemas.parser import ParseTextRequest
+from fastapi import APIRouter, UploadFile, File, Query, Depends
+from fastapi.concurrency import run_in_threadpool, iterate_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from parser import (
+    parse_schedules,
+    parse_schedules_llm_async,
+    parse_schedules_hybrid_llm_async,
+    parse_schedules_guarded,
+    parse_schedules_classic_guarded,
+    chat_fingerprint,
+    split_incremental_tail,
+    profile_parse,
+    iter_parse_events,
+    parse_llm_events,
+    schedule_event,
+    parse_batch_async,
+    merge_batch_results,
+    BatchItemResult,
+    BATCH_MAX_ITEMS,
+    PARSE_STAGE_HISTOGRAMS,
+)
+from schemas.parser import ParseTextRequest, ParseBatchRequest
+from database import get_database
+from routers.schedules import import_parsed_schedules
+from services.parse_cache import parse_cache, make_cache_key, hash_text, hash_lines, normalize_text
+from services.chat_fingerprints import chat_fingerprints
+from services.llm_cache import llm_cache
+from services.llm_resilience import llm_caller
+from services.parse_jobs import parse_jobs, ParseJobQueueFull
 
 router = APIRouter()
 
 # Data File Path
 DATA_FILE_PATH = '../.screenshot/KakaoTalk_20250814_1307_38_031_KPAG_매니저.txt'
 
+# 이 크기 이상의 업로드는 classic 엔진에서 전체를 읽지 않고 줄 단위 스트리밍으로 파싱
+STREAM_PARSE_MIN_BYTES = 1 * 1024 * 1024
+
+PARSE_ENGINES = ("classic", "llm", "hybrid")
+
+# 스트리밍 응답 형식: Server-Sent Events 또는 줄 단위 JSON
+STREAM_FORMATS = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+
+
+async def _run_parser(text: str, engine: str, source: str = ""):
+    """
+    engine에 맞는 파서 실행.
+    Classic 파싱(CPU)은 스레드 풀에서, LLM 호출은 비동기로 기다려 이벤트 루프를 막지 않는다.
+    """
+    if engine == "classic":
+        # 붙여넣은 텍스트도 업로드와 같은 줄 길이 한도/시간 예산 (예산을 넘기면 partial 결과)
+        print(f"📜 Running classic-only parser{source}...")
+        result = await run_in_threadpool(parse_schedules_classic_guarded, text)
+        data = result.data
+        print(f"📜 Classic parser result: {len(data)} schedules"
+              + (f" (partial, stopped after {result.seconds:.1f}s)" if result.partial else ""))
+    elif engine == "llm":
+        print(f"🧠 Running GPT-4 parser{source}...")
+        data = await parse_schedules_llm_async(text)
+        print(f"🧠 GPT-4 parser result: {len(data)} schedules")
+    else:
+        print(f"🔀 Running hybrid parser (Classic+GPT-4){source}...")
+        data = await parse_schedules_hybrid_llm_async(text)
+        print(f"🔀 Hybrid parser result: {len(data)} schedules")
+    return data
+
+
+async def _cached_parse(text_hash: str, engine: str, run, profile=None):
+    """
+    캐시에 결과가 있으면 돌려주고, 없으면 await run()으로 파싱 후 저장. (data, 캐시 정보) 반환
+    profile을 주면 LLM 장애로 Classic 결과를 대신 쓴(degraded) 파싱과 시간 예산을 넘긴(partial) 파싱은 캐시하지 않는다.
+    """
+    key = make_cache_key(text_hash, engine)
+    data = parse_cache.get(key)
+    hit = data is not None
+    if hit:
+        print(f"⚡ Parse cache hit ({engine}): {len(data)} schedules")
+    else:
+        data = await run()
+        # 오류 응답(dict)과 degraded/partial 결과는 캐시하지 않는다
+        if isinstance(data, list) and not _is_degraded(profile) and not _is_partial(profile):
+            parse_cache.put(key, data)
+    return data, {"hit": hit, **parse_cache.stats()}
+
+
+def _is_degraded(profile) -> bool:
+    """LLM circuit breaker가 열려 LLM 대신 Classic 결과를 돌려줬는지"""
+    return profile is not None and bool(profile.counters.get("llm_degraded"))
+
+
+def _is_partial(profile) -> bool:
+    """guarded 파싱이 시간 예산을 넘겨 입력 일부만 파싱했는지"""
+    return profile is not None and bool(profile.counters.get("guard_budget_exceeded"))
+
+
+def _guard_fields(profile) -> dict:
+    """응답에 붙이는 guarded 파싱 결과: 시간 예산 초과(partial)와 줄 길이 한도로 잘린 줄 수"""
+    return {"partial": _is_partial(profile), "truncated_lines": profile.counters.get("guard_truncated_lines", 0)}
+
+
+def _engine_blocks(engine: str, profile) -> Optional[dict]:
+    """hybrid 엔진에서 Classic / GPT-4가 각각 처리한 매니저 블록 수 (캐시 적중 등으로 파싱하지 않았으면 None)"""
+    if engine != "hybrid" or "hybrid_classic_blocks" not in profile.counters:
+        return None
+    return {
+        "classic": profile.counters.get("hybrid_classic_blocks", 0),
+        "llm": profile.counters.get("hybrid_llm_blocks", 0),
+    }
+
+
+# 꼬리만 따로 파싱하므로 매니저 화자(find_manager_speaker)도 꼬리 안의 턴만 보고 다시 고른다.
+# 꼬리에서 다른 화자가 일정을 더 많이 올렸으면 이전 업로드와 다른 화자가 매니저로 잡힐 수 있어 응답에 적어 둔다.
+INCREMENTAL_MANAGER_NOTE = "Manager speaker was detected from the new messages only, not from the whole chat."
+
+
+async def _parse_incremental(raw_content: str, engine: str, user_id: str):
+    """
+    이전 업로드 지문과 비교해 새로 덧붙은 꼬리만 파싱하고, 새 지문을 저장.
+    지문은 꼬리를 빠짐없이 파싱했을 때만 저장한다 (오류 응답, 시간 예산 초과(partial), LLM 장애(degraded)면
+    이전 지문을 그대로 두어 다음 업로드가 같은 꼬리를 다시 파싱하게 한다).
+    """
+    tail, skipped_chars = split_incremental_tail(raw_content, chat_fingerprints.get(user_id))
+    print(f"✂️ Incremental parse for {user_id}: skipped {skipped_chars}/{len(raw_content)} chars")
+
+    if tail.strip():
+        with profile_parse() as profile:
+            data, cache = await _cached_parse(
+                hash_text(tail), engine, lambda: _run_parser(tail, engine, " on new messages"), profile
+            )
+        blocks, degraded, guard = _engine_blocks(engine, profile), _is_degraded(profile), _guard_fields(profile)
+    else:
+        data, cache, blocks, degraded, guard = [], None, None, False, {"partial": False, "truncated_lines": 0}
+
+    complete = isinstance(data, list) and not degraded and not guard["partial"]
+    fingerprint = chat_fingerprint(raw_content) if complete else None
+    if fingerprint:
+        chat_fingerprints.put(user_id, fingerprint)
+
+    return {
+        "data": data,
+        "success": True,
+        "engine_used": engine,
+        "cache": cache,
+        "blocks": blocks,
+        "degraded": degraded,
+        **guard,
+        "incremental": {
+            "resumed": skipped_chars > 0,
+            "skipped_chars": skipped_chars,
+            "skipped_lines": raw_content.count('\n', 0, skipped_chars),
+            "parsed_chars": len(tail),
+            "total_chars": len(raw_content),
+            "fingerprint_saved": fingerprint is not None,
+            "note": INCREMENTAL_MANAGER_NOTE if skipped_chars > 0 else None,
+        },
+    }
+
+
+def _format_event(event: str, data, stream_format: str) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    if stream_format == "ndjson":
+        return f'{{"event": "{event}", "data": {payload}}}\n'
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _stream_parse(text: str, engine: str, stream_format: str):
+    """
+    파싱 이벤트를 SSE/NDJSON 문자열로 내보내는 async generator.
+    캐시에 결과가 있으면 바로 모두 내보내고, 없으면 스트리밍 파싱이 끝난 뒤 최종 결과를 캐시에 저장한다
+    (LLM 장애로 Classic 결과를 대신 쓴 degraded 결과와 시간 예산을 넘긴 partial 결과는 저장하지 않음).
+    마지막 이벤트는 done (또는 오류 시 error).
+    """
+    key = make_cache_key(hash_text(text), engine)
+    cached = parse_cache.get(key)
+    if cached is not None:
+        print(f"⚡ Parse cache hit ({engine}, stream): {len(cached)} schedules")
+        for sch in cached:
+            event = schedule_event(sch)
+            yield _format_event(event.event, event.data, stream_format)
+        yield _format_event("done", {"schedules": len(cached), "engine_used": engine, "cache": {"hit": True}}, stream_format)
+        return
+
+    print(f"🌊 Streaming {engine} parser ({len(text)} chars)...")
+    if engine == "classic":
+        events = iterate_in_threadpool(iter_parse_events(text, classic_only=True))
+    else:
+        events = parse_llm_events(text, hybrid=(engine == "hybrid"))
+
+    final_schedules = {}
+    degraded = partial = False
+    try:
+        async for event in events:
+            if event.event == "schedule":
+                final_schedules[event.data["key"]] = event.data["schedule"]
+            elif event.event == "progress":
+                degraded = degraded or bool(event.data.get("degraded"))
+                partial = partial or bool(event.data.get("partial"))
+            yield _format_event(event.event, event.data, stream_format)
+    except Exception as e:
+        yield _format_event("error", {"error": f"An error occurred during parsing: {str(e)}"}, stream_format)
+        return
+
+    data = list(final_schedules.values())
+    if not degraded and not partial:
+        parse_cache.put(key, data)
+    print(f"🌊 Streaming parser result: {len(data)} schedules" + (" (partial)" if partial else ""))
+    yield _format_event(
+        "done", {"schedules": len(data), "engine_used": engine, "cache": {"hit": False}, "degraded": degraded,
+                 "partial": partial},
+        stream_format,
+    )
+
+
+def _streaming_response(text: str, engine: str, stream_format: str):
+    if engine not in PARSE_ENGINES:
+        return {"error": f"Unknown parser engine: {engine}", "success": False}
+    if stream_format not in STREAM_FORMATS:
+        return {"error": f"Unknown stream format: {stream_format}", "success": False}
+    return StreamingResponse(
+        _stream_parse(text, engine, stream_format),
+        media_type=STREAM_FORMATS[stream_format],
+        # 프록시(nginx 등)가 이벤트를 모아 보내지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 작업 진행 이벤트 구독 시 상태 확인 간격 (초)
+JOB_EVENT_POLL_SECONDS = 0.5
+
+
+async def _stream_job(job_id: str, stream_format: str):
+    """파싱 작업의 진행 상황이 바뀔 때마다 progress 이벤트를, 끝나면 done(결과 포함) 이벤트를 보낸다"""
+    last = None
+    while True:
+        job = parse_jobs.get(job_id)
+        if job is None:
+            yield _format_event("error", {"error": f"Parse job not found or expired: {job_id}"}, stream_format)
+            return
+        if job.finished:
+            yield _format_event("done", job.to_dict(), stream_format)
+            return
+        state = (job.status, dict(job.progress))
+        if state != last:
+            last = state
+            yield _format_event("progress", job.to_dict(include_result=False), stream_format)
+        await asyncio.sleep(JOB_EVENT_POLL_SECONDS)
+
 
 # --- API Endpoints ---
 
@@ -25,7 +269,7 @@ def parse_from_file():
 
 
 @router.post("/api/parse-text")
-def parse_from_text(request: ParseTextRequest):
+async def parse_from_text(request: ParseTextRequest):
     """Receives raw text and engine selection, parses it, and returns the schedules."""
     try:
         text = request.text
@@ -33,60 +277,311 @@ def parse_from_text(request: ParseTextRequest):
 
         # Select parser based on engine parameter
         print(f"🔧 Using engine: {engine}")
-        if engine == "classic":
-            print("📜 Running classic-only parser...")
-            data = parse_schedules_classic_only(text)
-            print(f"📜 Classic parser result: {len(data)} schedules")
-        elif engine == "llm":
-            print("🧠 Running GPT-4 parser...")
-            data = parse_schedules_llm(text)
-            print(f"🧠 GPT-4 parser result: {len(data)} schedules")
-        elif engine == "hybrid":
-            print("🔀 Running hybrid parser (Classic+GPT-4)...")
-            data = parse_schedules_hybrid_llm(text)
-            print(f"🔀 Hybrid parser result: {len(data)} schedules")
-        else:
+        if engine not in PARSE_ENGINES:
             return {"error": f"Unknown parser engine: {engine}", "success": False}
 
-        return {"data": data, "success": True, "engine_used": engine}
+        with profile_parse() as profile:
+            data, cache = await _cached_parse(hash_text(text), engine, lambda: _run_parser(text, engine), profile)
+
+        response = {
+            "data": data, "success": True, "engine_used": engine, "cache": cache,
+            "blocks": _engine_blocks(engine, profile), "degraded": _is_degraded(profile), **_guard_fields(profile),
+        }
+        if request.timings:
+            response["timings"] = profile.to_dict()
+        return response
     except Exception as e:
         return {"error": f"An error occurred during parsing: {str(e)}", "success": False}
 
 
+@router.post("/api/parse-batch")
+async def parse_batch(request: ParseBatchRequest):
+    """
+    여러 메시지({text, engine})를 한 번에 파싱한다.
+    Classic 항목은 워커 풀에서, LLM/하이브리드 항목은 동시 실행 수 제한을 두고 함께 처리하며
+    항목별 결과/오류/시간과, 항목 사이 중복(날짜-시간-신랑신부)을 합친 전체 스케줄(data)을 돌려준다.
+    """
+    try:
+        items = request.items
+        if not items:
+            return {"error": "No items to parse", "success": False}
+        if len(items) > BATCH_MAX_ITEMS:
+            return {"error": f"Too many items: {len(items)} (max {BATCH_MAX_ITEMS})", "success": False}
+        unknown = sorted({item.engine for item in items} - set(PARSE_ENGINES))
+        if unknown:
+            return {"error": f"Unknown parser engine: {', '.join(unknown)}", "success": False}
+
+        # 캐시에 있는 항목은 건너뛰고 나머지만 파싱
+        keys = [make_cache_key(hash_text(item.text), item.engine) for item in items]
+        results = [None] * len(items)
+        cache_hits = [False] * len(items)
+        for index, key in enumerate(keys):
+            cached = parse_cache.get(key)
+            if cached is not None:
+                results[index], cache_hits[index] = BatchItemResult(cached, None, 0.0), True
+        misses = [index for index, result in enumerate(results) if result is None]
+        print(f"📦 Batch parse: {len(items)} items ({len(items) - len(misses)} cached)")
+
+        with profile_parse() as profile:
+            parsed = await parse_batch_async([(items[index].text, items[index].engine) for index in misses])
+        for index, result in zip(misses, parsed):
+            results[index] = result
+            # 오류 응답과 degraded/partial 결과는 캐시하지 않는다
+            if result.data is not None and not result.degraded and not result.partial:
+                parse_cache.put(keys[index], result.data)
+
+        data, results = merge_batch_results(results)
+        print(f"📦 Batch parse result: {len(data)} schedules")
+        return {
+            "data": data,
+            "success": True,
+            "items": [
+                {
+                    "index": index,
+                    "engine": items[index].engine,
+                    "success": result.error is None,
+                    "data": result.data or [],
+                    "error": result.error,
+                    "elapsed_ms": round(result.seconds * 1000, 3),
+                    "cache_hit": cache_hits[index],
+                    "degraded": result.degraded,
+                    "partial": result.partial,
+                    "duplicates": result.duplicates,
+                }
+                for index, result in enumerate(results)
+            ],
+            "timings": {"total_ms": round(profile.total_seconds * 1000, 3)},
+        }
+    except Exception as e:
+        return {"error": f"An error occurred during batch parsing: {str(e)}", "success": False}
+
+
+@router.post("/api/parse-and-import")
+async def parse_and_import(
+    request: ParseTextRequest,
+    user_id: str = Query(..., description="User ID"),
+    db: Session = Depends(get_database)
+):
+    """
+    파싱 → 기존 스케줄과 중복 확인 → 단가/태그 → 일괄 저장을 한 번에 (한 트랜잭션).
+    /api/parse-text + 클라이언트 중복 확인 + /api/schedules/batch를 대신한다.
+    """
+    try:
+        text, engine = request.text, request.engine
+        if engine not in PARSE_ENGINES:
+            return {"error": f"Unknown parser engine: {engine}", "success": False}
+
+        with profile_parse() as profile:
+            data, cache = await _cached_parse(hash_text(text), engine, lambda: _run_parser(text, engine), profile)
+        if isinstance(data, dict):
+            return data
+
+        def run_import():
+            try:
+                summary = import_parsed_schedules(db, user_id, data)
+                db.commit()
+                return summary
+            except Exception:
+                db.rollback()
+                raise
+
+        summary = await run_in_threadpool(run_import)
+        print(f"📥 Parse-and-import for {user_id}: {len(summary['inserted'])} inserted, "
+              f"{len(summary['skipped'])} skipped, {summary['needs_review']} need review")
+
+        response = {
+            "data": summary["inserted"],
+            "success": True,
+            "engine_used": engine,
+            "cache": cache,
+            "degraded": _is_degraded(profile),
+            **_guard_fields(profile),
+            "summary": {
+                "parsed": len(data),
+                "inserted": len(summary["inserted"]),
+                "skipped": len(summary["skipped"]),
+                "needs_review": summary["needs_review"],
+                "priced_by_rule": summary["priced_by_rule"],
+                "created_tags": summary["created_tags"],
+            },
+            "skipped": summary["skipped"],
+        }
+        if request.timings:
+            response["timings"] = profile.to_dict()
+        return response
+    except Exception as e:
+        return {"error": f"An error occurred during parse-and-import: {str(e)}", "success": False}
+
+
 @router.post("/api/parse-uploaded-file")
-async def parse_uploaded_file(file: UploadFile = File(...), engine: str = "classic"):
-    """Receives an uploaded file, parses it, and returns the schedules."""
+async def parse_uploaded_file(
+    file: UploadFile = File(...),
+    engine: str = "classic",
+    user_id: Optional[str] = None,
+    incremental: bool = False,
+):
+    """
+    Receives an uploaded file, parses it, and returns the schedules.
+    incremental=True (user_id 필요): 같은 사용자가 이전에 올린 내보내기 뒤에 덧붙은 새 메시지만 파싱한다.
+    """
     try:
         # Check file type
         if not file.filename.endswith('.txt'):
             return {"error": "Only .txt files are supported", "success": False}
 
+        print(f"🔧 File upload using engine: {engine}")
+        if engine not in PARSE_ENGINES:
+            return {"error": f"Unknown parser engine: {engine}", "success": False}
+
+        if incremental:
+            if not user_id:
+                return {"error": "user_id is required for incremental parsing", "success": False}
+            content = await file.read()
+            return await _parse_incremental(normalize_text(content.decode('utf-8')), engine, user_id)
+
+        # 대용량 내보내기: 업로드 스풀 파일을 줄 단위로 읽어 메모리 사용량을 일정하게 유지.
+        # 줄 길이 한도/시간 예산(parse_schedules_guarded)을 걸어 예산을 넘기면 partial 결과를 돌려준다
+        if engine == "classic" and (file.size or 0) >= STREAM_PARSE_MIN_BYTES:
+            await file.seek(0)
+            stream = io.TextIOWrapper(file.file, encoding='utf-8')
+            try:
+                # 캐시 키용 해시도 스트리밍으로 계산 (hash_text와 같은 값)
+                text_hash = await run_in_threadpool(hash_lines, stream)
+
+                def parse_stream():
+                    stream.seek(0)
+                    return parse_schedules_guarded(stream, classic_only=True)
+
+                async def run_streaming():
+                    print(f"🌊 Streaming classic parser on uploaded file ({file.size} bytes)...")
+                    result = await run_in_threadpool(parse_stream)
+                    print(f"🌊 Streaming parser result: {len(result.data)} schedules"
+                          + (f" (partial, stopped after {result.lines} lines)" if result.partial else ""))
+                    return result.data
+
+                with profile_parse() as profile:
+                    data, cache = await _cached_parse(text_hash, engine, run_streaming, profile)
+            finally:
+                stream.detach()
+            return {"data": data, "success": True, "engine_used": engine, "cache": cache, **_guard_fields(profile)}
+
         # Read file content
         content = await file.read()
         raw_content = content.decode('utf-8')
 
-        # Select parser based on engine parameter
-        print(f"🔧 File upload using engine: {engine}")
-        if engine == "classic":
-            print("📜 Running classic-only parser on uploaded file...")
-            data = parse_schedules_classic_only(raw_content)
-            print(f"📜 Classic parser result: {len(data)} schedules")
-        elif engine == "llm":
-            print("🧠 Running GPT-4 parser on uploaded file...")
-            data = parse_schedules_llm(raw_content)
-            print(f"🧠 GPT-4 parser result: {len(data)} schedules")
-        elif engine == "hybrid":
-            print("🔀 Running hybrid parser (Classic+GPT-4) on uploaded file...")
-            data = parse_schedules_hybrid_llm(raw_content)
-            print(f"🔀 Hybrid parser result: {len(data)} schedules")
-        else:
-            return {"error": f"Unknown parser engine: {engine}", "success": False}
+        with profile_parse() as profile:
+            data, cache = await _cached_parse(
+                hash_text(raw_content), engine, lambda: _run_parser(raw_content, engine, " on uploaded file"), profile
+            )
 
-        return {"data": data, "success": True, "engine_used": engine}
+        return {
+            "data": data, "success": True, "engine_used": engine, "cache": cache,
+            "blocks": _engine_blocks(engine, profile), "degraded": _is_degraded(profile), **_guard_fields(profile),
+        }
     except Exception as e:
         return {"error": f"An error occurred during file parsing: {str(e)}", "success": False}
 
 
+@router.post("/api/parse-text/stream")
+async def parse_from_text_stream(request: ParseTextRequest, format: str = "sse"):
+    """
+    /api/parse-text의 스트리밍 버전. 블록(classic) 또는 LLM 조각이 파싱될 때마다 schedule 이벤트를,
+    처리한 줄/조각 수를 progress 이벤트로 보내고 done 이벤트로 끝난다. format: sse | ndjson
+    """
+    print(f"🔧 Using engine (stream): {request.engine}")
+    return _streaming_response(request.text, request.engine, format)
+
+
+@router.post("/api/parse-uploaded-file/stream")
+async def parse_uploaded_file_stream(file: UploadFile = File(...), engine: str = "classic", format: str = "sse"):
+    """/api/parse-uploaded-file의 스트리밍 버전 (이벤트 형식은 /api/parse-text/stream과 같음)"""
+    try:
+        if not file.filename.endswith('.txt'):
+            return {"error": "Only .txt files are supported", "success": False}
+
+        print(f"🔧 File upload using engine (stream): {engine}")
+        content = await file.read()
+        return _streaming_response(normalize_text(content.decode('utf-8')), engine, format)
+    except Exception as e:
+        return {"error": f"An error occurred during file parsing: {str(e)}", "success": False}
+
+
+@router.post("/api/parse-jobs")
+async def create_parse_job(file: UploadFile = File(...), engine: str = "classic", user_id: Optional[str] = None):
+    """
+    대용량 업로드용 비동기 파싱. 파일을 작업 대기열에 넣고 job_id를 바로 돌려준다.
+    결과는 GET /api/parse-jobs/{job_id} 폴링 또는 /api/parse-jobs/{job_id}/events 구독으로 받는다.
+    """
+    try:
+        if not file.filename.endswith('.txt'):
+            return {"error": "Only .txt files are supported", "success": False}
+        if engine not in PARSE_ENGINES:
+            return {"error": f"Unknown parser engine: {engine}", "success": False}
+
+        job = await parse_jobs.submit(file.file, engine, user_id=user_id, filename=file.filename)
+        print(f"📥 Parse job {job.id} queued ({engine}, {job.size} bytes)")
+        return {"data": job.to_dict(), "success": True}
+    except ParseJobQueueFull as e:
+        return {"error": f"{str(e)}. Please try again later.", "success": False}
+    except Exception as e:
+        return {"error": f"An error occurred while queueing the parse job: {str(e)}", "success": False}
+
+
+@router.get("/api/parse-jobs")
+def list_parse_jobs(user_id: Optional[str] = None):
+    """Lists parse jobs (without results) and queue counters."""
+    jobs = [job.to_dict(include_result=False) for job in parse_jobs.list(user_id)]
+    return {"data": jobs, "stats": parse_jobs.stats(), "success": True}
+
+
+@router.get("/api/parse-jobs/{job_id}")
+def get_parse_job(job_id: str, include_result: bool = True):
+    """Returns a parse job's status and progress, plus its schedules once done."""
+    job = parse_jobs.get(job_id)
+    if job is None:
+        return {"error": f"Parse job not found or expired: {job_id}", "success": False}
+    return {"data": job.to_dict(include_result), "success": True}
+
+
+@router.get("/api/parse-jobs/{job_id}/events")
+async def stream_parse_job(job_id: str, format: str = "sse"):
+    """파싱 작업의 progress / done 이벤트 스트림 (format: sse | ndjson)"""
+    if format not in STREAM_FORMATS:
+        return {"error": f"Unknown stream format: {format}", "success": False}
+    return StreamingResponse(
+        _stream_job(job_id, format),
+        media_type=STREAM_FORMATS[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete("/api/parse-jobs/{job_id}")
+def cancel_parse_job(job_id: str):
+    """Cancels a queued or running parse job."""
+    job = parse_jobs.cancel(job_id)
+    if job is None:
+        return {"error": f"Parse job not found or expired: {job_id}", "success": False}
+    return {"data": job.to_dict(include_result=False), "success": True}
+
+
+@router.get("/api/parser/timings")
+def get_parser_timings():
+    """Returns process-wide per-stage parse time histograms (ms)."""
+    return {"data": PARSE_STAGE_HISTOGRAMS.snapshot(), "success": True}
+
+
+@router.get("/api/parser/llm-cache")
+def get_llm_cache_stats():
+    """Returns LLM conversion cache hit/miss counts and size."""
+    return {"data": llm_cache.stats(), "success": True}
+
+
+@router.get("/api/parser/llm-health")
+def get_llm_health():
+    """Returns LLM call deadline/hedging counters and circuit breaker state."""
+    return {"data": llm_caller.stats(), "success": True}
+
+
 @router.get("/api/get-raw-data")
 def get_raw_data():
     """Returns the raw content of the data file for frontend processing."""
@@ -3,12 +3,58 @@ from typing import Optional, List
 import logging
 
 from database import SessionLocal, PricingRule, Schedule
+from services.keyword_matcher import KeywordMatcher
 from schemas.pricing import PricingRuleCreate, PricingRuleUpdate, ApplyPricingRulesRequest
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+# Helper Functions
+def build_rule_location_matcher(rules: List[PricingRule]) -> KeywordMatcher:
+    """규칙의 장소/예식장/홀 키워드를 하나의 매처로 묶어 스케줄 장소를 한 번만 훑는다"""
+    return KeywordMatcher({
+        'rule': [keyword for rule in rules for keyword in (rule.location, rule.venue, rule.hall) if keyword]
+    })
+
+
+def find_pricing_rule(rules: List[PricingRule], location_hits, brand: str, album: str, date: str) -> Optional[PricingRule]:
+    """
+    우선순위 순으로 정렬된 rules 중 스케줄에 처음 맞는 규칙 (없으면 None)
+    location_hits: build_rule_location_matcher(rules).hits(장소)['rule']
+    """
+    for rule in rules:
+        # 각 조건 체크 (키워드 매칭)
+        if rule.location and rule.location not in location_hits:
+            continue
+        if rule.venue and rule.venue not in location_hits:
+            continue
+        if rule.hall and rule.hall not in location_hits:
+            continue
+        if rule.brand and brand != rule.brand:
+            continue
+        if rule.album and album != rule.album:
+            continue
+
+        # 날짜 범위 체크 (한쪽만 있는 경우도 처리)
+        if date:
+            if rule.start_date and not rule.end_date:
+                # 시작일만 설정: 해당 날짜 이후만 매칭
+                if date < rule.start_date:
+                    continue
+            elif rule.end_date and not rule.start_date:
+                # 종료일만 설정: 해당 날짜 이전만 매칭
+                if date > rule.end_date:
+                    continue
+            elif rule.start_date and rule.end_date:
+                # 시작일과 종료일 모두 설정: 범위 내만 매칭
+                if not (rule.start_date <= date <= rule.end_date):
+                    continue
+
+        return rule
+    return None
+
+
 # --- API Endpoints ---
 
 @router.get("/api/pricing/rules")
@@ -188,45 +234,19 @@ async def apply_pricing_rules(
             schedule_query = schedule_query.filter(Schedule.id.in_(request.schedule_ids))
         schedules = schedule_query.all()
 
+        location_matcher = build_rule_location_matcher(rules)
+
         updated_count = 0
 
         for schedule in schedules:
-            # 매칭되는 최우선 규칙 찾기
-            for rule in rules:
-                match = True
-
-                # 각 조건 체크 (키워드 매칭)
-                if rule.location and rule.location not in (schedule.location or ''):
-                    match = False
-                if rule.venue and rule.venue not in (schedule.location or ''):
-                    match = False
-                if rule.hall and rule.hall not in (schedule.location or ''):
-                    match = False
-                if rule.brand and schedule.brand != rule.brand:
-                    match = False
-                if rule.album and schedule.album != rule.album:
-                    match = False
-
-                # 날짜 범위 체크 (한쪽만 있는 경우도 처리)
-                if schedule.date:
-                    if rule.start_date and not rule.end_date:
-                        # 시작일만 설정: 해당 날짜 이후만 매칭
-                        if schedule.date < rule.start_date:
-                            match = False
-                    elif rule.end_date and not rule.start_date:
-                        # 종료일만 설정: 해당 날짜 이전만 매칭
-                        if schedule.date > rule.end_date:
-                            match = False
-                    elif rule.start_date and rule.end_date:
-                        # 시작일과 종료일 모두 설정: 범위 내만 매칭
-                        if not (rule.start_date <= schedule.date <= rule.end_date):
-                            match = False
-
-                if match:
-                    # 가격 업데이트
-                    schedule.price = rule.price
-                    updated_count += 1
-                    break  # 첫 번째 매칭 규칙만 적용
+            location_hits = location_matcher.hits(schedule.location or '').get('rule', set())
+
+            # 매칭되는 최우선 규칙 찾기 (첫 번째 매칭 규칙만 적용)
+            rule = find_pricing_rule(rules, location_hits, schedule.brand, schedule.album, schedule.date)
+            if rule:
+                # 가격 업데이트
+                schedule.price = rule.price
+                updated_count += 1
 
         db_session.commit()
 
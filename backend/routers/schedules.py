@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends, Query, Body
 from sqlalchemy.orm import Session
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
 import re
 
-from database import get_database, Schedule, ScheduleService, Tag
+from database import get_database, Schedule, ScheduleService, Tag, PricingRule
+from routers.pricing import build_rule_location_matcher, find_pricing_rule
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -65,6 +66,111 @@ def auto_create_tags_from_schedule(db_session, user_id: str, brand: str, album:
     return created_tags
 
 
+# 가져오기 중복 확인 시 IN 목록 하나에 넣는 날짜 수 (SQLite 변수 개수 제한 대비)
+IMPORT_DATE_CHUNK = 500
+
+IMPORT_CONFLICT_REASON = "같은 날짜·시간에 장소가 다른 기존 스케줄이 있음"
+
+
+def import_parsed_schedules(db_session, user_id: str, parsed: List[Dict]) -> Dict:
+    """
+    파싱된 스케줄을 기존 스케줄과 비교해 새 스케줄만 추가 (커밋은 호출한 쪽에서, 한 트랜잭션)
+    - 중복: (user_id, date, time) 인덱스로 가져올 날짜들의 기존 스케줄만 읽어
+      날짜·시간·장소가 같으면 건너뛴다 (프론트엔드 findDuplicateSchedule과 같은 기준, 가져오기 안의 중복 포함).
+      같은 날짜·시간에 장소만 다른 기존 스케줄이 있으면 추가하되 검토 필요로 표시
+    - 단가: 사용자의 활성 단가 규칙 중 처음 맞는 규칙(/api/pricing/apply와 같은 순서), 없으면 파서 단가
+    - 태그: 브랜드/앨범 태그를 한 번에 조회해 없는 것만 추가
+    반환: {"inserted": [추가된 스케줄], "skipped": [건너뛴 파싱 결과 + existing_id], "needs_review", "priced_by_rule", "created_tags"}
+    """
+    # (date, time) → {location: 기존 스케줄 id (가져오기 안에서 추가한 것은 None)}
+    slots: Dict[Tuple[str, str], Dict[str, Optional[int]]] = {}
+    dates = sorted({sch.get('date') or '' for sch in parsed})
+    for i in range(0, len(dates), IMPORT_DATE_CHUNK):
+        rows = db_session.query(Schedule.id, Schedule.date, Schedule.time, Schedule.location).filter(
+            Schedule.user_id == user_id,
+            Schedule.date.in_(dates[i:i + IMPORT_DATE_CHUNK])
+        ).all()
+        for row in rows:
+            slots.setdefault((row.date, row.time), {}).setdefault(row.location, row.id)
+
+    rules = db_session.query(PricingRule).filter(
+        PricingRule.user_id == user_id,
+        PricingRule.is_active == True
+    ).order_by(PricingRule.priority.desc()).all()
+    location_matcher = build_rule_location_matcher(rules) if rules else None
+
+    known_tags = set(db_session.query(Tag.tag_type, Tag.tag_value).filter(
+        Tag.user_id == user_id,
+        Tag.tag_type.in_(('brand', 'album'))
+    ).all())
+
+    new_schedules, new_tags, skipped = [], [], []
+    priced_by_rule = 0
+    for sch in parsed:
+        date, time, location = sch.get('date') or '', sch.get('time') or '', sch.get('location') or ''
+        slot = slots.setdefault((date, time), {})
+        if location in slot:
+            existing_id = slot[location]
+            skipped.append({**sch, 'existing_id': str(existing_id) if existing_id is not None else None})
+            continue
+
+        new_schedule = Schedule.from_dict(sch, user_id)
+        new_schedule.needs_review = bool(sch.get('needs_review'))
+        if slot and not new_schedule.needs_review:
+            new_schedule.needs_review = True
+            new_schedule.review_reason = IMPORT_CONFLICT_REASON
+        slot[location] = None
+
+        if rules:
+            location_hits = location_matcher.hits(location).get('rule', set())
+            rule = find_pricing_rule(rules, location_hits, new_schedule.brand, new_schedule.album, date)
+            if rule:
+                new_schedule.price = rule.price
+                priced_by_rule += 1
+
+        # 브랜드/앨범 태그 (auto_create_tags_from_schedule과 같은 정규화)
+        for tag_type, value in (('brand', new_schedule.brand), ('album', new_schedule.album)):
+            if value and value.strip():
+                tag_value = re.sub(r'\s+', ' ', value.strip())
+                if (tag_type, tag_value) not in known_tags:
+                    known_tags.add((tag_type, tag_value))
+                    new_tags.append(Tag(user_id=user_id, tag_type=tag_type, tag_value=tag_value))
+
+        new_schedules.append(new_schedule)
+
+    db_session.add_all(new_schedules)
+    db_session.add_all(new_tags)
+    db_session.flush()  # Get IDs without committing
+
+    inserted = [
+        {
+            'id': str(new_schedule.id),
+            'date': new_schedule.date,
+            'time': new_schedule.time,
+            'location': new_schedule.location,
+            'couple': new_schedule.couple or "",
+            'contact': new_schedule.contact or "",
+            'brand': new_schedule.brand or "",
+            'album': new_schedule.album or "",
+            'photographer': new_schedule.photographer or "",
+            'cuts': new_schedule.cuts or 0,
+            'price': new_schedule.price or 0,
+            'manager': new_schedule.manager or "",
+            'memo': new_schedule.memo or "",
+            'isDuplicate': new_schedule.needs_review,
+            'reviewReason': new_schedule.review_reason or "",
+        }
+        for new_schedule in new_schedules
+    ]
+    return {
+        'inserted': inserted,
+        'skipped': skipped,
+        'needs_review': sum(1 for new_schedule in new_schedules if new_schedule.needs_review),
+        'priced_by_rule': priced_by_rule,
+        'created_tags': len(new_tags),
+    }
+
+
 # --- API Endpoints ---
 
 @router.get("/api/schedules")
@@ -15,7 +15,7 @@ from schemas.naver import NaverCalendarRequest
 from schemas.apple import AppleCalendarRequest
 
 # Parser schemas
-from schemas.parser import ParseTextRequest
+from schemas.parser import ParseTextRequest, ParseBatchItem, ParseBatchRequest
 
 # Pricing schemas
 from schemas.pricing import (
@@ -44,6 +44,8 @@ __all__ = [
     "AppleCalendarRequest",
     # Parser
     "ParseTextRequest",
+    "ParseBatchItem",
+    "ParseBatchRequest",
     # Pricing
     "PricingRuleCreate",
     "PricingRuleUpdate",
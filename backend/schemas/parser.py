@@ -1,7 +1,19 @@
 """Parser related Pydantic models"""
+from typing import List
+
 from pydantic import BaseModel
 
 
 class ParseTextRequest(BaseModel):
     text: str
     engine: str = "hybrid"  # classic, hybrid, llm
+    timings: bool = False   # True면 응답에 단계별 파싱 시간(timings) 포함
+
+
+class ParseBatchItem(BaseModel):
+    text: str
+    engine: str = "hybrid"  # classic, hybrid, llm
+
+
+class ParseBatchRequest(BaseModel):
+    items: List[ParseBatchItem]
@@ -0,0 +1,42 @@
+"""
+사용자별 마지막 파싱 내보내기 지문 저장소 (증분 파싱용)
+프로세스 메모리에만 보관하므로 서버가 재시작되면 다음 업로드는 전체 파싱된다.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from parser import ChatFingerprint
+
+CHAT_FINGERPRINT_MAX_USERS = int(os.getenv("CHAT_FINGERPRINT_MAX_USERS", "1000"))
+
+
+class ChatFingerprintStore:
+    """user_id → ChatFingerprint (가장 오래 쓰이지 않은 사용자부터 제거)"""
+
+    def __init__(self, max_users: int = CHAT_FINGERPRINT_MAX_USERS):
+        self.max_users = max_users
+        self._fingerprints: "OrderedDict[str, ChatFingerprint]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[ChatFingerprint]:
+        with self._lock:
+            fingerprint = self._fingerprints.get(user_id)
+            if fingerprint is not None:
+                self._fingerprints.move_to_end(user_id)
+            return fingerprint
+
+    def put(self, user_id: str, fingerprint: ChatFingerprint) -> None:
+        with self._lock:
+            self._fingerprints[user_id] = fingerprint
+            self._fingerprints.move_to_end(user_id)
+            while len(self._fingerprints) > self.max_users:
+                self._fingerprints.popitem(last=False)
+
+    def forget(self, user_id: str) -> None:
+        with self._lock:
+            self._fingerprints.pop(user_id, None)
+
+
+chat_fingerprints = ChatFingerprintStore()
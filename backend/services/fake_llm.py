@@ -0,0 +1,201 @@
+"""
+네트워크 없이 LLM 경로를 돌려보기 위한 결정적(deterministic) 가짜 LLM
+
+- FakeLLMBackend: 프로세스 안에서 고정 지연 후 응답하는 LLMBackend (LLM_BACKEND=fake)
+- 가짜 서버: OpenAI Chat Completions API(/v1/chat/completions)를 흉내 내는 로컬 HTTP 서버.
+  OPENAI_BASE_URL=http://127.0.0.1:8765/v1 로 지정하면 실제 OpenAI 클라이언트/커넥션 풀 경로를 그대로 탄다.
+
+응답은 Classic 파서가 메시지에서 찾은 스케줄을 시스템 프롬프트의 키-값 형식으로 옮긴 것이라
+같은 입력에는 항상 같은 출력이 나온다. response_format이 있는 요청에는 같은 스케줄을 JSON으로 답한다.
+장애 재현용으로 일정 비율의 요청을 느리게(slow_rate, slow_latency) 하거나 실패(error_rate)시킬 수 있다.
+
+사용법 (backend 디렉토리에서):
+    python -m services.fake_llm [--port 8765] [--latency 0.5] [--slow-rate 0.05 --slow-latency 5] [--error-rate 0.1]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from services.llm_parser import LLMBackend, LLM_SCHEDULE_FIELDS
+
+FAKE_LLM_MODEL = "fake-llm"
+
+# Schedule 필드 → 시스템 프롬프트의 키
+KEY_VALUE_FIELDS = [
+    ('date', '예식일'),
+    ('location', '예식장'),
+    ('time', '식시간'),
+    ('couple', '신랑신부'),
+    ('contact', '연락처'),
+    ('brand', '브랜드'),
+    ('album', '앨범'),
+    ('photographer', '작가'),
+    ('manager', '담당자'),
+    ('cuts', '컷수'),  # 구조화 형식 컷수 줄에서만 생기는 키 (Schedule 필드 밖)
+]
+
+
+def fake_llm_output(message: str) -> str:
+    """메시지를 LLM 출력 형식(<!-- LLM_PARSED --> 키-값, 스케줄 구분 ---)으로 결정적으로 변환"""
+    from parser import parse_schedules_classic_only
+
+    schedules: List[Dict] = parse_schedules_classic_only(message)
+    blocks = []
+    for sch in schedules:
+        blocks.append('\n'.join(f"{key}: {sch[field]}" for field, key in KEY_VALUE_FIELDS if sch.get(field)))
+    return '<!-- LLM_PARSED -->\n' + '\n---\n'.join(blocks)
+
+
+def fake_llm_json_output(message: str) -> str:
+    """메시지를 JSON 출력 모드 형식({"schedules": [...]}, 필드는 LLM_SCHEDULE_FIELDS)으로 결정적으로 변환"""
+    from parser import parse_schedules_classic_only
+
+    schedules = [
+        {field: sch.get(field) or kind() for field, kind in LLM_SCHEDULE_FIELDS.items()}
+        for sch in parse_schedules_classic_only(message)
+    ]
+    return json.dumps({"schedules": schedules}, ensure_ascii=False)
+
+
+def fake_llm_content(message: str, response_format: Optional[Dict[str, Any]] = None) -> str:
+    return fake_llm_json_output(message) if response_format else fake_llm_output(message)
+
+
+def _estimate_tokens(text: str) -> int:
+    """usage 표시용 대략적인 토큰 수 (한글 1자 ≈ 1토큰)"""
+    return max(1, len(text))
+
+
+class FakeLLMError(Exception):
+    """가짜 LLM이 일부러 낸 실패"""
+
+
+class FaultInjector:
+    """요청마다 지연(초)과 실패 여부를 정한다 (seed로 재현 가능)"""
+
+    def __init__(self, latency: float = 0.5, slow_rate: float = 0.0, slow_latency: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+
+    def next_fault(self):
+        """(지연 초, 실패 여부)"""
+        delay = self.slow_latency if self._rng.random() < self.slow_rate else self.latency
+        return delay, self._rng.random() < self.error_rate
+
+
+class FakeLLMBackend(LLMBackend):
+    """지연 후 fake_llm_content를 돌려주는 프로세스 내 백엔드 (호출 수 기록, 지연/실패 주입 가능)"""
+
+    name = "fake"
+    model = FAKE_LLM_MODEL
+
+    def __init__(self, latency: float = 0.5, slow_rate: float = 0.0, slow_latency: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        self.faults = FaultInjector(latency, slow_rate, slow_latency, error_rate, seed)
+        self.calls = 0
+        self.errors = 0
+
+    async def complete(self, system_prompt: str, user_message: str,
+                       response_format: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        self.calls += 1
+        delay, fail = self.faults.next_fault()
+        await asyncio.sleep(delay)
+        if fail:
+            self.errors += 1
+            raise FakeLLMError("fake LLM injected error")
+        return fake_llm_content(user_message, response_format)
+
+
+# === 가짜 OpenAI 호환 서버 ===
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """POST /v1/chat/completions 에 OpenAI 응답 형식으로 답한다 (지연/실패는 server.faults)"""
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        user_message = next(
+            (m.get('content', '') for m in reversed(body.get('messages', [])) if m.get('role') == 'user'), ''
+        )
+        delay, fail = self.server.faults.next_fault()
+        time.sleep(delay)
+        if fail:
+            self.server.requests += 1
+            self.send_error(500, "fake LLM injected error")
+            return
+        content = fake_llm_content(user_message, body.get('response_format'))
+        prompt_tokens = sum(_estimate_tokens(m.get('content', '')) for m in body.get('messages', []))
+        completion_tokens = _estimate_tokens(content)
+        payload = json.dumps({
+            "id": f"chatcmpl-fake-{self.server.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get('model', FAKE_LLM_MODEL),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }, ensure_ascii=False).encode('utf-8')
+        self.server.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_fake_llm_server(host: str = '127.0.0.1', port: int = 8765, latency: float = 0.5,
+                         slow_rate: float = 0.0, slow_latency: float = 0.0, error_rate: float = 0.0,
+                         seed: Optional[int] = None) -> ThreadingHTTPServer:
+    """가짜 LLM 서버 생성 (serve_forever()로 실행, port=0이면 빈 포트 자동 선택)"""
+    server = ThreadingHTTPServer((host, port), FakeLLMHandler)
+    server.daemon_threads = True
+    server.faults = FaultInjector(latency, slow_rate, slow_latency, error_rate, seed)
+    server.requests = 0
+    return server
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8765)
+    ap.add_argument('--latency', type=float, default=0.5)
+    ap.add_argument('--slow-rate', type=float, default=0.0, help='--slow-latency만큼 느리게 답할 요청 비율')
+    ap.add_argument('--slow-latency', type=float, default=5.0)
+    ap.add_argument('--error-rate', type=float, default=0.0, help='500으로 실패시킬 요청 비율')
+    ap.add_argument('--seed', type=int, default=None)
+    args = ap.parse_args()
+
+    server = make_fake_llm_server(args.host, args.port, args.latency,
+                                  args.slow_rate, args.slow_latency, args.error_rate, args.seed)
+    print(f"🤖 Fake LLM server on http://{args.host}:{server.server_port}/v1 "
+          f"(latency {args.latency}s, slow {args.slow_rate:.0%} @ {args.slow_latency}s, errors {args.error_rate:.0%})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
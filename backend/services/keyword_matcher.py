@@ -0,0 +1,93 @@
+"""
+키워드 매처 (Aho-Corasick)
+여러 키워드를 줄마다 키워드별로 훑지 않도록 오토마톤을 한 번 만들어 두고, 한 번의 문자 순회로 모든 적중을 찾는다.
+단가 규칙 적용(routers/pricing.py)이 규칙의 장소/예식장/홀 키워드 전체로 매처를 만들어 쓴다.
+순수 파이썬 순회는 문자당 비용이 있으므로 키워드가 몇 개뿐인 파서 검사(classify_line의 장소 힌트,
+price_brand_key의 브랜드 키)는 그대로 `in` 검사가 더 빠르다 (benchmarks/bench_keywords.py).
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over literal keywords, each tagged with a category."""
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        self.vocabularies: Dict[str, Tuple[str, ...]] = {
+            category: tuple(dict.fromkeys(keyword for keyword in keywords if keyword))
+            for category, keywords in vocabularies.items()
+        }
+
+        # 1) 트라이
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[Tuple[str, str], ...]] = [()]
+        for category, keywords in self.vocabularies.items():
+            for keyword in keywords:
+                state = 0
+                for ch in keyword:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        outputs.append(())
+                    state = nxt
+                outputs[state] += ((keyword, category),)
+
+        # 2) 실패 링크 (BFS) — 출력은 실패 링크를 따라 합쳐 둔다
+        fail = [0] * len(goto)
+        order: List[int] = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if state else 0
+                outputs[nxt] += outputs[fail[nxt]]
+
+        # 3) 완전한 전이표: 문자마다 dict 조회 한 번 (없으면 루트)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in range(len(goto) - 1)]
+        for state in order:
+            delta[state] = {**delta[fail[state]], **goto[state]}
+
+        self._delta = delta
+        self._outputs = outputs
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, str]]:
+        """Yield (start, keyword, category) for every (possibly overlapping) keyword occurrence."""
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for keyword, category in outputs[state]:
+                    yield end - len(keyword), keyword, category
+
+    def find_all(self, text: str) -> List[Tuple[int, str, str]]:
+        return list(self.iter_matches(text))
+
+    def hits(self, text: str) -> Dict[str, set]:
+        """category → set of keywords found in text (categories without hits are omitted)."""
+        delta, outputs = self._delta, self._outputs
+        found: Dict[str, set] = {}
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for keyword, category in outputs[state]:
+                    found.setdefault(category, set()).add(keyword)
+        return found
+
+    def contains(self, text: str, category: str) -> bool:
+        """True as soon as any keyword of category occurs in text."""
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state] and any(hit_category == category for _, hit_category in outputs[state]):
+                return True
+        return False
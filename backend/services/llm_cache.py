@@ -0,0 +1,193 @@
+"""
+LLM 변환 결과 디스크 캐시 (SQLite)
+매니저끼리 전달한 같은(또는 공백만 다른) 메시지를 parse_with_llm이 매번 다시 변환하지 않도록
+(모델, 프롬프트 버전, 정규화된 메시지 해시)를 키로 변환 결과 텍스트를 보관한다.
+프로세스 재시작 후에도 남고, 전체 크기가 상한을 넘으면 가장 오래 안 쓴 항목부터 지운다.
+"""
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from services.parse_cache import normalize_text
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH",
+    os.path.join(os.getenv('RAILWAY_VOLUME_MOUNT_PATH', '.'), 'llm_cache.db'),
+)
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# 히트할 때마다 last_used/hits를 commit하지 않고 메모리에 모았다가 이만큼 쌓이거나 쓰기/제거 전에 한 번에 반영
+LLM_CACHE_TOUCH_BATCH = int(os.getenv("LLM_CACHE_TOUCH_BATCH", "64"))
+
+
+def normalize_message(message: str) -> str:
+    """줄 앞뒤 공백/연속 공백/빈 줄 차이를 없앤 메시지 (전달 과정에서 생기는 차이 무시)"""
+    lines = (' '.join(line.split()) for line in normalize_text(message).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def make_llm_cache_key(model: str, prompt_version: str, message: str) -> str:
+    digest = hashlib.sha256(normalize_message(message).encode('utf-8')).hexdigest()
+    return f"{model}:{prompt_version}:{digest}"
+
+
+class LLMResponseCache:
+    """SQLite LLM 응답 캐시 (크기 상한은 응답 텍스트 바이트 기준, 초과 시 LRU 제거). max_bytes=0이면 비활성"""
+
+    def __init__(self, path: str = LLM_CACHE_PATH, max_bytes: int = LLM_CACHE_MAX_BYTES,
+                 touch_batch: int = LLM_CACHE_TOUCH_BATCH):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_batch = touch_batch
+        self._conn: Optional[sqlite3.Connection] = None
+        self._bytes = 0
+        self._touched: Dict[str, List] = {}  # key → [last_used, 히트 수] (아직 DB에 반영 안 된 히트)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """첫 사용 시 DB 파일을 열고 테이블을 만든다 (호출자가 lock을 잡고 있어야 함)"""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " response TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used)")
+            conn.commit()
+            self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 텍스트. 없으면 None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                touch = self._touched.setdefault(key, [0.0, 0])
+                touch[0] = time.time()
+                touch[1] += 1
+                if len(self._touched) >= self.touch_batch:
+                    self._flush_touched(conn)
+                    conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        if not self.enabled:
+            return
+        size = len(response.encode('utf-8'))
+        if size > self.max_bytes:
+            logger.info(f"LLM response too large to cache ({size} bytes)")
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                self._flush_touched(conn)  # 제거 순서(last_used)가 최근 히트를 반영하도록
+                old = conn.execute("SELECT size FROM llm_cache WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, response, size, created_at, last_used, hits)"
+                    " VALUES (?, ?, ?, ?, ?, 0)",
+                    (key, response, size, now, now),
+                )
+                self._bytes += size - (old[0] if old else 0)
+                if self._bytes > self.max_bytes:
+                    self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """모아 둔 히트의 last_used/hits를 DB에 반영 (commit은 호출자가)"""
+        if self._touched:
+            conn.executemany(
+                "UPDATE llm_cache SET last_used = ?, hits = hits + ? WHERE key = ?",
+                [(last_used, hits, key) for key, (last_used, hits) in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """가장 오래 안 쓴 항목부터 상한 아래로 내려갈 때까지 제거"""
+        removed = []
+        for key, size in conn.execute("SELECT key, size FROM llm_cache ORDER BY last_used"):
+            if self._bytes <= self.max_bytes:
+                break
+            removed.append((key,))
+            self._bytes -= size
+        conn.executemany("DELETE FROM llm_cache WHERE key = ?", removed)
+        self.evictions += len(removed)
+
+    def clear(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+            self._bytes = 0
+            self._touched.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._flush_touched(self._conn)
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM cache write failed: {e}")
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = 0
+            if self.enabled:
+                try:
+                    entries = self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+llm_cache = LLMResponseCache()
@@ -3,27 +3,67 @@ OpenAI GPT-4o-mini를 사용한 LLM 기반 스케줄 파서
 구조화된 키-값 형식으로 변환하여 우리 파서가 처리
 """
 import os
+import asyncio
+import hashlib
 import logging
 import time
-from openai import OpenAI
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from typing import Optional, Dict, Any, List
 import json
 
+from services.llm_cache import llm_cache, make_llm_cache_key
+from services.llm_resilience import llm_caller
+
 logger = logging.getLogger(__name__)
 
-# OpenAI 클라이언트 초기화
+# 커넥션 풀 설정 (동시 LLM 파싱 수와 keep-alive 유지 시간)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "10"))
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "60"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+# SDK 자체 재시도 (deadline/헤지/circuit breaker는 services.llm_resilience가 담당하므로 기본 0)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "0"))
+
+# 변환 백엔드: openai (기본, OPENAI_BASE_URL로 호환 서버 지정 가능) / fake (services.fake_llm, 네트워크 없음)
+LLM_BACKEND = os.getenv("LLM_BACKEND", "openai")
+LLM_MODEL = "gpt-4o-mini"
+# 출력 형식: json (스키마 검증된 JSON을 Schedule로 바로 매핑, 실패 시 text로 재시도) / text (키-값 텍스트 재파싱)
+LLM_OUTPUT_FORMAT = os.getenv("LLM_OUTPUT_FORMAT", "json")
+
+# 호출 1회당 입력 한도 (긴 메시지는 parser.split_text_for_llm이 미리 이 크기 이하로 나눈다)
+LLM_MAX_INPUT_CHARS = 3000
+
+# OpenAI 비동기 클라이언트 (프로세스 공유, keep-alive 커넥션 풀)
+# httpx 커넥션 풀은 처음 사용된 이벤트 루프에 묶이므로 그 루프를 함께 기억한다
 client = None
+_client_loop = None
+
+
+def _new_client(api_key: str) -> AsyncOpenAI:
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=LLM_TIMEOUT_SECONDS,
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=LLM_MAX_RETRIES)
+
 
 def init_openai_client():
     """OpenAI 클라이언트 초기화"""
-    global client
+    global client, _client_loop
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         logger.warning("OPENAI_API_KEY not found in environment variables")
         return False
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = _new_client(api_key)
+        _client_loop = None
         logger.info("OpenAI client initialized successfully")
         return True
     except Exception as e:
@@ -31,6 +71,45 @@ def init_openai_client():
         return False
 
 
+async def close_openai_client():
+    """공유 클라이언트의 커넥션 풀 정리 (앱 종료 시)"""
+    global client, _client_loop
+    if client is not None:
+        await client.close()
+    client = None
+    _client_loop = None
+
+
+@asynccontextmanager
+async def acquire_openai_client():
+    """
+    현재 이벤트 루프에서 쓸 클라이언트를 빌려준다 (없으면 None).
+    서버 루프에서는 공유 클라이언트(커넥션 재사용)를, 다른 루프(동기 코드의 asyncio.run 등)에서는
+    그 호출 동안만 쓰는 임시 클라이언트를 준다.
+    """
+    global _client_loop
+    if client is None and not init_openai_client():
+        yield None
+        return
+
+    loop = asyncio.get_running_loop()
+    if _client_loop is not None and _client_loop is not loop and _client_loop.is_closed():
+        # 묶여 있던 루프가 끝났으면 그 커넥션은 쓸 수 없으므로 새 풀로 교체
+        init_openai_client()
+    if _client_loop is None:
+        _client_loop = loop
+
+    if _client_loop is loop:
+        yield client
+        return
+
+    temporary = _new_client(os.getenv("OPENAI_API_KEY"))
+    try:
+        yield temporary
+    finally:
+        await temporary.close()
+
+
 # GPT-4o-mini는 구조화된 키-값 형식으로 변환만 담당 (빠르고 정확)
 
 
@@ -105,6 +184,211 @@ SYSTEM_PROMPT = """당신은 웨딩 촬영 스케줄 포맷 변환 전문가입
 **목표:** 다양한 업체의 메시지를 우리 파서가 이해할 수 있는 구조화된 형식으로 변환하여, 핵심 정보는 자동 매핑되고 나머지는 메모로 깔끔하게 정리되도록 합니다.
 """
 
+# 프롬프트 버전 (프롬프트를 고치면 이전 프롬프트로 캐시된 변환 결과를 쓰지 않는다)
+PROMPT_VERSION = hashlib.sha256(SYSTEM_PROMPT.encode('utf-8')).hexdigest()[:12]
+
+
+# === JSON 출력 모드 ===
+# 키-값 텍스트를 Classic 파서로 다시 파싱하는 대신, 스키마가 고정된 JSON을 받아 Schedule 필드에 바로 매핑한다.
+
+# Schedule 필드 → JSON 타입 (strict 스키마라 모든 필드가 항상 온다: 없는 값은 "" / 0)
+LLM_SCHEDULE_FIELDS: Dict[str, type] = {
+    "date": str,
+    "time": str,
+    "location": str,
+    "couple": str,
+    "contact": str,
+    "brand": str,
+    "album": str,
+    "photographer": str,
+    "manager": str,
+    "price": int,
+    "memo": str,
+}
+
+LLM_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "schedules",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "schedules": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            field: {"type": "integer" if kind is int else "string"}
+                            for field, kind in LLM_SCHEDULE_FIELDS.items()
+                        },
+                        "required": list(LLM_SCHEDULE_FIELDS),
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["schedules"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+SYSTEM_PROMPT_JSON = """당신은 웨딩 촬영 스케줄 추출 전문가입니다.
+다양한 업체(사진, 영상, 플래너 등)의 카카오톡 메시지에서 스케줄을 찾아 JSON으로 출력하세요. 최대 5개 스케줄까지만 처리합니다.
+
+**출력:** {"schedules": [스케줄, ...]} (스키마에 정의된 필드만, 값이 없으면 문자열은 "", 숫자는 0)
+
+**필드:**
+- date: 예식일 YYYY.MM.DD (예: 2025.09.20)
+- time: 식시간 HH:MM 24시간제 (오후2시 → 14:00, 오전11시반 → 11:30)
+- location: 예식장 이름만 깔끔하게 (예: "한화리조트 몬테로소(지1층)")
+- couple: "신랑이름 신부이름"
+- contact: 010으로 시작하는 전화번호 (010-1234-5678)
+- brand: 상품 브랜드명 (사진/영상 패키지 이름)
+- album: 앨범 종류/구성
+- photographer: 사진작가/영상감독 이름
+- manager: 매니저/계약자/담당자 이름
+- price: 촬영비 원 단위 정수 (만원 단위 금액은 변환: 25 → 250000)
+- memo: 위 필드에 들어가지 않는 **모든 정보**를 "키: 값" 줄로 (사진업체, 컷수, 촬영범위, 상품구성 등).
+  [섹션제목] 형태의 섹션은 제목 줄 다음에 내용을 그대로 적는다.
+
+**규칙:**
+- 원본의 정보를 누락하지 말고, 같은 내용을 두 번 쓰지 마세요 (필드에 넣은 값은 memo에 다시 쓰지 않음)
+- "없음", "N/A" 같은 텍스트 금지
+- 스케줄이 없으면 {"schedules": []}
+"""
+
+PROMPT_VERSION_JSON = hashlib.sha256(SYSTEM_PROMPT_JSON.encode('utf-8')).hexdigest()[:12]
+
+
+def validate_llm_schedules(payload: Any) -> List[Dict[str, Any]]:
+    """
+    JSON 응답을 LLM_SCHEDULE_FIELDS 스키마로 검증해 스케줄 dict 목록으로 반환.
+    빠진 필드는 기본값으로 채우고 모르는 필드는 버린다. 형식이 다르면 ValueError.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("schedules"), list):
+        raise ValueError("response must be an object with a 'schedules' array")
+
+    schedules = []
+    for index, item in enumerate(payload["schedules"]):
+        if not isinstance(item, dict):
+            raise ValueError(f"schedules[{index}] is not an object")
+        schedule = {}
+        for field, kind in LLM_SCHEDULE_FIELDS.items():
+            value = item.get(field)
+            if value is None:
+                value = kind()
+            elif kind is int and isinstance(value, str) and value.strip().isdigit():
+                value = int(value)
+            if not isinstance(value, kind) or isinstance(value, bool):
+                raise ValueError(f"schedules[{index}].{field} must be {kind.__name__}")
+            schedule[field] = value.strip() if kind is str else value
+        schedules.append(schedule)
+    return schedules
+
+
+# === LLM 백엔드 ===
+# parse_with_llm은 백엔드 인터페이스만 안다. 실제 OpenAI 호출과 네트워크 없는 가짜 백엔드를 갈아 끼울 수 있다.
+
+class LLMBackend:
+    """
+    LLM 변환 백엔드 인터페이스: complete()는 (시스템 프롬프트, 사용자 메시지)에 대한 응답 텍스트, 실패 시 None.
+    response_format이 주어지면 그 JSON 스키마를 따르는 JSON 텍스트를 돌려줘야 한다.
+    """
+
+    name = "base"
+    model = ""
+
+    async def complete(self, system_prompt: str, user_message: str,
+                       response_format: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        raise NotImplementedError
+
+
+class OpenAIBackend(LLMBackend):
+    """공유 AsyncOpenAI 클라이언트(커넥션 풀)로 Chat Completions 호출"""
+
+    name = "openai"
+    model = LLM_MODEL
+
+    async def complete(self, system_prompt: str, user_message: str,
+                       response_format: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        async with acquire_openai_client() as llm_client:
+            if llm_client is None:
+                logger.error("OpenAI client not available")
+                return None
+
+            extra = {"response_format": response_format} if response_format else {}
+            response = await llm_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_message}
+                ],
+                temperature=0,  # 일관성을 위해 0으로 설정
+                **extra
+            )
+
+        # 토큰 사용량 로깅 (비용 모니터링)
+        usage = response.usage
+        logger.info(f"LLM conversion successful - Tokens: input={usage.prompt_tokens}, output={usage.completion_tokens}, total={usage.total_tokens}")
+
+        # 비용 계산 (GPT-4o-mini 요금)
+        input_cost = (usage.prompt_tokens / 1_000_000) * 0.15
+        output_cost = (usage.completion_tokens / 1_000_000) * 0.60
+        total_cost = input_cost + output_cost
+        logger.info(f"Estimated cost: ${total_cost:.6f} ({self.model})")
+
+        return response.choices[0].message.content
+
+
+_backend: Optional[LLMBackend] = None
+
+
+async def complete_resilient(backend: LLMBackend, system_prompt: str, user_message: str,
+                             response_format: Optional[Dict[str, Any]] = None) -> str:
+    """
+    backend.complete를 deadline / 헤지 / circuit breaker(services.llm_resilience)로 감싼 호출.
+    응답이 없으면(None) 실패로 센다. 실패 시 예외 (CircuitOpenError, asyncio.TimeoutError 등)
+    """
+    async def attempt() -> str:
+        content = await backend.complete(system_prompt, user_message, response_format=response_format)
+        if content is None:
+            raise RuntimeError(f"LLM backend '{backend.name}' returned no response")
+        return content
+
+    return await llm_caller.call(attempt)
+
+
+def get_llm_backend() -> LLMBackend:
+    """LLM_BACKEND 설정에 맞는 백엔드 (처음 호출 시 생성)"""
+    global _backend
+    if _backend is None:
+        if LLM_BACKEND == "fake":
+            from services.fake_llm import FakeLLMBackend
+            _backend = FakeLLMBackend()
+        else:
+            _backend = OpenAIBackend()
+    return _backend
+
+
+def set_llm_backend(backend: Optional[LLMBackend]) -> None:
+    """백엔드 교체 (벤치마크 등). None이면 다음 호출 때 LLM_BACKEND 설정으로 다시 만든다"""
+    global _backend
+    _backend = backend
+
+
+# 캐시는 SQLite 파일 I/O(조회, 쓰기 commit)라 이벤트 루프를 막지 않도록 워커 스레드에서 실행한다
+async def cache_get(key: str) -> Optional[str]:
+    if not llm_cache.enabled:
+        return None
+    return await asyncio.to_thread(llm_cache.get, key)
+
+
+async def cache_put(key: str, response: str) -> None:
+    if llm_cache.enabled:
+        await asyncio.to_thread(llm_cache.put, key, response)
+
+
 
 async def parse_with_llm(message: str) -> Optional[str]:
     """
@@ -118,40 +402,31 @@ async def parse_with_llm(message: str) -> Optional[str]:
     Returns:
         Structured parser 형식의 텍스트 (키-값 형태, 실패 시 None)
     """
-    global client
-
-    # 클라이언트 초기화 확인
-    if client is None:
-        if not init_openai_client():
-            logger.error("OpenAI client not available")
-            return None
-
-    # 텍스트 길이 제한 (3000자)
-    MAX_LENGTH = 3000
-    if len(message) > MAX_LENGTH:
-        logger.warning(f"Message too long ({len(message)} chars), truncating to {MAX_LENGTH} chars")
-        message = message[:MAX_LENGTH]
+    # 텍스트 길이 제한 (3000자) - 호출자가 조각으로 나눠 보내므로 최후의 안전장치
+    if len(message) > LLM_MAX_INPUT_CHARS:
+        logger.warning(f"Message too long ({len(message)} chars), truncating to {LLM_MAX_INPUT_CHARS} chars")
+        message = message[:LLM_MAX_INPUT_CHARS]
+
+    backend = get_llm_backend()
+    cache_key = make_llm_cache_key(backend.model, PROMPT_VERSION, message)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"LLM cache hit ({backend.model}, {len(cached)} chars)")
+        return cached
 
     try:
-        logger.info(f"Parsing message with LLM (length: {len(message)} chars)")
+        logger.info(f"Parsing message with LLM (length: {len(message)} chars, backend: {backend.name})")
 
         # 시작 시간 기록
         start_time = time.time()
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": f"다음 메시지를 변환해주세요:\n\n{message}"}
-            ],
-            temperature=0  # 일관성을 위해 0으로 설정
-        )
+        content = await complete_resilient(backend, SYSTEM_PROMPT, f"다음 메시지를 변환해주세요:\n\n{message}")
 
         # 종료 시간 계산
         elapsed_time = time.time() - start_time
 
         # 텍스트 응답 추출
-        converted_text = response.choices[0].message.content.strip()
+        converted_text = content.strip()
 
         # 마크다운 코드 블록 제거 (LLM이 ```로 감싸는 경우)
         if converted_text.startswith('```'):
@@ -164,21 +439,13 @@ async def parse_with_llm(message: str) -> Optional[str]:
                 lines = lines[:-1]
             converted_text = '\n'.join(lines).strip()
 
-        # 토큰 사용량 로깅 (비용 모니터링)
-        usage = response.usage
-        logger.info(f"LLM conversion successful - Tokens: input={usage.prompt_tokens}, output={usage.completion_tokens}, total={usage.total_tokens}")
-
-        # 비용 계산 (GPT-4o-mini 요금)
-        input_cost = (usage.prompt_tokens / 1_000_000) * 0.15
-        output_cost = (usage.completion_tokens / 1_000_000) * 0.60
-        total_cost = input_cost + output_cost
-        logger.info(f"Estimated cost: ${total_cost:.6f} (gpt-4o-mini)")
-
         # 처리 시간 로깅
         logger.info(f"⏱️  LLM processing time: {elapsed_time:.2f}s")
 
-        # Classic parser 형식의 텍스트 반환
+        # Classic parser 형식의 텍스트 반환 (같은 메시지가 다시 오면 캐시에서)
         logger.info(f"Converted text length: {len(converted_text)} chars")
+        if converted_text:
+            await cache_put(cache_key, converted_text)
         return converted_text
 
     except Exception as e:
@@ -186,4 +453,40 @@ async def parse_with_llm(message: str) -> Optional[str]:
         return None
 
 
+async def parse_with_llm_json(message: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    LLM JSON 출력 모드: 메시지에서 찾은 스케줄을 스키마 검증된 dict 목록으로 반환 (최대 5개, 3000자 제한)
+    키는 Schedule 필드 이름(LLM_SCHEDULE_FIELDS). JSON이 아니거나 스키마 위반이면 None (호출자가 텍스트 모드로 재시도).
+    호출 자체의 실패(CircuitOpenError, asyncio.TimeoutError, 공급자 오류)는 예외로 올린다 -
+    같은 공급자에 텍스트 모드로 다시 보내면 deadline과 breaker 실패 수만 두 배가 된다
+    """
+    if len(message) > LLM_MAX_INPUT_CHARS:
+        logger.warning(f"Message too long ({len(message)} chars), truncating to {LLM_MAX_INPUT_CHARS} chars")
+        message = message[:LLM_MAX_INPUT_CHARS]
+
+    backend = get_llm_backend()
+    cache_key = make_llm_cache_key(backend.model, PROMPT_VERSION_JSON, message)
+    content = await cache_get(cache_key)
+    cached = content is not None
+
+    try:
+        if not cached:
+            logger.info(f"Parsing message with LLM JSON mode (length: {len(message)} chars, backend: {backend.name})")
+            start_time = time.time()
+            content = await complete_resilient(backend, SYSTEM_PROMPT_JSON, message, response_format=LLM_RESPONSE_FORMAT)
+            logger.info(f"⏱️  LLM processing time: {time.time() - start_time:.2f}s")
+
+        schedules = validate_llm_schedules(json.loads(content))
+    except (ValueError, TypeError) as e:
+        # json.JSONDecodeError도 ValueError
+        logger.warning(f"LLM JSON output rejected: {e}")
+        return None
+
+    if cached:
+        logger.info(f"LLM cache hit ({backend.model}, JSON, {len(schedules)} schedules)")
+    else:
+        await cache_put(cache_key, content)
+    return schedules
+
+
 # normalize_schedule_data 함수는 더 이상 필요 없음 (Classic parser가 처리)
@@ -0,0 +1,241 @@
+"""
+LLM 호출 복원력 계층 (deadline / hedged request / circuit breaker)
+
+- deadline: 호출 1회(헤지 포함)가 LLM_CALL_DEADLINE_SECONDS를 넘으면 취소하고 실패로 처리
+- hedged request: 최근 성공 지연의 p95가 지나도 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답을 쓴다.
+  헤지는 전체 호출의 LLM_HEDGE_BUDGET 비율까지만 (느린 공급자에게 트래픽을 두 배로 보내지 않도록)
+- circuit breaker: 연속 LLM_BREAKER_FAILURES번 실패하면 LLM_BREAKER_RESET_SECONDS 동안 호출을 바로 거절(open),
+  그 뒤 한 번만 시험 호출(half-open)해서 성공하면 닫는다. 열려 있는 동안 하이브리드 파서는 Classic 결과를 degraded로 돌려준다.
+"""
+import os
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_CALL_DEADLINE_SECONDS = float(os.getenv("LLM_CALL_DEADLINE_SECONDS", "20"))
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.95"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_BUDGET = float(os.getenv("LLM_HEDGE_BUDGET", "0.1"))   # 0이면 헤지 안 함
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+
+LATENCY_WINDOW = 200  # 헤지 지연 계산에 쓰는 최근 성공 호출 수
+
+
+class CircuitOpenError(Exception):
+    """circuit breaker가 열려 있어 LLM 호출을 보내지 않음"""
+
+
+class LatencyTracker:
+    """최근 성공 호출 지연(초)의 분위수"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = LLM_HEDGE_MIN_SAMPLES) -> Optional[float]:
+        """표본이 min_samples개 미만이면 None"""
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CircuitBreaker:
+    """연속 실패 수 기반 circuit breaker (closed → open → half-open → closed)"""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = LLM_BREAKER_FAILURES, reset_seconds: float = LLM_BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.opened_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def is_open(self) -> bool:
+        """호출을 보내지 않을 상태인지 (시험 호출 자리가 남은 half-open은 False)"""
+        with self._lock:
+            state = self._current_state()
+            return state == self.OPEN or (state == self.HALF_OPEN and self._trial_in_flight)
+
+    def allow(self) -> bool:
+        """호출을 보내도 되는지. half-open에서는 시험 호출 한 번만 허용"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("LLM circuit breaker closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"LLM circuit breaker opened after {self._failures} consecutive failures")
+                    self.opened_count += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """결과 없이 끝난(취소된) 시험 호출의 자리를 돌려준다. 실패로 세지 않고 다음 호출이 다시 시험한다"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "opened": self.opened_count,
+                "rejected": self.rejected,
+            }
+
+
+class ResilientCaller:
+    """deadline + hedged request + circuit breaker로 LLM 호출을 감싼다"""
+
+    def __init__(self, deadline_seconds: float = LLM_CALL_DEADLINE_SECONDS,
+                 hedge_quantile: float = LLM_HEDGE_QUANTILE, hedge_budget: float = LLM_HEDGE_BUDGET,
+                 breaker: Optional[CircuitBreaker] = None):
+        self.deadline_seconds = deadline_seconds
+        self.hedge_quantile = hedge_quantile
+        self.hedge_budget = hedge_budget
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    def _hedge_delay(self) -> Optional[float]:
+        """이번 호출의 헤지 지연 (헤지 예산을 다 썼거나 표본이 부족하면 None)"""
+        if self.hedge_budget <= 0 or self.hedges >= self.hedge_budget * self.calls:
+            return None
+        return self.latency.quantile(self.hedge_quantile)
+
+    async def call(self, make_call: Callable[[], Awaitable[T]]) -> T:
+        """
+        make_call()로 만든 요청을 보내고 결과를 돌려준다.
+        breaker가 열려 있으면 CircuitOpenError, deadline을 넘기면 asyncio.TimeoutError,
+        보낸 요청이 모두 실패하면 마지막 예외를 그대로 올린다.
+        """
+        trial = self.breaker.state == CircuitBreaker.HALF_OPEN  # 이 호출이 half-open 시험 호출인지
+        if not self.breaker.allow():
+            raise CircuitOpenError("LLM circuit breaker is open")
+
+        self.calls += 1
+        start = time.monotonic()
+        deadline = start + self.deadline_seconds
+        hedge_delay = self._hedge_delay()
+        hedge_at = start + hedge_delay if hedge_delay is not None else None
+
+        primary = asyncio.ensure_future(make_call())
+        started = {primary: start}
+        pending = {primary}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                # 헤지 전에는 헤지 시점까지만, 이후에는 deadline까지 기다린다
+                wait_until = min(deadline, hedge_at) if hedge_at is not None else deadline
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(0.0, wait_until - time.monotonic()), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self.latency.observe(time.monotonic() - started[task])
+                        self.breaker.record_success()
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+                if done:
+                    # 실패한 요청이 있으면 남은 요청(헤지)을 계속 기다린다
+                    continue
+                if time.monotonic() >= deadline:
+                    self.timeouts += 1
+                    error = asyncio.TimeoutError(f"LLM call exceeded {self.deadline_seconds:.1f}s deadline")
+                    break
+                # p95 지연이 지나도 응답이 없으면 같은 요청을 한 번 더 보낸다
+                hedge_at = None
+                self.hedges += 1
+                logger.info(f"LLM call slower than p{int(self.hedge_quantile * 100)} ({hedge_delay:.2f}s), sending hedged request")
+                hedge = asyncio.ensure_future(make_call())
+                started[hedge] = time.monotonic()
+                pending.add(hedge)
+        except BaseException:
+            # 호출한 쪽이 취소(SSE 연결 끊김, 파싱 작업 취소, 헤지 정리)하면 성공도 실패도 기록되지 않으므로
+            # half-open 시험 호출 자리를 여기서 풀어야 breaker가 영원히 열린 채로 남지 않는다
+            if trial:
+                self.breaker.release_trial()
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self.failures += 1
+        self.breaker.record_failure()
+        raise error
+
+    def stats(self) -> Dict[str, Any]:
+        hedge_delay = self.latency.quantile(self.hedge_quantile)
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delay_seconds": round(hedge_delay, 3) if hedge_delay is not None else None,
+            "deadline_seconds": self.deadline_seconds,
+            "breaker": self.breaker.stats(),
+        }
+
+
+llm_caller = ResilientCaller()
@@ -0,0 +1,110 @@
+"""
+파싱 결과 캐시
+같은 메시지를 다시 붙여넣거나 같은 내보내기 파일을 다시 올릴 때 파서(특히 LLM 엔진)를 다시 돌리지 않도록
+(정규화된 텍스트 해시, 엔진, 파서 버전, 오늘 날짜)를 키로 결과를 보관한다.
+요일 기반 날짜 예측이 오늘 날짜에 의존하므로 날짜가 바뀌면 키도 바뀐다.
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from parser import PARSER_VERSION
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PARSE_CACHE_TTL_SECONDS = int(os.getenv("PARSE_CACHE_TTL_SECONDS", "3600"))
+
+
+def normalize_text(text: str) -> str:
+    """줄바꿈을 \\n으로 통일 (텍스트 모드 파일 읽기의 universal newline 변환과 동일)"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def hash_text(text: str) -> str:
+    """정규화된 텍스트의 SHA-256 해시"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def hash_lines(lines: Iterable[str]) -> str:
+    """텍스트 모드 스트림(줄 단위)의 해시. 같은 내용이면 hash_text와 같은 값을 돌려준다."""
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def make_cache_key(text_hash: str, engine: str) -> Tuple[str, str, str, str]:
+    return (text_hash, engine, PARSER_VERSION, date.today().isoformat())
+
+
+class ParseCache:
+    """LRU + TTL 파싱 결과 캐시 (크기 상한은 결과 JSON 바이트 기준)"""
+
+    def __init__(self, max_bytes: int = PARSE_CACHE_MAX_BYTES, ttl_seconds: int = PARSE_CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str, str], Tuple[List[Dict[str, Any]], int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 결과. 없거나 만료되었으면 None (반환된 리스트는 수정하지 말 것)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[2] > self.ttl_seconds:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, data: List[Dict[str, Any]]) -> None:
+        size = len(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+        if size > self.max_bytes:
+            logger.info(f"Parse result too large to cache ({size} bytes)")
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, size, time.monotonic())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+parse_cache = ParseCache()
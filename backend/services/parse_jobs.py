@@ -0,0 +1,317 @@
+"""
+대용량 파일 파싱 작업 큐
+업로드는 임시 파일로 옮긴 뒤 작업 id만 바로 돌려주고, 파싱은 제한된 수의 작업 워커가 처리한다.
+클라이언트는 상태를 폴링하거나 진행 이벤트(SSE/NDJSON)를 구독해 결과를 받는다.
+
+- 동시 실행 수: PARSE_JOB_WORKERS (나머지는 대기열, 대기열 상한 PARSE_JOB_MAX_QUEUED)
+- Classic 파싱은 전용 스레드 풀에서 줄 단위 스트리밍으로 돌려 이벤트 루프와 일반 요청용 스레드 풀을 막지 않는다
+- 취소: 대기 중이면 바로, 실행 중이면 다음 스케줄/조각 경계에서 멈춘다
+- 결과 만료: 끝난 작업은 PARSE_JOB_RESULT_TTL_SECONDS 뒤 결과와 함께 지운다
+"""
+import os
+import asyncio
+import logging
+import math
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from parser import iter_parse_events, parse_llm_events, profile_parse
+from services.parse_cache import parse_cache, make_cache_key, hash_lines, hash_text
+
+logger = logging.getLogger(__name__)
+
+PARSE_JOB_WORKERS = int(os.getenv("PARSE_JOB_WORKERS", "2"))
+PARSE_JOB_MAX_QUEUED = int(os.getenv("PARSE_JOB_MAX_QUEUED", "100"))
+PARSE_JOB_RESULT_TTL_SECONDS = int(os.getenv("PARSE_JOB_RESULT_TTL_SECONDS", "3600"))
+PARSE_JOB_SPOOL_DIR = os.getenv("PARSE_JOB_SPOOL_DIR") or tempfile.gettempdir()
+
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+FINISHED_STATES = ("done", "failed", "cancelled")
+
+
+class ParseJobQueueFull(Exception):
+    """대기 중인 작업이 PARSE_JOB_MAX_QUEUED개를 넘음"""
+
+
+class _JobCancelled(Exception):
+    pass
+
+
+@dataclass
+class ParseJob:
+    id: str
+    engine: str
+    path: str
+    size: int
+    user_id: Optional[str] = None
+    filename: Optional[str] = None
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+    cache_hit: bool = False
+    degraded: bool = False
+    cancel_requested: threading.Event = field(default_factory=threading.Event, repr=False)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "engine": self.engine,
+            "filename": self.filename,
+            "size": self.size,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "error": self.error,
+            "cache": {"hit": self.cache_hit},
+            "degraded": self.degraded,
+        }
+        if self.started_at is not None:
+            data["elapsed_seconds"] = round((self.finished_at or time.time()) - self.started_at, 3)
+        if include_result and self.status == "done":
+            data["data"] = self.result
+        return data
+
+
+class ParseJobQueue:
+    """작업 id → ParseJob. 워커는 첫 submit 때 현재 이벤트 루프에서 시작한다."""
+
+    def __init__(self, workers: int = PARSE_JOB_WORKERS, max_queued: int = PARSE_JOB_MAX_QUEUED,
+                 result_ttl_seconds: int = PARSE_JOB_RESULT_TTL_SECONDS, spool_dir: str = PARSE_JOB_SPOOL_DIR):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.result_ttl_seconds = result_ttl_seconds
+        self.spool_dir = spool_dir
+        self._jobs: Dict[str, ParseJob] = {}
+        self._lock = threading.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.expired = 0
+
+    # --- 작업 등록 / 조회 ---
+
+    async def submit(self, source: BinaryIO, engine: str, user_id: Optional[str] = None,
+                     filename: Optional[str] = None) -> ParseJob:
+        """업로드 스트림을 임시 파일로 복사하고 작업을 대기열에 넣는다 (대기열이 가득 차면 ParseJobQueueFull)"""
+        self._ensure_started()
+        if self._queue.qsize() >= self.max_queued:
+            raise ParseJobQueueFull(f"Too many queued parse jobs ({self.max_queued})")
+
+        job_id = uuid.uuid4().hex
+        path = os.path.join(self.spool_dir, f"parse-job-{job_id}.txt")
+        size = await asyncio.to_thread(self._spool, source, path)
+        job = ParseJob(id=job_id, engine=engine, path=path, size=size, user_id=user_id, filename=filename)
+        with self._lock:
+            self._jobs[job_id] = job
+        self._queue.put_nowait(job)
+        logger.info(f"Parse job {job_id} queued ({engine}, {size} bytes)")
+        return job
+
+    def get(self, job_id: str) -> Optional[ParseJob]:
+        """작업 (없거나 만료되었으면 None)"""
+        self._expire()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, user_id: Optional[str] = None) -> List[ParseJob]:
+        self._expire()
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in jobs if user_id is None or job.user_id == user_id]
+
+    def cancel(self, job_id: str) -> Optional[ParseJob]:
+        """작업 취소 요청. 대기 중이면 바로 cancelled, 실행 중이면 다음 경계에서 멈춘다. 없으면 None"""
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return job
+        job.cancel_requested.set()
+        if job.status == "queued":
+            self._finish(job, "cancelled")
+        elif job.engine != "classic" and job.task is not None:
+            # LLM 작업은 호출 대기 중에 바로 취소 (Classic 스레드는 cancel_requested를 보고 다음 스케줄에서 멈춘다)
+            job.task.cancel()
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        self._expire()
+        with self._lock:
+            states = [job.status for job in self._jobs.values()]
+        return {
+            "workers": self.workers,
+            "max_queued": self.max_queued,
+            **{state: states.count(state) for state in JOB_STATES},
+            "completed_total": self.completed,
+            "failed_total": self.failed,
+            "cancelled_total": self.cancelled,
+            "expired_total": self.expired,
+        }
+
+    # --- 워커 ---
+
+    def _ensure_started(self) -> None:
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse-job")
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def shutdown(self) -> None:
+        """워커를 멈추고 남은 작업을 취소한다 (앱 종료 시)"""
+        self._stopping = True
+        for job in self.list():
+            if not job.finished:
+                job.cancel_requested.set()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        for job in self.list():
+            if not job.finished:
+                self._finish(job, "cancelled")
+        self._queue, self._executor, self._worker_tasks = None, None, []
+        self._stopping = False
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status != "queued":
+                    continue
+                job.status, job.started_at = "running", time.time()
+                job.task = asyncio.create_task(self._run(job))
+                try:
+                    result = await job.task
+                except (asyncio.CancelledError, _JobCancelled):
+                    if self._stopping or not job.cancel_requested.is_set():
+                        raise  # 워커 자체 종료
+                    self._finish(job, "cancelled")
+                except Exception as e:
+                    logger.error(f"Parse job {job.id} failed: {e}")
+                    self._finish(job, "failed", error=str(e))
+                else:
+                    self._finish(job, "done", result=result)
+                finally:
+                    job.task = None
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ParseJob) -> List[Dict[str, Any]]:
+        if job.engine == "classic":
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._run_classic, job)
+        return await self._run_llm(job)
+
+    def _run_classic(self, job: ParseJob) -> List[Dict[str, Any]]:
+        """작업 스레드: 임시 파일을 줄 단위로 읽어 파싱 (스케줄 경계마다 취소 확인)"""
+        with open(job.path, "r", encoding="utf-8") as stream:
+            key = make_cache_key(hash_lines(stream), job.engine)
+            cached = parse_cache.get(key)
+            if cached is not None:
+                job.cache_hit = True
+                return cached
+            stream.seek(0)
+            schedules: Dict[str, Dict[str, Any]] = {}
+            # 작업은 취소할 수 있으므로 시간 예산 없이 줄 길이 한도만 건다
+            for event in iter_parse_events(stream, classic_only=True, budget_seconds=math.inf):
+                if job.cancel_requested.is_set():
+                    raise _JobCancelled()
+                if event.event == "schedule":
+                    schedules[event.data["key"]] = event.data["schedule"]
+                else:
+                    job.progress = event.data
+        data = list(schedules.values())
+        parse_cache.put(key, data)
+        return data
+
+    async def _run_llm(self, job: ParseJob) -> List[Dict[str, Any]]:
+        """LLM / 하이브리드: 조각이 끝날 때마다 진행 상황 갱신 (스트리밍 파서와 같은 이벤트)"""
+        text = await asyncio.to_thread(self._read_text, job.path)
+        key = make_cache_key(hash_text(text), job.engine)
+        cached = parse_cache.get(key)
+        if cached is not None:
+            job.cache_hit = True
+            return cached
+        schedules: Dict[str, Dict[str, Any]] = {}
+        with profile_parse():
+            async for event in parse_llm_events(text, hybrid=(job.engine == "hybrid")):
+                if event.event == "schedule":
+                    schedules[event.data["key"]] = event.data["schedule"]
+                else:
+                    job.progress = event.data
+                    job.degraded = job.degraded or bool(event.data.get("degraded"))
+        data = list(schedules.values())
+        # LLM 장애로 Classic 결과를 대신 쓴(degraded) 결과는 캐시하지 않는다
+        if not job.degraded:
+            parse_cache.put(key, data)
+        return data
+
+    # --- 정리 ---
+
+    def _finish(self, job: ParseJob, status: str, result: Optional[List[Dict[str, Any]]] = None,
+                error: Optional[str] = None) -> None:
+        job.status, job.result, job.error = status, result, error
+        job.finished_at = time.time()
+        if status == "done":
+            self.completed += 1
+            logger.info(f"Parse job {job.id} done: {len(result)} schedules in {job.finished_at - job.started_at:.2f}s")
+        elif status == "failed":
+            self.failed += 1
+        else:
+            self.cancelled += 1
+            logger.info(f"Parse job {job.id} cancelled")
+        self._remove_spool(job)
+
+    def _expire(self) -> None:
+        """끝난 지 result_ttl_seconds가 지난 작업 제거"""
+        cutoff = time.time() - self.result_ttl_seconds
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+            self.expired += len(expired)
+
+    @staticmethod
+    def _spool(source: BinaryIO, path: str) -> int:
+        source.seek(0)
+        with open(path, "wb") as out:
+            shutil.copyfileobj(source, out, 1024 * 1024)
+            return out.tell()
+
+    @staticmethod
+    def _read_text(path: str) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    @staticmethod
+    def _remove_spool(job: ParseJob) -> None:
+        try:
+            os.remove(job.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove parse job spool file {job.path}: {e}")
+
+
+parse_jobs = ParseJobQueue()
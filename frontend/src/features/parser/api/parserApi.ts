@@ -1,4 +1,6 @@
 import { apiClient } from '@/lib/api/client'
+import { getUserId } from '@/lib/utils/userUtils'
+import type { Schedule } from '@/features/schedule/types/schedule'
 import type { ParsedScheduleData } from '../types/parser'
 
 export type ParserEngine = 'classic' | 'llm' | 'hybrid'
@@ -37,3 +39,54 @@ export async function parseFile(file: File, engine: ParserEngine = 'classic'): P
 
   return data
 }
+
+export interface ParseBatchItemResult {
+  index: number
+  engine: ParserEngine
+  success: boolean
+  data: ParsedScheduleData[]
+  error: string | null
+  elapsed_ms: number
+  cache_hit: boolean
+  degraded: boolean
+  duplicates: number
+}
+
+export interface ParseBatchResponse {
+  data: ParsedScheduleData[]
+  success: boolean
+  items?: ParseBatchItemResult[]
+  error?: string
+}
+
+export async function parseBatch(items: ParseTextRequest[]): Promise<ParseBatchResponse> {
+  const { data } = await apiClient.post<ParseBatchResponse>('/api/parse-batch', { items })
+
+  return data
+}
+
+export interface ParseAndImportSummary {
+  parsed: number
+  inserted: number
+  skipped: number
+  needs_review: number
+  priced_by_rule: number
+  created_tags: number
+}
+
+export interface ParseAndImportResponse {
+  data: Schedule[]
+  success: boolean
+  summary?: ParseAndImportSummary
+  skipped?: (ParsedScheduleData & { existing_id: string | null })[]
+  error?: string
+}
+
+export async function parseAndImport(text: string, engine: ParserEngine = 'hybrid'): Promise<ParseAndImportResponse> {
+  const { data } = await apiClient.post<ParseAndImportResponse>('/api/parse-and-import',
+    { text, engine },
+    { params: { user_id: getUserId() } }
+  )
+
+  return data
+}
@@ -52,8 +52,11 @@ export function ParserModal({ open, onOpenChange, existingSchedules }: ParserMod
     duplicates,
     error,
     parsingStep,
+    isImporting,
+    canImportParsedText,
     parseFromText,
     parseFromFile,
+    importParsedText,
     reset
   } = useParserEngine(existingSchedules)
 
@@ -260,6 +263,41 @@ export function ParserModal({ open, onOpenChange, existingSchedules }: ParserMod
     return { successCount, failCount, authError }
   }, [enabledCalendars, user, appleCredentials, calendarEventDuration])
 
+  // 추가된 스케줄들에 대한 캘린더 동기화 실행 및 결과 알림
+  const syncSchedulesToCalendars = useCallback(async (schedules: { date: string; time: string; location: string; couple: string; memo?: string }[]) => {
+    let totalSuccess = 0
+    let totalFail = 0
+    let hasAuthError = false
+
+    for (const schedule of schedules) {
+      try {
+        const { successCount, failCount, authError } = await syncScheduleToCalendars({
+          date: schedule.date,
+          time: schedule.time,
+          location: schedule.location,
+          couple: schedule.couple,
+          memo: schedule.memo
+        })
+        totalSuccess += successCount
+        totalFail += failCount
+        if (authError) hasAuthError = true
+      } catch (error) {
+        totalFail++
+      }
+    }
+
+    if (hasAuthError) {
+      toast.error('네이버 캘린더 연동이 필요합니다.\n설정에서 네이버 계정을 연동해주세요.')
+    } else {
+      if (totalSuccess > 0) {
+        toast.success(`${totalSuccess}건의 캘린더 동기화가 완료되었습니다`)
+      }
+      if (totalFail > 0) {
+        toast.error(`${totalFail}건의 캘린더 동기화에 실패했습니다`)
+      }
+    }
+  }, [syncScheduleToCalendars])
+
   // 중복 스케줄 업데이트 핸들러
   const handleUpdateDuplicates = useCallback(() => {
     if (!duplicates || duplicates.length === 0) return
@@ -382,7 +420,31 @@ export function ParserModal({ open, onOpenChange, existingSchedules }: ParserMod
       // 파싱 모드
       if (!parsedData || parsedData.length === 0) return
 
-      // ParsedScheduleData[]를 NewSchedule[]로 변환
+      // 붙여넣은 텍스트: 서버가 파싱 → 중복 확인 → 단가/태그 → 저장을 한 트랜잭션으로 처리
+      if (activeTab === 'text' && canImportParsedText) {
+        importParsedText().then(async (result) => {
+          const inserted = result.data
+          toast.success(`${inserted.length}개의 스케줄이 추가되었습니다`)
+          if (result.summary && result.summary.skipped > 0) {
+            toast.info(`${result.summary.skipped}개의 중복 스케줄은 건너뛰었습니다`)
+          }
+
+          // 캘린더 동기화
+          if (syncToCalendar) {
+            await syncSchedulesToCalendars(inserted)
+          }
+
+          onOpenChange(false)
+          // 리셋
+          setText('')
+          reset()
+        }, () => {
+          toast.error('스케줄 저장 중 오류가 발생했습니다')
+        })
+        return
+      }
+
+      // 파일: ParsedScheduleData[]를 NewSchedule[]로 변환
       const schedulesToAdd = convertParsedDataToSchedules(parsedData)
 
       batchAddSchedules.mutate(schedulesToAdd, {
@@ -391,37 +453,7 @@ export function ParserModal({ open, onOpenChange, existingSchedules }: ParserMod
 
           // 캘린더 동기화
           if (syncToCalendar) {
-            let totalSuccess = 0
-            let totalFail = 0
-            let hasAuthError = false
-
-            for (const schedule of schedulesToAdd) {
-              try {
-                const { successCount, failCount, authError } = await syncScheduleToCalendars({
-                  date: schedule.date,
-                  time: schedule.time,
-                  location: schedule.location,
-                  couple: schedule.couple,
-                  memo: schedule.memo
-                })
-                totalSuccess += successCount
-                totalFail += failCount
-                if (authError) hasAuthError = true
-              } catch (error) {
-                totalFail++
-              }
-            }
-
-            if (hasAuthError) {
-              toast.error('네이버 캘린더 연동이 필요합니다.\n설정에서 네이버 계정을 연동해주세요.')
-            } else {
-              if (totalSuccess > 0) {
-                toast.success(`${totalSuccess}건의 캘린더 동기화가 완료되었습니다`)
-              }
-              if (totalFail > 0) {
-                toast.error(`${totalFail}건의 캘린더 동기화에 실패했습니다`)
-              }
-            }
+            await syncSchedulesToCalendars(schedulesToAdd)
           }
 
           onOpenChange(false)
@@ -499,7 +531,7 @@ export function ParserModal({ open, onOpenChange, existingSchedules }: ParserMod
             disabled={
               activeTab === 'manual'
                 ? !manualForm.date || !manualForm.time || !manualForm.location || isParsing
-                : ((!parsedData || parsedData.length === 0) && (!duplicates || duplicates.length === 0)) || isParsing
+                : ((!parsedData || parsedData.length === 0) && (!duplicates || duplicates.length === 0)) || isParsing || isImporting
             }
             className="flex-1"
           >
@@ -1,10 +1,12 @@
-import { useState, useCallback } from 'react'
+import { useState, useCallback, useRef } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
 import { toast } from 'sonner'
 import type { Schedule } from '@/features/schedule/types/schedule'
 import type { ParsedScheduleData } from '../types/parser'
-import { parseText, parseFile } from '../api/parserApi'
+import { parseText, parseFile, parseAndImport } from '../api/parserApi'
+import type { ParseAndImportResponse } from '../api/parserApi'
 import { hasRequiredFields } from '../utils/validation'
-import { filterDuplicateSchedules, findDuplicateSchedule } from '../utils/duplicateCheck'
+import { buildDuplicateIndex, filterDuplicateSchedules, findDuplicateInIndex } from '../utils/duplicateCheck'
 
 export type ParserEngine = 'classic' | 'llm' | 'hybrid'
 export type ParsingStep = 'classic' | 'gpt' | null
@@ -20,8 +22,11 @@ interface UseParserEngineResult {
   duplicates: DuplicateScheduleInfo[] | null
   error: string | null
   parsingStep: ParsingStep
+  isImporting: boolean
+  canImportParsedText: boolean
   parseFromText: (text: string, engine: ParserEngine) => Promise<void>
   parseFromFile: (file: File, engine: ParserEngine) => Promise<void>
+  importParsedText: () => Promise<ParseAndImportResponse>
   reset: () => void
 }
 
@@ -36,6 +41,11 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
   const [duplicates, setDuplicates] = useState<DuplicateScheduleInfo[] | null>(null)
   const [error, setError] = useState<string | null>(null)
   const [parsingStep, setParsingStep] = useState<ParsingStep>(null)
+  const [isImporting, setIsImporting] = useState(false)
+  // 미리보기를 만든 텍스트와 실제로 결과를 낸 엔진 (가져오기 때 서버가 같은 파싱 결과 캐시를 쓴다)
+  const [parsedSource, setParsedSource] = useState<{ text: string; engine: ParserEngine } | null>(null)
+  const parseRequestRef = useRef(0)
+  const queryClient = useQueryClient()
 
   /**
    * 파싱 결과 처리 (중복 체크 포함)
@@ -48,8 +58,9 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
 
       // 중복 스케줄 정보 수집
       const duplicateInfos: DuplicateScheduleInfo[] = []
+      const duplicateIndex = buildDuplicateIndex(existingSchedules)
       result.data.forEach(parsed => {
-        const existingSchedule = findDuplicateSchedule(parsed, existingSchedules)
+        const existingSchedule = findDuplicateInIndex(parsed, duplicateIndex)
         if (existingSchedule) {
           duplicateInfos.push({ parsed, existing: existingSchedule })
         }
@@ -78,6 +89,7 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
   ) => {
     // 먼저 Classic 시도
     setParsingStep('classic')
+    let engine: 'classic' | 'llm' = 'classic'
     let result = await parseFn('classic')
 
     // Classic이 실패하거나 결과가 없거나 필수 필드가 누락되면 GPT-4로 재시도
@@ -88,17 +100,21 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
 
     if (needsGPT) {
       setParsingStep('gpt')
+      engine = 'llm'
       result = await parseFn('llm')
     }
 
     setParsingStep(null)
-    return result
+    return { result, engine }
   }, [])
 
   /**
    * 텍스트 파싱
    */
   const parseFromText = useCallback(async (text: string, engine: ParserEngine) => {
+    const request = ++parseRequestRef.current
+    setParsedSource(null)
+
     if (!text.trim()) {
       setParsedData(null)
       setError(null)
@@ -112,14 +128,20 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
 
     try {
       let result
+      let engineUsed: ParserEngine = engine
 
       if (engine === 'hybrid') {
-        result = await parseWithHybrid((engineType) => parseText(text, engineType))
+        const hybrid = await parseWithHybrid((engineType) => parseText(text, engineType))
+        result = hybrid.result
+        engineUsed = hybrid.engine
       } else {
         result = await parseText(text, engine)
       }
 
       handleParseResult(result)
+      if (result.success && request === parseRequestRef.current) {
+        setParsedSource({ text, engine: engineUsed })
+      }
     } catch (err) {
       setError(err instanceof Error ? err.message : '파싱 중 오류가 발생했습니다')
     } finally {
@@ -132,6 +154,8 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
    * 파일 파싱
    */
   const parseFromFile = useCallback(async (file: File, engine: ParserEngine) => {
+    parseRequestRef.current++
+    setParsedSource(null)
     setIsParsing(true)
     setError(null)
     setParsedData(null)
@@ -141,7 +165,7 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
       let result
 
       if (engine === 'hybrid') {
-        result = await parseWithHybrid((engineType) => parseFile(file, engineType))
+        result = (await parseWithHybrid((engineType) => parseFile(file, engineType))).result
       } else {
         result = await parseFile(file, engine)
       }
@@ -155,10 +179,39 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
     }
   }, [parseWithHybrid, handleParseResult])
 
+  /**
+   * 미리보기한 텍스트를 서버에서 가져오기 (/api/parse-and-import)
+   * 파싱 → 기존 스케줄과 중복 확인 → 단가/태그 → 저장을 한 트랜잭션으로 처리한다
+   */
+  const importParsedText = useCallback(async () => {
+    if (!parsedSource) {
+      throw new Error('가져올 파싱 결과가 없습니다')
+    }
+
+    setIsImporting(true)
+    try {
+      const result = await parseAndImport(parsedSource.text, parsedSource.engine)
+      if (!result.success) {
+        throw new Error(result.error || '스케줄 가져오기에 실패했습니다')
+      }
+
+      // Use setTimeout to avoid flushSync errors during rendering
+      setTimeout(() => {
+        queryClient.invalidateQueries({ queryKey: ['schedules'] })
+        queryClient.invalidateQueries({ queryKey: ['tags'], exact: false, refetchType: 'all' })
+      }, 0)
+      return result
+    } finally {
+      setIsImporting(false)
+    }
+  }, [parsedSource, queryClient])
+
   /**
    * 상태 초기화
    */
   const reset = useCallback(() => {
+    parseRequestRef.current++
+    setParsedSource(null)
     setParsedData(null)
     setDuplicates(null)
     setError(null)
@@ -171,8 +224,11 @@ export function useParserEngine(existingSchedules: Schedule[]): UseParserEngineR
     duplicates,
     error,
     parsingStep,
+    isImporting,
+    canImportParsedText: parsedSource !== null,
     parseFromText,
     parseFromFile,
+    importParsedText,
     reset
   }
 }
@@ -1,6 +1,44 @@
 import type { Schedule } from '@/features/schedule/types/schedule'
 import type { ParsedScheduleData } from '../types/parser'
 
+type DuplicateKeySource = Pick<ParsedScheduleData, 'date' | 'time' | 'location'>
+
+/**
+ * 중복 판단 키 (날짜 + 시간 + 장소)
+ */
+function duplicateKey(schedule: DuplicateKeySource): string {
+  return `${schedule.date}\u0000${schedule.time}\u0000${schedule.location}`
+}
+
+/**
+ * 기존 스케줄을 중복 판단 키로 색인 (파싱 결과 여러 개를 확인할 때 한 번만 만든다)
+ * @param existingSchedules - 기존 스케줄 목록
+ * @returns 키 → 처음 나온 기존 스케줄
+ */
+export function buildDuplicateIndex(existingSchedules: Schedule[]): Map<string, Schedule> {
+  const index = new Map<string, Schedule>()
+  for (const existing of existingSchedules) {
+    const key = duplicateKey(existing)
+    if (!index.has(key)) {
+      index.set(key, existing)
+    }
+  }
+  return index
+}
+
+/**
+ * 색인에서 파싱된 스케줄과 중복되는 기존 스케줄 찾기
+ * @param parsed - 파싱된 스케줄
+ * @param index - buildDuplicateIndex 결과
+ * @returns 중복되는 스케줄 또는 null
+ */
+export function findDuplicateInIndex(
+  parsed: ParsedScheduleData,
+  index: Map<string, Schedule>
+): Schedule | null {
+  return index.get(duplicateKey(parsed)) || null
+}
+
 /**
  * 파싱된 스케줄과 중복되는 기존 스케줄 찾기
  * @param parsed - 파싱된 스케줄
@@ -28,8 +66,9 @@ export function filterDuplicateSchedules(
   parsedData: ParsedScheduleData[],
   existingSchedules: Schedule[]
 ): { unique: ParsedScheduleData[]; duplicateCount: number } {
+  const index = buildDuplicateIndex(existingSchedules)
   const unique = parsedData.filter(parsed =>
-    !findDuplicateSchedule(parsed, existingSchedules)
+    !findDuplicateInIndex(parsed, index)
   )
 
   const duplicateCount = parsedData.length - unique.length